@@ -0,0 +1,289 @@
+"""Measure the overhead of every validation decorator and of ValidateFields, and print the results as JSON
+
+Every case is compared with an undecorated call and, where one exists, with the equivalent native pydantic
+constraint, on the pass and fail paths, for short and long inputs, and for synchronous and asynchronous wrappers.
+
+Usage: python -m benchmarks.bench_decorators [--filter size] [--repeat 5] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import timeit
+import pydantic
+from pydantic_validation_decorator import (
+    ValidateFields,
+    Network,
+    NotBlank,
+    Pattern,
+    Size,
+    Xss,
+    FieldValidationError,
+)
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, ValidationError
+from typing import Callable, Dict, List, Optional
+from typing_extensions import Annotated
+
+
+SHORT_TEXT = 'insistence'
+LONG_TEXT = 'insistence ' * 10000
+
+
+class BenchUserModel(BaseModel):
+    user_name: Optional[str] = None
+    nick_name: Optional[str] = None
+    email: Optional[str] = None
+    age: Optional[int] = None
+
+    def get_user_name_plain(self):
+        return self.user_name
+
+    @NotBlank(field_name='user_name')
+    def get_user_name_not_blank(self):
+        return self.user_name
+
+    @Size(field_name='user_name', max_length=20)
+    def get_user_name_size(self):
+        return self.user_name
+
+    @Pattern(field_name='user_name', regexp='^[a-z ]+$')
+    def get_user_name_pattern(self):
+        return self.user_name
+
+    @Xss(field_name='nick_name')
+    def get_nick_name_xss(self):
+        return self.nick_name
+
+    @Network(field_name='email', field_type='EmailStr')
+    def get_email_network(self):
+        return self.email
+
+    @Size(field_name='age', gt=0, le=150)
+    def get_age_size(self):
+        return self.age
+
+    @NotBlank(field_name='user_name')
+    @Size(field_name='user_name', max_length=20)
+    @Pattern(field_name='user_name', regexp='^[a-z ]+$')
+    @Xss(field_name='user_name')
+    def get_user_name_stacked(self):
+        return self.user_name
+
+    @Size(field_name='age', gt=0, le=150)
+    @NotBlank(field_name='user_name')
+    @Size(field_name='user_name', max_length=20)
+    @Pattern(field_name='user_name', regexp='^[a-z ]+$')
+    @Xss(field_name='nick_name')
+    async def get_user_async(self):
+        return self.user_name
+
+    def validate_fields(self):
+        self.get_age_size()
+        self.get_user_name_stacked()
+        self.get_nick_name_xss()
+
+    async def validate_fields_async(self):
+        await self.get_user_async()
+
+
+def handle_user(bench_user: BenchUserModel):
+    return bench_user
+
+
+@ValidateFields(validate_model='bench_user')
+def validate_user(bench_user: BenchUserModel):
+    return bench_user
+
+
+# The compiled modes check the validation decorators of the getters that validate_fields calls
+BENCH_USER_GETTERS = ('get_age_size', 'get_user_name_stacked', 'get_nick_name_xss')
+
+
+@ValidateFields(validate_model='bench_user', validate_function=BENCH_USER_GETTERS, compiled=True)
+def validate_user_compiled(bench_user: BenchUserModel):
+    return bench_user
+
+
+@ValidateFields(validate_model='bench_user', validate_function=BENCH_USER_GETTERS, native=True)
+def validate_user_native(bench_user: BenchUserModel):
+    return bench_user
+
+
+async def handle_user_async(bench_user: BenchUserModel):
+    return bench_user
+
+
+@ValidateFields(validate_model='bench_user', validate_function='validate_fields_async')
+async def validate_user_async(bench_user: BenchUserModel):
+    return bench_user
+
+
+NATIVE_ADAPTERS = {
+    'not_blank': TypeAdapter(Annotated[str, Field(min_length=1)]),
+    'size_str': TypeAdapter(Annotated[str, Field(max_length=20)]),
+    'pattern': TypeAdapter(Annotated[str, Field(pattern='^[a-z ]+$')]),
+    'network': TypeAdapter(EmailStr),
+    'size_int': TypeAdapter(Annotated[int, Field(gt=0, le=150)]),
+    'stacked': TypeAdapter(Annotated[str, Field(min_length=1, max_length=20, pattern='^[a-z ]+$')]),
+}
+
+
+def expect_error(function: Callable, *args) -> Callable[[], None]:
+    """Wrap a call that is expected to fail so that the fail path can be timed"""
+
+    def call():
+        try:
+            function(*args)
+        except (FieldValidationError, ValidationError):
+            return None
+        raise AssertionError(f'{function} did not fail')
+
+    return call
+
+
+def expect_async_error(function: Callable, *args) -> Callable:
+    """Asynchronous counterpart of expect_error"""
+
+    async def call():
+        try:
+            await function(*args)
+        except FieldValidationError:
+            return None
+        raise AssertionError(f'{function} did not fail')
+
+    return call
+
+
+def build_cases() -> Dict[str, Callable[[], None]]:
+    """Build the synchronous cases, named group.variant.path[.input]"""
+    cases = {}
+    for length, text in (('short', SHORT_TEXT), ('long', LONG_TEXT)):
+        model = BenchUserModel(user_name=text, nick_name=text, age=18)
+        blank_model = BenchUserModel(user_name='', nick_name=f'<b>{text}</b>', email=text, age=0)
+        cases[f'baseline.undecorated.pass.{length}'] = model.get_user_name_plain
+        cases[f'not_blank.decorator.pass.{length}'] = model.get_user_name_not_blank
+        cases[f'not_blank.pydantic.pass.{length}'] = lambda text=text: NATIVE_ADAPTERS['not_blank'].validate_python(
+            text
+        )
+        cases[f'size_str.decorator.{"pass" if len(text) <= 20 else "fail"}.{length}'] = (
+            model.get_user_name_size if len(text) <= 20 else expect_error(model.get_user_name_size)
+        )
+        cases[f'size_str.pydantic.{"pass" if len(text) <= 20 else "fail"}.{length}'] = (
+            (lambda text=text: NATIVE_ADAPTERS['size_str'].validate_python(text))
+            if len(text) <= 20
+            else expect_error(NATIVE_ADAPTERS['size_str'].validate_python, text)
+        )
+        cases[f'pattern.decorator.pass.{length}'] = model.get_user_name_pattern
+        cases[f'pattern.pydantic.pass.{length}'] = lambda text=text: NATIVE_ADAPTERS['pattern'].validate_python(text)
+        cases[f'xss.decorator.pass.{length}'] = model.get_nick_name_xss
+        cases[f'xss.decorator.fail.{length}'] = expect_error(blank_model.get_nick_name_xss)
+        cases[f'network.decorator.fail.{length}'] = expect_error(blank_model.get_email_network)
+        cases[f'network.pydantic.fail.{length}'] = expect_error(NATIVE_ADAPTERS['network'].validate_python, text)
+        cases[f'stacked.decorator.{"pass" if len(text) <= 20 else "fail"}.{length}'] = (
+            model.get_user_name_stacked if len(text) <= 20 else expect_error(model.get_user_name_stacked)
+        )
+    model = BenchUserModel(user_name=SHORT_TEXT, nick_name=SHORT_TEXT, email='insistence@example.com', age=18)
+    invalid_model = BenchUserModel(user_name='', nick_name=SHORT_TEXT, email='insistence@example.com', age=0)
+    blank_model = BenchUserModel(user_name='', age=18)
+    cases['not_blank.decorator.fail.short'] = expect_error(blank_model.get_user_name_not_blank)
+    cases['not_blank.pydantic.fail.short'] = expect_error(NATIVE_ADAPTERS['not_blank'].validate_python, '')
+    cases['pattern.decorator.fail.short'] = expect_error(blank_model.get_user_name_pattern)
+    cases['pattern.pydantic.fail.short'] = expect_error(NATIVE_ADAPTERS['pattern'].validate_python, 'Insistence')
+    cases['network.decorator.pass.short'] = model.get_email_network
+    cases['network.pydantic.pass.short'] = lambda: NATIVE_ADAPTERS['network'].validate_python(model.email)
+    cases['size_int.decorator.pass'] = model.get_age_size
+    cases['size_int.decorator.fail'] = expect_error(invalid_model.get_age_size)
+    cases['size_int.pydantic.pass'] = lambda: NATIVE_ADAPTERS['size_int'].validate_python(18)
+    cases['size_int.pydantic.fail'] = expect_error(NATIVE_ADAPTERS['size_int'].validate_python, 0)
+    cases['stacked.decorator.fail.short'] = expect_error(blank_model.get_user_name_stacked)
+    cases['stacked.pydantic.pass.short'] = lambda: NATIVE_ADAPTERS['stacked'].validate_python(SHORT_TEXT)
+    cases['stacked.pydantic.fail.short'] = expect_error(NATIVE_ADAPTERS['stacked'].validate_python, '')
+    model = BenchUserModel(user_name=SHORT_TEXT, nick_name=SHORT_TEXT, age=18)
+    invalid_model = BenchUserModel(user_name='', nick_name=SHORT_TEXT, age=0)
+    cases['validate_fields.undecorated.pass'] = lambda: handle_user(model)
+    for variant, function in (
+        ('plain', validate_user),
+        ('compiled', validate_user_compiled),
+        ('native', validate_user_native),
+    ):
+        cases[f'validate_fields.{variant}.pass'] = lambda function=function: function(bench_user=model)
+        cases[f'validate_fields.{variant}.fail'] = expect_error(
+            lambda function=function: function(bench_user=invalid_model)
+        )
+    return cases
+
+
+def build_async_cases() -> Dict[str, Callable]:
+    """Build the asynchronous cases, each is a coroutine function timed inside one running event loop"""
+    model = BenchUserModel(user_name=SHORT_TEXT, nick_name=SHORT_TEXT, age=18)
+    invalid_model = BenchUserModel(user_name=SHORT_TEXT, nick_name=SHORT_TEXT, age=0)
+    return {
+        'async.undecorated.pass': lambda: handle_user_async(model),
+        'async.decorator.pass': model.get_user_async,
+        'async.decorator.fail': expect_async_error(invalid_model.get_user_async),
+        'async.validate_fields.pass': lambda: validate_user_async(bench_user=model),
+        'async.validate_fields.fail': expect_async_error(lambda: validate_user_async(bench_user=invalid_model)),
+    }
+
+
+def measure(function: Callable[[], None], repeat: int) -> Dict[str, float]:
+    """Time a synchronous case with timeit, the number of calls per run is chosen by Timer.autorange"""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return {'number': number, 'ns_per_call': round(best / number * 1e9, 1)}
+
+
+def measure_async(function: Callable, repeat: int) -> Dict[str, float]:
+    """Time an asynchronous case, the calls are awaited one after another inside the same event loop"""
+
+    async def run(number: int) -> float:
+        start = timeit.default_timer()
+        for _ in range(number):
+            await function()
+        return timeit.default_timer() - start
+
+    loop = asyncio.new_event_loop()
+    try:
+        number = 1
+        while loop.run_until_complete(run(number)) < 0.2:
+            number *= 10
+        best = min(loop.run_until_complete(run(number)) for _ in range(repeat))
+    finally:
+        loop.close()
+    return {'number': number, 'ns_per_call': round(best / number * 1e9, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--filter', default=None, help='Only run the cases whose name contains this text.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', default=None, help='Write the JSON to this file instead of the standard output.')
+    args = parser.parse_args()
+
+    results: List[Dict] = []
+    for name, function in build_cases().items():
+        if args.filter is None or args.filter in name:
+            results.append({'name': name, **measure(function, args.repeat)})
+    for name, function in build_async_cases().items():
+        if args.filter is None or args.filter in name:
+            results.append({'name': name, **measure_async(function, args.repeat)})
+    report = json.dumps(
+        {
+            'python': platform.python_version(),
+            'pydantic': pydantic.VERSION,
+            'repeat': args.repeat,
+            'results': results,
+        },
+        indent=2,
+    )
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, 'w') as file:
+            file.write(report)
+
+
+if __name__ == '__main__':
+    main()
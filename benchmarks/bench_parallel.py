@@ -0,0 +1,122 @@
+"""Compare in-process validate_many with validate_many_parallel and report where the process pool starts to win
+
+Usage: python -m benchmarks.bench_parallel [--sizes 1000 10000 100000] [--chunk-size 5000] [--max-workers 4]
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pydantic_validation_decorator import (
+    Network,
+    NotBlank,
+    Pattern,
+    Size,
+    Xss,
+    validate_many,
+    validate_many_parallel,
+)
+from pydantic import BaseModel
+from typing import Optional
+
+
+class BenchOrderModel(BaseModel):
+    order_no: Optional[str] = None
+    customer_email: Optional[str] = None
+    callback_url: Optional[str] = None
+    quantity: Optional[int] = None
+    remark: Optional[str] = None
+
+    @NotBlank(field_name='order_no')
+    @Pattern(field_name='order_no', regexp='SO[0-9]{12}', match_mode='fullmatch')
+    def get_order_no(self):
+        return self.order_no
+
+    @Network(field_name='customer_email', field_type='EmailStr')
+    def get_customer_email(self):
+        return self.customer_email
+
+    @Network(field_name='callback_url', field_type='HttpUrl')
+    def get_callback_url(self):
+        return self.callback_url
+
+    @Size(field_name='quantity', gt=0, le=1000)
+    def get_quantity(self):
+        return self.quantity
+
+    @Xss(field_name='remark')
+    @Size(field_name='remark', max_length=500)
+    def get_remark(self):
+        return self.remark
+
+
+def build_models(size: int):
+    return [
+        BenchOrderModel(
+            order_no=f'SO{index:012d}',
+            customer_email=f'customer{index}@example.com',
+            callback_url=f'https://example.com/orders/{index}/callback',
+            quantity=index % 1200,
+            remark='Leave at the front door, please.' if index % 97 else '<b>urgent</b>',
+        )
+        for index in range(size)
+    ]
+
+
+def measure(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000, 100000])
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    results = []
+    with ProcessPoolExecutor(max_workers=args.max_workers) as executor:
+        # Start the worker processes before measuring, pool startup is paid once per service.
+        list(executor.map(len, [[]] * args.max_workers))
+        for size in args.sizes:
+            models = build_models(size)
+            in_process = measure(lambda: validate_many(models), args.repeat)
+            parallel = measure(
+                lambda: validate_many_parallel(models, chunk_size=args.chunk_size, executor=executor),
+                args.repeat,
+            )
+            results.append(
+                {
+                    'size': size,
+                    'in_process_seconds': round(in_process, 6),
+                    'parallel_seconds': round(parallel, 6),
+                    'speedup': round(in_process / parallel, 3),
+                }
+            )
+    crossover = None
+    for result in reversed(results):
+        if result['speedup'] <= 1:
+            break
+        crossover = result['size']
+    print(
+        json.dumps(
+            {
+                'chunk_size': args.chunk_size,
+                'max_workers': args.max_workers,
+                'results': results,
+                'crossover_size': crossover,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,63 @@
-from .validation import ValidateFields
-from .network import Network
+from typing import TYPE_CHECKING, Any
+from .validation import ValidateFields, validation_scope
+from .compiler import compile_validators
 from .not_blank import NotBlank
 from .pattern import Pattern
 from .size import Size
-from .xss import Xss
-from .exceptions import FieldValidationError
+from .xss import Xss, XssSweep
+from .exceptions import FieldValidationError, FieldValidationErrors
+from .cache import VerdictCache, verdict_cache
+from .instrumentation import ValidationEvent, ValidationStats, add_hook, remove_hook
+from .warmup import warmup
+
+if TYPE_CHECKING:
+    from .batch import validate_many, validate_many_parallel
+    from .network import Network
+
+
+# Attributes imported on first access, so that programs that do not use them do not pay for importing the pydantic
+# network types or the process pool machinery
+_LAZY_ATTRIBUTES = {
+    'validate_many': 'batch',
+    'validate_many_parallel': 'batch',
+    'Network': 'network',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from importlib import import_module
+
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 __all__ = [
     'ValidateFields',
+    'validation_scope',
+    'compile_validators',
+    'validate_many',
+    'validate_many_parallel',
     'Network',
     'NotBlank',
     'Pattern',
     'Size',
     'Xss',
+    'XssSweep',
     'FieldValidationError',
+    'FieldValidationErrors',
+    'VerdictCache',
+    'verdict_cache',
+    'ValidationEvent',
+    'ValidationStats',
+    'add_hook',
+    'remove_hook',
+    'warmup',
 ]
@@ -0,0 +1,34 @@
+"""Command line tools of pydantic-validation-decorator
+
+Usage: python -m pydantic_validation_decorator profile package.module:Model corpus.jsonl [--function validate_fields]
+"""
+
+import argparse
+import json
+from .profiler import format_report, load_model_class, profile_corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pydantic_validation_decorator')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    profile_parser = subparsers.add_parser(
+        'profile',
+        help='Replay a JSONL payload corpus through the validators of a model and report the time spent per rule.',
+    )
+    profile_parser.add_argument('model', help='The pydantic model class, such as package.module:Model.')
+    profile_parser.add_argument('corpus', help='A file with one JSON payload per line.')
+    profile_parser.add_argument('--function', default='validate_fields', help='The validation function of the model.')
+    profile_parser.add_argument('--top', type=int, default=10, help='Number of slowest payloads to report.')
+    profile_parser.add_argument('--json', action='store_true', help='Print the report as JSON.')
+    args = parser.parse_args(argv)
+
+    model_class = load_model_class(args.model)
+    report = profile_corpus(model_class, args.corpus, validate_function=args.function, top=args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report, args.corpus))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,439 @@
+import copy
+import inspect
+from asyncio import iscoroutinefunction
+from functools import wraps
+from time import perf_counter_ns
+from io import IOBase
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Type
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import core_schema
+from .cache import verdict_cache
+from .exceptions import FieldValidationError
+from .instrumentation import ValidationEvent, emit, hooks
+
+
+MISSING = object()
+
+
+class BaseFieldValidator:
+    """
+    Base Field Validation Decorator
+    """
+
+    field_name: Optional[str]
+    message: Optional[str]
+    cache: Optional[bool] = None
+    # Whether iterator field values are checked with `_check_replace`, which returns a replacement of the iterator
+    # that has to be stored back in the model.
+    replaces_iterators: bool = False
+    # Whether the validator is expanded with `_expand` into the validators it stands for in a given model class,
+    # before it runs against an instance of that class.
+    expands_fields: bool = False
+
+    def _check(self, field_value: Any) -> Optional[str]:
+        """Check the field value against the rule of the validator
+
+        Args:
+            field_value (Any): Field value that need to be validate.
+
+        Returns:
+            Optional[str]: Prompt message for validation failure, None if the field value is valid.
+        """
+        raise NotImplementedError
+
+    def _check_replace(self, field_value: Iterator) -> Tuple[Optional[str], Iterator]:
+        """Check an iterator field value against the rule of the validator, and get the iterator to keep in its place
+
+        Validators that consume iterators while checking them set `replaces_iterators` and return a replacement that
+        yields the same items as the original iterator did.
+
+        Args:
+            field_value (Iterator): Iterator field value that need to be validate.
+
+        Returns:
+            Tuple[Optional[str], Iterator]: Prompt message for validation failure, None if the field value is valid, and the iterator to keep.
+        """
+        return self._check(field_value), field_value
+
+    def _expand(self, model_class: Type[BaseModel]) -> Tuple['BaseFieldValidator', ...]:
+        """Get the validators that the validator stands for in a pydantic model class, used when `expands_fields` is set
+
+        Args:
+            model_class (Type[BaseModel]): The pydantic model class.
+
+        Returns:
+            Tuple[BaseFieldValidator, ...]: Validators bound to fields of the model class.
+        """
+        return (self,)
+
+    def _warmup(self, model_class: Type[BaseModel]):
+        """Build ahead of time what the validator otherwise builds the first time it checks a model, see `warmup`
+
+        Args:
+            model_class (Type[BaseModel]): The pydantic model class the validator belongs to.
+        """
+        return None
+
+    def _fuse(self, validator: 'BaseFieldValidator') -> Optional['BaseFieldValidator']:
+        """Fuse the validator with the validator that runs right after it into one validator, see `fuse_field_validators`
+
+        Args:
+            validator (BaseFieldValidator): The validator that runs right after this one.
+
+        Returns:
+            Optional[BaseFieldValidator]: A validator that gives the same first failure as running both, None if they cannot be fused.
+        """
+        return None
+
+    def _check_many(self, field_values: Sequence[Any]) -> List[Optional[str]]:
+        """Check a column of field values against the rule of the validator, missing values are skipped
+
+        Args:
+            field_values (Sequence[Any]): Field values that need to be validate.
+
+        Returns:
+            List[Optional[str]]: Prompt message for validation failure of each field value, None if it is valid.
+        """
+        check = self._check
+        return [None if field_value is MISSING else check(field_value) for field_value in field_values]
+
+    def _native_schema(self, field_type: Any, nullable: bool) -> Optional[core_schema.CoreSchema]:
+        """Lower the rule of the validator to a pydantic-core schema, used by the native compiled checker
+
+        The schema may reject values that the rule accepts, such rejections are confirmed by `_check`, but it must
+        never accept a value that the rule rejects.
+
+        Args:
+            field_type (Any): The annotation of the field, without Optional.
+            nullable (bool): Whether the field is annotated as Optional.
+
+        Returns:
+            Optional[core_schema.CoreSchema]: The schema of the rule, None if the rule cannot be lowered.
+        """
+        return None
+
+    def _cache_config(self) -> Hashable:
+        """Get the configuration that identifies the verdicts of the validator in the verdict cache
+
+        Returns:
+            Hashable: Validator configuration.
+        """
+        return (self.__class__.__name__,)
+
+    def _verdict(self, field_value: Any, check: Callable[[Any], bool]) -> bool:
+        """Compute the verdict of a field value, through the verdict cache when it is enabled for the validator
+
+        Args:
+            field_value (Any): Field value that need to be validate.
+            check (Callable[[Any], bool]): Function that computes the verdict of the field value.
+
+        Returns:
+            bool: Whether the field value is valid.
+        """
+        if self.cache or (self.cache is None and verdict_cache.enabled):
+            return verdict_cache.verdict(self._cache_config(), field_value, check)
+        return check(field_value)
+
+    def _error(self, model_name: Optional[str], field_value: Any, message: str) -> FieldValidationError:
+        """Build the exception raised for an invalid field value
+
+        Args:
+            model_name (Optional[str]): Model name with error.
+            field_value (Any): Field value with errors.
+            message (str): Prompt message for validation failure.
+
+        Returns:
+            FieldValidationError: Field validation exception.
+        """
+        return FieldValidationError(
+            model_name=model_name,
+            field_name=self.field_name,
+            field_value=field_value,
+            validator=self.__class__.__name__,
+            message=message,
+        )
+
+    def check(self, field_value: Any) -> Any:
+        """Validate a field value on its own, outside of any pydantic model
+
+        Args:
+            field_value (Any): Field value that need to be validate.
+
+        Raises:
+            FieldValidationError: The field value failed validation.
+
+        Returns:
+            Any: The field value.
+        """
+        if self.replaces_iterators and is_iterator(field_value):
+            message, field_value = self._check_replace(field_value)
+        else:
+            message = self._check(field_value)
+        if message is not None:
+            raise self._error(None, field_value, message)
+        return field_value
+
+    def _bind(self, field_name: str) -> 'BaseFieldValidator':
+        """Get a copy of the validator bound to a field name, the copy is created once per field name
+
+        Args:
+            field_name (str): Field name that need to be validate.
+
+        Returns:
+            BaseFieldValidator: Validator whose field name and default prompt messages refer to field_name.
+        """
+        bound_validators: Dict[str, BaseFieldValidator] = self.__dict__.setdefault('_bound_validators', {})
+        bound_validator = bound_validators.get(field_name)
+        if bound_validator is None:
+            bound_validator = copy.copy(self)
+            bound_validator.__dict__.pop('_bound_validators', None)
+            parameters = inspect.signature(self.__class__.__init__).parameters
+            bound_validator.__init__(
+                **{name: getattr(self, name) for name in parameters if name not in ('self', 'field_name')},
+                field_name=field_name,
+            )
+            bound_validators[field_name] = bound_validator
+        return bound_validator
+
+    def _validate_annotated(self, field_value: Any, info: core_schema.ValidationInfo) -> Any:
+        """Validate a field value while pydantic constructs the model, used when the validator annotates a field
+
+        Args:
+            field_value (Any): Field value validated by pydantic.
+            info (core_schema.ValidationInfo): Validation information provided by pydantic.
+
+        Raises:
+            FieldValidationError: The field value failed validation.
+
+        Returns:
+            Any: The field value.
+        """
+        check = self._check_replace if self.replaces_iterators and is_iterator(field_value) else None
+        if hooks:
+            start = perf_counter_ns()
+            if check is None:
+                message = self._check(field_value)
+            else:
+                message, field_value = check(field_value)
+            emit(
+                ValidationEvent(
+                    'rule',
+                    info.config.get('title') if info.config else None,
+                    self.field_name if self.field_name is not None else info.field_name,
+                    self.__class__.__name__,
+                    message is None,
+                    perf_counter_ns() - start,
+                    field_value,
+                )
+            )
+        elif check is None:
+            message = self._check(field_value)
+        else:
+            message, field_value = check(field_value)
+        if message is None:
+            return field_value
+        validator = self
+        if self.field_name is None and info.field_name is not None:
+            validator = self._bind(info.field_name)
+            if check is None:
+                message = validator._check(field_value)
+            else:
+                message, field_value = validator._check_replace(field_value)
+        raise validator._error(info.config.get('title') if info.config else None, field_value, message)
+
+    def __get_pydantic_core_schema__(self, source_type: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # Used as `Annotated[str, Pattern(regexp=...)]`, the validator runs after pydantic validated the field, in
+        # the same pass that constructs the model, and a failure is raised as FieldValidationError.
+        return core_schema.with_info_after_validator_function(self._validate_annotated, handler(source_type))
+
+    def __call__(self, func):
+        if self.field_name is None and not self.expands_fields:
+            # Only validators annotating a field take the field name from pydantic
+            raise ValueError(
+                f'The field_name of {self.__class__.__name__} cannot be empty when it decorates a function.'
+            )
+        # Stacked validation decorators are merged into a single wrapper around the original function,
+        # so the validators of a getter run in one frame in the order the decorators are written.
+        field_validators = (self,) + getattr(func, '__field_validators__', ())
+        # functools.wraps copies __dict__, so a foreign decorator between two validation decorators carries the
+        # attributes of the wrapper below it, only a wrapper that marks itself is merged and unwrapped
+        if getattr(func, '_field_validator_wrapper', None) is func:
+            validators = (self,) + func._merged_field_validators
+            func = func.__wrapped__
+        else:
+            validators = (self,)
+        validate = validate_model_fields
+        # Hooks receive the events of the validators as written, fused validators are an internal detail
+        fused_validators = fuse_field_validators(validators)
+        if any(validator.expands_fields for validator in validators):
+            expanded_validators: Dict[Tuple[Type[BaseModel], bool], Tuple[BaseFieldValidator, ...]] = {}
+
+            def validate(validate_model: BaseModel, validators: Sequence[BaseFieldValidator]):
+                model_class = validate_model.__class__
+                fused = validators is fused_validators
+                model_validators = expanded_validators.get((model_class, fused))
+                if model_validators is None:
+                    model_validators = expand_field_validators(model_class, validators)
+                    if fused:
+                        model_validators = fuse_field_validators(model_validators)
+                    expanded_validators[(model_class, fused)] = model_validators
+                validate_model_fields(validate_model, model_validators)
+
+        is_async = iscoroutinefunction(func)
+        if is_async:
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                validate_model = args[0]
+                if isinstance(validate_model, BaseModel):
+                    validate(validate_model, validators if hooks else fused_validators)
+                return await func(*args, **kwargs)
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                validate_model = args[0]
+                if isinstance(validate_model, BaseModel):
+                    validate(validate_model, validators if hooks else fused_validators)
+                return func(*args, **kwargs)
+
+        wrapper.__field_validators__ = field_validators
+        wrapper._merged_field_validators = validators
+        wrapper._field_validator_wrapper = wrapper
+        return wrapper
+
+
+def expand_field_validators(
+    model_class: Type[BaseModel], validators: Sequence[BaseFieldValidator]
+) -> Tuple[BaseFieldValidator, ...]:
+    """Replace the validators that set `expands_fields` by the validators they stand for in a pydantic model class
+
+    Args:
+        model_class (Type[BaseModel]): The pydantic model class.
+        validators (Sequence[BaseFieldValidator]): Validators in the order they run.
+
+    Returns:
+        Tuple[BaseFieldValidator, ...]: Validators bound to fields of the model class, in the order they run.
+    """
+    return tuple(
+        expanded_validator
+        for validator in validators
+        for expanded_validator in (validator._expand(model_class) if validator.expands_fields else (validator,))
+    )
+
+
+def fuse_field_validators(validators: Sequence[BaseFieldValidator]) -> Tuple[BaseFieldValidator, ...]:
+    """Fuse the validators that run one after another and can be checked together, such as the Pattern rules of a field
+
+    Only adjacent validators are fused, so the first failure and its message are the same as without fusing.
+
+    Args:
+        validators (Sequence[BaseFieldValidator]): Validators in the order they run.
+
+    Returns:
+        Tuple[BaseFieldValidator, ...]: Validators in the order they run.
+    """
+    fused_validators: List[BaseFieldValidator] = []
+    for validator in validators:
+        fused_validator = fused_validators[-1]._fuse(validator) if fused_validators else None
+        if fused_validator is None:
+            fused_validators.append(validator)
+        else:
+            fused_validators[-1] = fused_validator
+    return tuple(fused_validators)
+
+
+def is_iterator(field_value: Any) -> bool:
+    """Check whether a field value is an iterator that checking its length would consume, such as a generator
+
+    Args:
+        field_value (Any): Field value.
+
+    Returns:
+        bool: Whether the field value is an iterator without a length, files are not considered iterators.
+    """
+    # hasattr on the value is much cheaper than isinstance with collections.abc.Iterator
+    return (
+        hasattr(field_value, '__next__') and not hasattr(field_value, '__len__') and not isinstance(field_value, IOBase)
+    )
+
+
+def check_and_replace(
+    validate_model: BaseModel, validator: BaseFieldValidator, field_value: Iterator
+) -> Tuple[Optional[str], Iterator]:
+    """Check an iterator field value with a validator that replaces iterators, and store the replacement in the model
+
+    Args:
+        validate_model (BaseModel): The pydantic model that the field value belongs to.
+        validator (BaseFieldValidator): Validator whose `replaces_iterators` is set.
+        field_value (Iterator): Iterator field value that need to be validate.
+
+    Returns:
+        Tuple[Optional[str], Iterator]: Prompt message for validation failure, None if the field value is valid, and the iterator now stored in the model.
+    """
+    message, replacement = validator._check_replace(field_value)
+    if replacement is not field_value:
+        # Written to the instance dict, so that neither validate_assignment nor frozen models get in the way
+        if validator.field_name in validate_model.__dict__:
+            validate_model.__dict__[validator.field_name] = replacement
+        else:
+            setattr(validate_model, validator.field_name, replacement)
+    return message, replacement
+
+
+def validate_model_fields(validate_model: BaseModel, validators: Sequence[BaseFieldValidator]):
+    """Run the validators against the fields of a pydantic model in order
+
+    Args:
+        validate_model (BaseModel): The pydantic model that needs to be validated.
+        validators (Sequence[BaseFieldValidator]): Validators that need to be run.
+
+    Raises:
+        FieldValidationError: The first field that failed validation.
+    """
+    if hooks:
+        return validate_model_fields_instrumented(validate_model, validators)
+    for validator in validators:
+        field_value = getattr(validate_model, validator.field_name, MISSING)
+        if field_value is not MISSING:
+            if validator.replaces_iterators and hasattr(field_value, '__next__') and is_iterator(field_value):
+                message, field_value = check_and_replace(validate_model, validator, field_value)
+            else:
+                message = validator._check(field_value)
+            if message is not None:
+                raise validator._error(validate_model.__class__.__name__, field_value, message)
+
+
+def validate_model_fields_instrumented(validate_model: BaseModel, validators: Sequence[BaseFieldValidator]):
+    """Run the validators against the fields of a pydantic model in order, and emit an event for each evaluation
+
+    Args:
+        validate_model (BaseModel): The pydantic model that needs to be validated.
+        validators (Sequence[BaseFieldValidator]): Validators that need to be run.
+
+    Raises:
+        FieldValidationError: The first field that failed validation.
+    """
+    model_name = validate_model.__class__.__name__
+    for validator in validators:
+        field_value = getattr(validate_model, validator.field_name, MISSING)
+        if field_value is not MISSING:
+            start = perf_counter_ns()
+            if validator.replaces_iterators and hasattr(field_value, '__next__') and is_iterator(field_value):
+                message, field_value = check_and_replace(validate_model, validator, field_value)
+            else:
+                message = validator._check(field_value)
+            emit(
+                ValidationEvent(
+                    'rule',
+                    model_name,
+                    validator.field_name,
+                    validator.__class__.__name__,
+                    message is None,
+                    perf_counter_ns() - start,
+                    field_value,
+                )
+            )
+            if message is not None:
+                raise validator._error(model_name, field_value, message)
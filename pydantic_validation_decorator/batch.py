@@ -0,0 +1,174 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+from pydantic import BaseModel
+from .base import MISSING, BaseFieldValidator, expand_field_validators
+from .compiler import get_field_validators
+from .exceptions import FieldValidationError
+
+
+def _check_rules(rules: Optional[Sequence[BaseFieldValidator]]):
+    """Check that every rule names the field it validates
+
+    Args:
+        rules (Optional[Sequence[BaseFieldValidator]]): Validation decorator instances to check.
+
+    Raises:
+        ValueError: A rule that does not expand into the fields of the model class has no field_name.
+    """
+    for rule in rules or ():
+        if rule.field_name is None and not rule.expands_fields:
+            raise ValueError(f'The field_name of {rule.__class__.__name__} cannot be empty in batch validation.')
+
+
+def validate_many(
+    models: Sequence[BaseModel],
+    rules: Optional[Sequence[BaseFieldValidator]] = None,
+    validate_function: Optional[str] = None,
+    all_errors: bool = False,
+) -> List[List[FieldValidationError]]:
+    """Validate a batch of pydantic models column by column
+
+    The values of each field are read once for all the models, and each rule checks a whole column at a time.
+
+    Args:
+        models (Sequence[BaseModel]): The pydantic models that need to be validated.
+        rules (Optional[Sequence[BaseFieldValidator]], optional): Validation decorator instances to check, such as `[Size(field_name='age', gt=0)]`. Defaults to None, which uses the validation decorators declared in the model class, see `get_field_validators`.
+        validate_function (Optional[str], optional): The name of a decorated function defined in the pydantic model, used when rules is None. Defaults to None.
+        all_errors (bool, optional): Whether to collect the errors of all rules for each model instead of only the first one. Defaults to False.
+
+    Raises:
+        ValueError: A rule has no field_name. || The validate_function does not carry validation decorators.
+
+    Returns:
+        List[List[FieldValidationError]]: The errors of each model, in the order of models. An empty list means the model is valid.
+    """
+    _check_rules(rules)
+    results: List[List[FieldValidationError]] = [[] for _ in models]
+    model_classes = set(map(type, models))
+    if len(model_classes) == 1:
+        groups: Dict[Type[BaseModel], List[int]] = {model_classes.pop(): list(range(len(models)))}
+    else:
+        groups = {}
+        for index, model in enumerate(models):
+            groups.setdefault(type(model), []).append(index)
+    for model_class, indices in groups.items():
+        model_name = model_class.__name__
+        if rules is not None:
+            validators = expand_field_validators(model_class, rules)
+        else:
+            validators = get_field_validators(model_class, validate_function)
+        rows = [models[index] for index in indices]
+        columns: Dict[str, list] = {}
+        positions = list(range(len(indices)))
+        for validator in validators:
+            column = columns.get(validator.field_name)
+            if column is None:
+                column = columns[validator.field_name] = _read_column(rows, validator.field_name)
+            if len(positions) == len(indices):
+                field_values = column
+            else:
+                field_values = [column[position] for position in positions]
+            messages = validator._check_many(field_values)
+            failures = [offset for offset, message in enumerate(messages) if message is not None]
+            for offset in failures:
+                position = positions[offset]
+                results[indices[position]].append(validator._error(model_name, column[position], messages[offset]))
+            if failures and not all_errors:
+                failed_positions = {positions[offset] for offset in failures}
+                positions = [position for position in positions if position not in failed_positions]
+                if not positions:
+                    break
+    return results
+
+
+def _read_column(rows: Sequence[BaseModel], field_name: str) -> list:
+    """Read the values of a field from all the rows, missing values are MISSING
+
+    Args:
+        rows (Sequence[BaseModel]): The pydantic models.
+        field_name (str): Field name that need to be read.
+
+    Returns:
+        list: The values of the field.
+    """
+    try:
+        return list(map(attrgetter(field_name), rows))
+    except AttributeError:
+        return [getattr(row, field_name, MISSING) for row in rows]
+
+
+def validate_many_parallel(
+    models: Sequence[Union[BaseModel, Dict[str, Any]]],
+    rules: Optional[Sequence[BaseFieldValidator]] = None,
+    validate_function: Optional[str] = None,
+    all_errors: bool = False,
+    model_class: Optional[Type[BaseModel]] = None,
+    chunk_size: int = 1000,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[List[FieldValidationError]]:
+    """Validate a batch of pydantic models in a pool of processes
+
+    The models are split into chunks of chunk_size, each chunk is validated with `validate_many` in a worker process
+    and the results are merged back in the order of models. The models, the rules and the model class must be
+    picklable, so they need to be defined at module level.
+
+    Args:
+        models (Sequence[Union[BaseModel, Dict[str, Any]]]): The pydantic models that need to be validated, or their raw dicts when model_class is set.
+        rules (Optional[Sequence[BaseFieldValidator]], optional): Validation decorator instances to check. Defaults to None, which uses the validation decorators declared in the model class.
+        validate_function (Optional[str], optional): The name of a decorated function defined in the pydantic model, used when rules is None. Defaults to None.
+        all_errors (bool, optional): Whether to collect the errors of all rules for each model instead of only the first one. Defaults to False.
+        model_class (Optional[Type[BaseModel]], optional): The pydantic model class used to build the models from raw dicts in the worker processes. Defaults to None.
+        chunk_size (int, optional): Number of models validated by a worker process at a time. Defaults to 1000.
+        max_workers (Optional[int], optional): Number of worker processes when executor is not set. Defaults to None, which uses the number of processors.
+        executor (Optional[Executor], optional): An existing executor to run the chunks on, it is not shut down. Defaults to None, which creates a ProcessPoolExecutor.
+
+    Raises:
+        ValueError: The chunk_size must be greater than 0. || A rule has no field_name.
+
+    Returns:
+        List[List[FieldValidationError]]: The errors of each model, in the order of models. An empty list means the model is valid.
+    """
+    if chunk_size <= 0:
+        raise ValueError('The chunk_size must be greater than 0.')
+    _check_rules(rules)
+    chunks = [models[start : start + chunk_size] for start in range(0, len(models), chunk_size)]
+    validate_chunk = partial(
+        _validate_chunk,
+        rules=rules,
+        validate_function=validate_function,
+        all_errors=all_errors,
+        model_class=model_class,
+    )
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=max_workers) as process_executor:
+            chunk_results = list(process_executor.map(validate_chunk, chunks))
+    else:
+        chunk_results = list(executor.map(validate_chunk, chunks))
+    return [errors for chunk_result in chunk_results for errors in chunk_result]
+
+
+def _validate_chunk(
+    models: Sequence[Union[BaseModel, Dict[str, Any]]],
+    rules: Optional[Sequence[BaseFieldValidator]],
+    validate_function: Optional[str],
+    all_errors: bool,
+    model_class: Optional[Type[BaseModel]],
+) -> List[List[FieldValidationError]]:
+    """Validate a chunk of models in a worker process
+
+    Args:
+        models (Sequence[Union[BaseModel, Dict[str, Any]]]): The pydantic models, or their raw dicts when model_class is set.
+        rules (Optional[Sequence[BaseFieldValidator]]): Validation decorator instances to check.
+        validate_function (Optional[str]): The name of a decorated function defined in the pydantic model.
+        all_errors (bool): Whether to collect the errors of all rules for each model.
+        model_class (Optional[Type[BaseModel]]): The pydantic model class used to build the models from raw dicts.
+
+    Returns:
+        List[List[FieldValidationError]]: The errors of each model in the chunk.
+    """
+    if model_class is not None:
+        models = [model_class.model_validate(model) for model in models]
+    return validate_many(models, rules=rules, validate_function=validate_function, all_errors=all_errors)
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class VerdictCache:
+    """
+    Bounded LRU Cache of Field Validation Verdicts
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_size: int = 4096,
+        max_key_length: int = 1024,
+    ):
+        """Bounded LRU Cache of Field Validation Verdicts
+
+        Args:
+            enabled (bool, optional): Whether validators that do not set cache use the cache. Defaults to False.
+            max_size (int, optional): Maximum number of cached verdicts, the least recently used verdict is evicted first. Defaults to 4096.
+            max_key_length (int, optional): Values of str or bytes longer than max_key_length are never cached. Defaults to 1024.
+        """
+        self.enabled = enabled
+        self.max_size = max_size
+        self.max_key_length = max_key_length
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._verdicts = OrderedDict()
+        self._lock = Lock()
+
+    def configure(
+        self,
+        enabled: Optional[bool] = None,
+        max_size: Optional[int] = None,
+        max_key_length: Optional[int] = None,
+    ):
+        """Change the settings of the cache, settings that are None are left unchanged
+
+        Args:
+            enabled (Optional[bool], optional): Whether validators that do not set cache use the cache. Defaults to None.
+            max_size (Optional[int], optional): Maximum number of cached verdicts. Defaults to None.
+            max_key_length (Optional[int], optional): Values of str or bytes longer than max_key_length are never cached. Defaults to None.
+        """
+        with self._lock:
+            if enabled is not None:
+                self.enabled = enabled
+            if max_size is not None:
+                self.max_size = max_size
+                while len(self._verdicts) > self.max_size:
+                    self._verdicts.popitem(last=False)
+                    self.evictions += 1
+            if max_key_length is not None:
+                self.max_key_length = max_key_length
+
+    def verdict(self, config: Hashable, field_value: Any, check: Callable[[Any], bool]) -> bool:
+        """Get the verdict of a field value from the cache, computing and caching it on a miss
+
+        Args:
+            config (Hashable): The configuration of the validator, validators with the same configuration share verdicts.
+            field_value (Any): Field value that need to be validate.
+            check (Callable[[Any], bool]): Function that computes the verdict of the field value.
+
+        Returns:
+            bool: Whether the field value is valid.
+        """
+        if isinstance(field_value, (str, bytes)):
+            if len(field_value) > self.max_key_length:
+                return check(field_value)
+        elif not isinstance(field_value, (int, float)):
+            return check(field_value)
+        key = (config, type(field_value), field_value)
+        with self._lock:
+            verdict = self._verdicts.get(key)
+            if verdict is not None:
+                self._verdicts.move_to_end(key)
+                self.hits += 1
+                return verdict
+            self.misses += 1
+        verdict = check(field_value)
+        with self._lock:
+            self._verdicts[key] = verdict
+            if len(self._verdicts) > self.max_size:
+                self._verdicts.popitem(last=False)
+                self.evictions += 1
+        return verdict
+
+    def clear(self):
+        """Remove all cached verdicts and reset the counters"""
+        with self._lock:
+            self._verdicts.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get the counters of the cache
+
+        Returns:
+            Dict[str, int]: Number of hits, misses, evictions and cached verdicts.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._verdicts),
+            }
+
+
+verdict_cache = VerdictCache()
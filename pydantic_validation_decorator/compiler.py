@@ -0,0 +1,457 @@
+import inspect
+import types
+import weakref
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Type, Union, get_args, get_origin
+from uuid import UUID
+from pydantic import BaseModel
+from pydantic_core import SchemaValidator, core_schema
+from .base import (
+    MISSING,
+    BaseFieldValidator,
+    check_and_replace,
+    expand_field_validators,
+    fuse_field_validators,
+    is_iterator,
+    validate_model_fields_instrumented,
+)
+from .instrumentation import hooks
+
+
+_COMPILED_VALIDATORS: Dict[Tuple[Type[BaseModel], Optional[str], bool], Callable[[BaseModel], None]] = {}
+_ADAPTIVE_CHECKERS: Dict[Tuple[Type[BaseModel], Optional[str], bool], 'AdaptiveChecker'] = {}
+_INCREMENTAL_CHECKERS: Dict[Tuple[Type[BaseModel], Optional[str]], 'IncrementalChecker'] = {}
+# Types whose values cannot change in place, an unchanged value of these types is the same object
+_IMMUTABLE_TYPES = frozenset(
+    (str, bytes, int, float, bool, complex, type(None), Decimal, date, datetime, time, timedelta, UUID)
+)
+# Origins of Optional annotations, X | None has its own origin since Python 3.10
+_UNION_TYPES = (Union, getattr(types, 'UnionType', Union))
+
+
+def _rule_key(validator: BaseFieldValidator) -> Hashable:
+    """Get a key that is equal for validators of the same class and configuration, which check the same rule
+
+    Args:
+        validator (BaseFieldValidator): The validator.
+
+    Returns:
+        Hashable: The class of the validator and the values of its parameters, the identity of the validator when a parameter value is not hashable.
+    """
+    parameters = inspect.signature(validator.__class__.__init__).parameters
+    key = (
+        validator.__class__,
+        tuple((name, getattr(validator, name, MISSING)) for name in parameters if name != 'self'),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return id(validator)
+    return key
+
+
+def unique_field_validators(validators: Sequence[BaseFieldValidator]) -> Tuple[BaseFieldValidator, ...]:
+    """Remove the validators that repeat the rule of an earlier validator, such as a rule shared by several getters
+
+    A repeated rule gives the same verdict and message as its first occurrence, so the first failure is unchanged.
+
+    Args:
+        validators (Sequence[BaseFieldValidator]): Validators in the order they run.
+
+    Returns:
+        Tuple[BaseFieldValidator, ...]: Validators in the order they run, each rule once.
+    """
+    rule_keys = set()
+    unique_validators = []
+    for validator in validators:
+        rule_key = _rule_key(validator)
+        if rule_key not in rule_keys:
+            rule_keys.add(rule_key)
+            unique_validators.append(validator)
+    return tuple(unique_validators)
+
+
+def get_field_validators(
+    model_class: Type[BaseModel],
+    validate_function: Optional[str] = None,
+) -> Tuple[BaseFieldValidator, ...]:
+    """Collect the validation decorators attached to a pydantic model class
+
+    Args:
+        model_class (Type[BaseModel]): The pydantic model class.
+        validate_function (Optional[str], optional): The name of a function defined in the pydantic model and decorated with validation decorators, only those are collected. Defaults to None, which collects the validation decorators of every method of the model in definition order.
+
+    Raises:
+        ValueError: The validate_function does not carry validation decorators.
+
+    Returns:
+        Tuple[BaseFieldValidator, ...]: Validators in the order they run, each rule once, validators that set `expands_fields` are replaced by the validators they stand for in the model class.
+    """
+    if validate_function is not None:
+        validators = getattr(getattr(model_class, validate_function, None), '__field_validators__', None)
+        if validators is None:
+            # The body of a plain validation function is not run, so the rules it checks cannot be known
+            raise ValueError(
+                f'The function {validate_function}() of {model_class.__name__} does not carry validation decorators, '
+                'decorate it with the validation decorators to check.'
+            )
+        return unique_field_validators(expand_field_validators(model_class, validators))
+    methods = {}
+    for klass in reversed(model_class.__mro__):
+        for name, attr in vars(klass).items():
+            validators = getattr(attr, '__field_validators__', None)
+            if validators is not None:
+                methods[name] = validators
+    return unique_field_validators(
+        expand_field_validators(model_class, [validator for validators in methods.values() for validator in validators])
+    )
+
+
+def compile_validators(
+    model_class: Type[BaseModel],
+    validate_function: Optional[str] = None,
+    native: bool = False,
+) -> Callable[[BaseModel], None]:
+    """Get the compiled checker of a pydantic model class, the checker is generated once and cached per class
+
+    Args:
+        model_class (Type[BaseModel]): The pydantic model class.
+        validate_function (Optional[str], optional): The name of a decorated function defined in the pydantic model, see `get_field_validators`. Defaults to None.
+        native (bool, optional): Whether to lower the validators that allow it to pydantic-core constraints checked in a single native call, see `_build_native_checker`. Defaults to False.
+
+    Returns:
+        Callable[[BaseModel], None]: A function that validates an instance of the model and raises FieldValidationError on the first failure.
+    """
+    key = (model_class, validate_function, native)
+    checker = _COMPILED_VALIDATORS.get(key)
+    if checker is None:
+        validators = get_field_validators(model_class, validate_function)
+        if native:
+            checker = _build_native_checker(model_class, validators)
+        else:
+            checker = _build_checker(model_class, validators)
+        _COMPILED_VALIDATORS[key] = checker
+    return checker
+
+
+def _build_checker(
+    model_class: Type[BaseModel],
+    validators: Tuple[BaseFieldValidator, ...],
+) -> Callable[[BaseModel], None]:
+    """Generate a straight-line checker that reads each field once and runs all the validators inline
+
+    Adjacent validators that can be checked together, such as the Pattern rules of a field, are fused first, see
+    `fuse_field_validators`.
+
+    Args:
+        model_class (Type[BaseModel]): The pydantic model class.
+        validators (Tuple[BaseFieldValidator, ...]): Validators in the order they run.
+
+    Returns:
+        Callable[[BaseModel], None]: The generated checker.
+    """
+    namespace = {
+        'MISSING': MISSING,
+        'model_name': model_class.__name__,
+        'hooks': hooks,
+        # The instrumented path runs the validators unfused, so that each Pattern rule emits its own event
+        'validators': validators,
+        'validate_model_fields_instrumented': validate_model_fields_instrumented,
+        'check_and_replace': check_and_replace,
+        'is_iterator': is_iterator,
+    }
+    field_variables = {}
+    lines = [
+        'def checker(validate_model):',
+        '    if hooks:',
+        '        return validate_model_fields_instrumented(validate_model, validators)',
+    ]
+    validators = fuse_field_validators(validators)
+    for validator in validators:
+        if validator.field_name not in field_variables:
+            variable = f'value_{len(field_variables)}'
+            field_variables[validator.field_name] = variable
+            lines.append(f'    {variable} = getattr(validate_model, {validator.field_name!r}, MISSING)')
+    for index, validator in enumerate(validators):
+        variable = field_variables[validator.field_name]
+        namespace[f'validator_{index}'] = validator
+        namespace[f'check_{index}'] = validator._check
+        lines.append(f'    if {variable} is not MISSING:')
+        if validator.replaces_iterators:
+            lines.append(f"        if hasattr({variable}, '__next__') and is_iterator({variable}):")
+            lines.append(
+                f'            message, {variable} = check_and_replace(validate_model, validator_{index}, {variable})'
+            )
+            lines.append('        else:')
+            lines.append(f'            message = check_{index}({variable})')
+        else:
+            lines.append(f'        message = check_{index}({variable})')
+        lines.append('        if message is not None:')
+        lines.append(f'            raise validator_{index}._error(model_name, {variable}, message)')
+    lines.append('    return None')
+    exec(compile('\n'.join(lines), f'<validators of {model_class.__qualname__}>', 'exec'), namespace)
+    return namespace['checker']
+
+
+def _split_optional(annotation: Any) -> Tuple[Any, bool]:
+    """Split an Optional annotation into the annotated type and whether it is nullable
+
+    Args:
+        annotation (Any): The annotation of a field.
+
+    Returns:
+        Tuple[Any, bool]: The annotation without Optional and whether the annotation was Optional.
+    """
+    if get_origin(annotation) in _UNION_TYPES:
+        args = tuple(arg for arg in get_args(annotation) if arg is not type(None))
+        if len(args) == 1 and len(get_args(annotation)) == 2:
+            return args[0], True
+    return annotation, False
+
+
+def _build_native_checker(
+    model_class: Type[BaseModel],
+    validators: Tuple[BaseFieldValidator, ...],
+) -> Callable[[BaseModel], None]:
+    """Generate a checker that lowers the validators of model fields to pydantic-core constraints
+
+    The lowered validators are checked in one call of a pydantic-core schema validator. The validators that cannot be lowered run in Python once the native check passed. When the native
+    check fails, the whole model is checked again in Python, so a rejection is confirmed by the rule itself and the
+    first error and its message are the same as in the compiled checker.
+
+    Args:
+        model_class (Type[BaseModel]): The pydantic model class.
+        validators (Tuple[BaseFieldValidator, ...]): Validators in the order they run.
+
+    Returns:
+        Callable[[BaseModel], None]: The generated checker.
+    """
+    field_schemas: Dict[str, List[core_schema.CoreSchema]] = {}
+    python_validators = []
+    for validator in validators:
+        schema = None
+        field_info = model_class.model_fields.get(validator.field_name)
+        if field_info is not None:
+            schema = validator._native_schema(*_split_optional(field_info.annotation))
+        if schema is None:
+            python_validators.append(validator)
+        else:
+            field_schemas.setdefault(validator.field_name, []).append(schema)
+    python_checker = _build_checker(model_class, tuple(python_validators))
+    if not field_schemas:
+        return python_checker
+    # The lowered validators of a field are chained under the name of the field, so the instance dict of the model
+    # is checked as is, fields missing from it are skipped like in the compiled checker
+    fields = {
+        field_name: core_schema.typed_dict_field(
+            schemas[0] if len(schemas) == 1 else core_schema.chain_schema(schemas), required=False
+        )
+        for field_name, schemas in field_schemas.items()
+    }
+    isinstance_python = SchemaValidator(core_schema.typed_dict_schema(fields)).isinstance_python
+    full_checker = _build_checker(model_class, validators)
+
+    def checker(validate_model: BaseModel):
+        if hooks:
+            return full_checker(validate_model)
+        if isinstance_python(validate_model.__dict__):
+            return python_checker(validate_model)
+        return full_checker(validate_model)
+
+    return checker
+
+
+class AdaptiveChecker:
+    """
+    Adaptive Validation Checker
+    """
+
+    def __init__(
+        self,
+        model_class: Type[BaseModel],
+        validators: Tuple[BaseFieldValidator, ...],
+        deterministic: bool = True,
+        reorder_interval: int = 256,
+    ):
+        """Checker that tracks the cost and failure rate of every validator and periodically reorders the validators,
+        so that cheap validators that fail often run first
+
+        Args:
+            model_class (Type[BaseModel]): The pydantic model class.
+            validators (Tuple[BaseFieldValidator, ...]): Validators in the order they are declared.
+            deterministic (bool, optional): Whether to report the same first error as the declared order. When a validator fails, the validators declared before it that have not run yet are run in declared order. Defaults to True.
+            reorder_interval (int, optional): Number of checks between two reorderings. Defaults to 256.
+        """
+        self.model_name = model_class.__name__
+        self.validators = validators
+        self.deterministic = deterministic
+        self.reorder_interval = reorder_interval
+        self.order: List[int] = list(range(len(validators)))
+        self.costs = [0] * len(validators)
+        self.calls = [0] * len(validators)
+        self.failures = [0] * len(validators)
+        self._checks = 0
+
+    def _run(self, index: int, validate_model: BaseModel, field_value: Any) -> Tuple[Optional[str], Any]:
+        validator = self.validators[index]
+        start = perf_counter_ns()
+        if validator.replaces_iterators and is_iterator(field_value):
+            message, field_value = check_and_replace(validate_model, validator, field_value)
+        else:
+            message = validator._check(field_value)
+        self.costs[index] += perf_counter_ns() - start
+        self.calls[index] += 1
+        if message is not None:
+            self.failures[index] += 1
+        return message, field_value
+
+    def _reorder(self):
+        """Sort the validators by expected cost per rejection, the mean cost divided by the failure rate"""
+        scores = []
+        for index in range(len(self.validators)):
+            calls = self.calls[index]
+            if calls == 0:
+                scores.append(0.0)
+            else:
+                scores.append((self.costs[index] / calls) / max(self.failures[index] / calls, 0.001))
+        self.order = sorted(range(len(self.validators)), key=lambda index: (scores[index], index))
+
+    def __call__(self, validate_model: BaseModel):
+        if hooks:
+            return validate_model_fields_instrumented(validate_model, self.validators)
+        self._checks += 1
+        if self._checks % self.reorder_interval == 0:
+            self._reorder()
+        order = self.order
+        field_values = {}
+        for position, index in enumerate(order):
+            validator = self.validators[index]
+            field_value = field_values.get(validator.field_name, MISSING)
+            if field_value is MISSING:
+                field_value = field_values[validator.field_name] = getattr(
+                    validate_model, validator.field_name, MISSING
+                )
+                if field_value is MISSING:
+                    continue
+            message, field_value = self._run(index, validate_model, field_value)
+            field_values[validator.field_name] = field_value
+            if message is not None:
+                if self.deterministic:
+                    passed = set(order[:position])
+                    for earlier in range(index):
+                        if earlier in passed:
+                            continue
+                        earlier_validator = self.validators[earlier]
+                        earlier_value = getattr(validate_model, earlier_validator.field_name, MISSING)
+                        if earlier_value is MISSING:
+                            continue
+                        earlier_message, earlier_value = self._run(earlier, validate_model, earlier_value)
+                        if earlier_message is not None:
+                            raise earlier_validator._error(self.model_name, earlier_value, earlier_message)
+                raise validator._error(self.model_name, field_value, message)
+        return None
+
+
+def get_adaptive_checker(
+    model_class: Type[BaseModel],
+    validate_function: Optional[str] = None,
+    deterministic: bool = True,
+) -> AdaptiveChecker:
+    """Get the adaptive checker of a pydantic model class, the checker is created once and cached per class
+
+    Args:
+        model_class (Type[BaseModel]): The pydantic model class.
+        validate_function (Optional[str], optional): The name of a decorated function defined in the pydantic model, see `get_field_validators`. Defaults to None.
+        deterministic (bool, optional): Whether to report the same first error as the declared order. Defaults to True.
+
+    Returns:
+        AdaptiveChecker: The adaptive checker of the pydantic model class.
+    """
+    key = (model_class, validate_function, deterministic)
+    checker = _ADAPTIVE_CHECKERS.get(key)
+    if checker is None:
+        checker = AdaptiveChecker(model_class, get_field_validators(model_class, validate_function), deterministic)
+        _ADAPTIVE_CHECKERS[key] = checker
+    return checker
+
+
+class IncrementalChecker:
+    """
+    Incremental Validation Checker
+    """
+
+    def __init__(self, model_class: Type[BaseModel], validators: Tuple[BaseFieldValidator, ...]):
+        """Checker that remembers, for each model instance, the field values that passed each validator, and on the
+        next check of the same instance only runs the validators whose field value changed
+
+        Values of immutable types such as str and int are fingerprinted by identity, so a field assigned since the last
+        check is checked again even if the new value is equal. Values of other types, such as lists and nested models,
+        can change in place and are always checked again.
+
+        Args:
+            model_class (Type[BaseModel]): The pydantic model class.
+            validators (Tuple[BaseFieldValidator, ...]): Validators in the order they run.
+        """
+        self.model_name = model_class.__name__
+        self.validators = fuse_field_validators(validators)
+        # Unfused validators for the instrumented path, one event per declared rule
+        self._unfused_validators = validators
+        # Models are not hashable, so the passed values are keyed by the id of the instance, the entry is removed by
+        # the weak reference callback when the instance is garbage collected
+        self._passed_values: Dict[int, Tuple[weakref.ref, List[Any]]] = {}
+
+    def _forget(self, key: int, reference: weakref.ref):
+        entry = self._passed_values.get(key)
+        if entry is not None and entry[0] is reference:
+            del self._passed_values[key]
+
+    def __call__(self, validate_model: BaseModel):
+        if hooks:
+            return validate_model_fields_instrumented(validate_model, self._unfused_validators)
+        key = id(validate_model)
+        entry = self._passed_values.get(key)
+        if entry is None or entry[0]() is not validate_model:
+            entry = self._passed_values[key] = (
+                weakref.ref(validate_model, lambda reference: self._forget(key, reference)),
+                [MISSING] * len(self.validators),
+            )
+        passed_values = entry[1]
+        for index, validator in enumerate(self.validators):
+            field_value = getattr(validate_model, validator.field_name, MISSING)
+            if field_value is MISSING:
+                continue
+            if field_value is passed_values[index] and type(field_value) in _IMMUTABLE_TYPES:
+                continue
+            if validator.replaces_iterators and hasattr(field_value, '__next__') and is_iterator(field_value):
+                message, field_value = check_and_replace(validate_model, validator, field_value)
+            else:
+                message = validator._check(field_value)
+            if message is not None:
+                passed_values[index] = MISSING
+                raise validator._error(self.model_name, field_value, message)
+            passed_values[index] = field_value if type(field_value) in _IMMUTABLE_TYPES else MISSING
+        return None
+
+
+def get_incremental_checker(
+    model_class: Type[BaseModel],
+    validate_function: Optional[str] = None,
+) -> IncrementalChecker:
+    """Get the incremental checker of a pydantic model class, the checker is created once and cached per class
+
+    Args:
+        model_class (Type[BaseModel]): The pydantic model class.
+        validate_function (Optional[str], optional): The name of a decorated function defined in the pydantic model, see `get_field_validators`. Defaults to None.
+
+    Returns:
+        IncrementalChecker: The incremental checker of the pydantic model class.
+    """
+    key = (model_class, validate_function)
+    checker = _INCREMENTAL_CHECKERS.get(key)
+    if checker is None:
+        checker = _INCREMENTAL_CHECKERS[key] = IncrementalChecker(
+            model_class, get_field_validators(model_class, validate_function)
+        )
+    return checker
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List, Optional
 from warnings import warn
 
 
@@ -7,6 +7,12 @@ class FieldValidationError(Exception):
     Custom Field Validation Exception FieldValidationError
     """
 
+    # Field values of str or bytes longer than max_field_value_length are stored truncated to that length.
+    max_field_value_length: Optional[int] = None
+    # Whether ValidateFields keeps the traceback and context of the error, dropping them releases the frames of the
+    # validation functions, and the models and field values they reference, as soon as the error is handled.
+    keep_traceback: bool = True
+
     def __init__(
         self,
         model_name: str = None,
@@ -24,12 +30,56 @@ class FieldValidationError(Exception):
             validator (str, optional): Validation decorator with errors. Defaults to None.
             message (str, optional): Prompt message for validation failure. Defaults to None.
         """
+        max_field_value_length = self.max_field_value_length
+        if (
+            max_field_value_length is not None
+            and isinstance(field_value, (str, bytes))
+            and len(field_value) > max_field_value_length
+        ):
+            field_value = field_value[:max_field_value_length]
         self.model_name = model_name
         self.field_name = field_name
         self.field_value = field_value
         self.validator = validator
         self.message = message
 
+    def _strip_traceback(self) -> 'FieldValidationError':
+        """Drop the traceback and context of the error
+
+        Returns:
+            FieldValidationError: The error itself.
+        """
+        self.__context__ = None
+        self.__suppress_context__ = True
+        return self.with_traceback(None)
+
+
+class FieldValidationErrors(FieldValidationError):
+    """
+    Custom Multiple Field Validation Exception FieldValidationErrors
+    """
+
+    def __init__(self, errors: List[FieldValidationError] = None):
+        """Custom Multiple Field Validation Exception FieldValidationErrors, the attributes of the first error are
+        copied so that it can be handled like a single FieldValidationError
+
+        Args:
+            errors (List[FieldValidationError], optional): All the field validation errors. Defaults to None.
+        """
+        errors = errors if errors else []
+        first_error = errors[0] if errors else FieldValidationError()
+        super().__init__(
+            model_name=first_error.model_name,
+            field_name=first_error.field_name,
+            field_value=first_error.field_value,
+            validator=first_error.validator,
+            message=first_error.message,
+        )
+        if not self.keep_traceback:
+            for error in errors:
+                error._strip_traceback()
+        self.errors = errors
+
 
 class FunctionTypeError(Exception):
     """
@@ -0,0 +1,135 @@
+import logging
+from threading import Lock
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+logger = logging.getLogger('pydantic_validation_decorator')
+
+
+class ValidationEvent(NamedTuple):
+    """
+    Validation Instrumentation Event
+    """
+
+    # 'rule' for the evaluation of a validation decorator, 'validate_fields' for an invocation of ValidateFields.
+    kind: str
+    model_name: Optional[str]
+    # The validated field, None for 'validate_fields' events.
+    field_name: Optional[str]
+    # The validation decorator class name, or the name of the decorated function for 'validate_fields' events.
+    validator: str
+    passed: bool
+    duration_ns: int
+    # The validated field value, None for 'validate_fields' events.
+    field_value: Any = None
+
+
+# Validation code only checks whether this list is empty, so instrumentation costs nothing while no hook is added.
+hooks: List[Callable[[ValidationEvent], None]] = []
+
+
+def add_hook(hook: Callable[[ValidationEvent], None]):
+    """Add a hook called with a ValidationEvent after every rule evaluation and ValidateFields invocation
+
+    Args:
+        hook (Callable[[ValidationEvent], None]): The hook, it is called in the thread that runs the validation.
+    """
+    if hook not in hooks:
+        hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[ValidationEvent], None]):
+    """Remove a hook added with add_hook, removing a hook that was not added does nothing
+
+    Args:
+        hook (Callable[[ValidationEvent], None]): The hook.
+    """
+    if hook in hooks:
+        hooks.remove(hook)
+
+
+def emit(event: ValidationEvent):
+    """Call every hook with an event
+
+    Args:
+        event (ValidationEvent): The event.
+    """
+    for hook in hooks:
+        hook(event)
+
+
+def _value_length(field_value: Any) -> Optional[int]:
+    try:
+        return len(field_value)
+    except TypeError:
+        return None
+
+
+class ValidationStats:
+    """
+    In-Process Validation Statistics Aggregator
+    """
+
+    def __init__(self, slow_threshold_ms: Optional[float] = None):
+        """Hook that counts calls and failures and builds a latency histogram per model, field and validator
+
+        Args:
+            slow_threshold_ms (Optional[float], optional): Rule evaluations slower than this number of milliseconds are logged as warnings with the field and the length of the value. Defaults to None, which logs nothing.
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self._slow_threshold_ns = None if slow_threshold_ms is None else int(slow_threshold_ms * 1_000_000)
+        self._stats: Dict[Tuple[str, Optional[str], Optional[str], str], Dict[str, Any]] = {}
+        self._lock = Lock()
+
+    def __call__(self, event: ValidationEvent):
+        key = (event.kind, event.model_name, event.field_name, event.validator)
+        # Latencies are bucketed by powers of two, bucket b counts durations in [2**(b-1), 2**b) nanoseconds
+        bucket = event.duration_ns.bit_length()
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {'calls': 0, 'failures': 0, 'total_ns': 0, 'max_ns': 0, 'histogram': {}}
+            stats['calls'] += 1
+            if not event.passed:
+                stats['failures'] += 1
+            stats['total_ns'] += event.duration_ns
+            if event.duration_ns > stats['max_ns']:
+                stats['max_ns'] = event.duration_ns
+            histogram = stats['histogram']
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+        if self._slow_threshold_ns is not None and event.kind == 'rule' and event.duration_ns > self._slow_threshold_ns:
+            logger.warning(
+                'Slow validation rule %s on %s.%s took %.3f ms, value length %s',
+                event.validator,
+                event.model_name,
+                event.field_name,
+                event.duration_ns / 1_000_000,
+                _value_length(event.field_value),
+            )
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Get a copy of the statistics, one entry per kind, model, field and validator
+
+        Returns:
+            List[Dict[str, Any]]: The statistics, histogram maps the upper bound in nanoseconds of each bucket to its count.
+        """
+        with self._lock:
+            return [
+                {
+                    'kind': kind,
+                    'model_name': model_name,
+                    'field_name': field_name,
+                    'validator': validator,
+                    'calls': stats['calls'],
+                    'failures': stats['failures'],
+                    'total_ns': stats['total_ns'],
+                    'max_ns': stats['max_ns'],
+                    'histogram': {2**bucket: count for bucket, count in sorted(stats['histogram'].items())},
+                }
+                for (kind, model_name, field_name, validator), stats in self._stats.items()
+            ]
+
+    def reset(self):
+        """Remove all the statistics"""
+        with self._lock:
+            self._stats.clear()
@@ -1,9 +1,9 @@
-from asyncio import iscoroutinefunction
-from functools import wraps
-from typing import Literal, Optional
+from bisect import bisect_right
+from ipaddress import IPv4Address, IPv6Address, ip_network
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Literal, Optional, Sequence, Tuple, Union
 from pydantic import (
-    BaseModel,
-    Field,
+    TypeAdapter,
     AnyUrl,
     AnyHttpUrl,
     HttpUrl,
@@ -26,235 +26,213 @@ from pydantic import (
     IPvAnyAddress,
     ValidationError,
 )
-from .exceptions import FieldValidationError
+from .base import BaseFieldValidator
 
 
-class NetworkAnnotationModel(BaseModel):
-    any_url: Optional[AnyUrl] = Field(default=None, description='Base type for all URLs.')
-    any_http_url: Optional[AnyHttpUrl] = Field(
-        default=None,
-        description='A type that will accept any http or https URL.',
-    )
-    http_url: Optional[HttpUrl] = Field(
-        default=None,
-        description='A type that will accept any http or https URL and max length 2083.',
-    )
-    any_websocket_url: Optional[AnyWebsocketUrl] = Field(
-        default=None,
-        description='A type that will accept any ws or wss URL.',
-    )
-    websocket_url: Optional[WebsocketUrl] = Field(
-        default=None,
-        description='A type that will accept any ws or wss URL and max length 2083.',
-    )
-    file_url: Optional[FileUrl] = Field(default=None, description='A type that will accept any file URL.')
-    ftp_url: Optional[FtpUrl] = Field(default=None, description='A type that will accept ftp URL.')
-    postgres_dsn: Optional[PostgresDsn] = Field(
-        default=None,
-        description='A type that will accept any Postgres DSN.',
-    )
-    cockroach_dsn: Optional[CockroachDsn] = Field(
-        default=None,
-        description='A type that will accept any Cockroach DSN.',
-    )
-    amqp_dsn: Optional[AmqpDsn] = Field(default=None, description='A type that will accept any AMQP DSN.')
-    redis_dsn: Optional[RedisDsn] = Field(default=None, description='A type that will accept any Redis DSN.')
-    mongo_dsn: Optional[MongoDsn] = Field(
-        default=None,
-        description='A type that will accept any MongoDB DSN.',
-    )
-    kafka_dsn: Optional[KafkaDsn] = Field(default=None, description='A type that will accept any Kafka DSN.')
-    nats_dsn: Optional[NatsDsn] = Field(default=None, description='A type that will accept any NATS DSN.')
-    mysql_dsn: Optional[MySQLDsn] = Field(default=None, description='A type that will accept any MySQL DSN.')
-    mariadb_dsn: Optional[MariaDBDsn] = Field(
-        default=None,
-        description='A type that will accept any MariaDB DSN.',
-    )
-    clickhouse_dsn: Optional[ClickHouseDsn] = Field(
-        default=None,
-        description='A type that will accept any ClickHouse DSN.',
-    )
-    email_str: Optional[EmailStr] = Field(default=None, description='Validate email addresses.')
-    name_email: Optional[NameEmail] = Field(
-        default=None,
-        description='Validate a name and email address combination, as specified by RFC 5322.',
-    )
-    ipv_any_address: Optional[IPvAnyAddress] = Field(default=None, description='Validate an IPv4 or IPv6 address.')
+NETWORK_TYPES = {
+    'AnyUrl': AnyUrl,
+    'AnyHttpUrl': AnyHttpUrl,
+    'HttpUrl': HttpUrl,
+    'AnyWebsocketUrl': AnyWebsocketUrl,
+    'WebsocketUrl': WebsocketUrl,
+    'FileUrl': FileUrl,
+    'FtpUrl': FtpUrl,
+    'PostgresDsn': PostgresDsn,
+    'CockroachDsn': CockroachDsn,
+    'AmqpDsn': AmqpDsn,
+    'RedisDsn': RedisDsn,
+    'MongoDsn': MongoDsn,
+    'KafkaDsn': KafkaDsn,
+    'NatsDsn': NatsDsn,
+    'MySQLDsn': MySQLDsn,
+    'MariaDBDsn': MariaDBDsn,
+    'ClickHouseDsn': ClickHouseDsn,
+    'EmailStr': EmailStr,
+    'NameEmail': NameEmail,
+    'IPvAnyAddress': IPvAnyAddress,
+}
 
+_TYPE_ADAPTERS: Dict[str, TypeAdapter] = {}
+_TYPE_ADAPTERS_LOCK = Lock()
 
-class Network:
+
+def get_type_adapter(field_type: str) -> TypeAdapter:
+    """Get the type adapter of a network type, adapters are built once and shared by all Network decorators
+
+    Args:
+        field_type (str): Network type name, one of the keys of NETWORK_TYPES.
+
+    Raises:
+        ValueError: The field_type is not a supported network type.
+
+    Returns:
+        TypeAdapter: Type adapter that validates the network type.
+    """
+    type_adapter = _TYPE_ADAPTERS.get(field_type)
+    if type_adapter is None:
+        if field_type not in NETWORK_TYPES:
+            raise ValueError(f'The field_type {field_type} is not a supported network type.')
+        with _TYPE_ADAPTERS_LOCK:
+            type_adapter = _TYPE_ADAPTERS.get(field_type)
+            if type_adapter is None:
+                type_adapter = TypeAdapter(NETWORK_TYPES[field_type])
+                _TYPE_ADAPTERS[field_type] = type_adapter
+    return type_adapter
+
+
+class NetworkIndex:
+    """
+    IP Network Membership Index
+    """
+
+    def __init__(self, networks: Sequence[str]):
+        """Index of IPv4 and IPv6 networks, the networks of each IP version are merged into disjoint sorted address
+        intervals, so that the membership of an address is a binary search whatever the number of networks
+
+        Args:
+            networks (Sequence[str]): Networks in CIDR notation such as '10.0.0.0/8' or 'fd00::/8', or single addresses.
+
+        Raises:
+            ValueError: A network is not a valid IPv4 or IPv6 network.
+        """
+        intervals: Dict[int, List[Tuple[int, int]]] = {4: [], 6: []}
+        for network in networks:
+            network = ip_network(network, strict=False)
+            intervals[network.version].append((int(network.network_address), int(network.broadcast_address)))
+        self._starts: Dict[int, List[int]] = {}
+        self._ends: Dict[int, List[int]] = {}
+        for version, version_intervals in intervals.items():
+            starts: List[int] = []
+            ends: List[int] = []
+            for start, end in sorted(version_intervals):
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            self._starts[version] = starts
+            self._ends[version] = ends
+
+    def __contains__(self, address: Union[IPv4Address, IPv6Address]) -> bool:
+        value = int(address)
+        index = bisect_right(self._starts[address.version], value) - 1
+        if index >= 0 and value <= self._ends[address.version][index]:
+            return True
+        # An IPv4-mapped IPv6 address such as ::ffff:10.0.0.1 reaches the IPv4 address it embeds
+        mapped = getattr(address, 'ipv4_mapped', None)
+        return mapped is not None and mapped in self
+
+
+class Network(BaseFieldValidator):
     """
     Field Network Type Validation Decorator
     """
 
     def __init__(
         self,
-        field_name: str,
-        field_type: Literal[
-            'AnyUrl',
-            'AnyHttpUrl',
-            'HttpUrl',
-            'AnyWebsocketUrl',
-            'WebsocketUrl',
-            'FileUrl',
-            'FtpUrl',
-            'PostgresDsn',
-            'CockroachDsn',
-            'AmqpDsn',
-            'RedisDsn',
-            'MongoDsn',
-            'KafkaDsn',
-            'NatsDsn',
-            'MySQLDsn',
-            'MariaDBDsn',
-            'ClickHouseDsn',
-            'EmailStr',
-            'NameEmail',
-            'IPvAnyAddress',
-        ],
+        field_name: Optional[str] = None,
+        field_type: Optional[
+            Literal[
+                'AnyUrl',
+                'AnyHttpUrl',
+                'HttpUrl',
+                'AnyWebsocketUrl',
+                'WebsocketUrl',
+                'FileUrl',
+                'FtpUrl',
+                'PostgresDsn',
+                'CockroachDsn',
+                'AmqpDsn',
+                'RedisDsn',
+                'MongoDsn',
+                'KafkaDsn',
+                'NatsDsn',
+                'MySQLDsn',
+                'MariaDBDsn',
+                'ClickHouseDsn',
+                'EmailStr',
+                'NameEmail',
+                'IPvAnyAddress',
+            ]
+        ] = None,
         message: Optional[str] = None,
+        cache: Optional[bool] = None,
+        allowed_networks: Optional[Sequence[str]] = None,
+        denied_networks: Optional[Sequence[str]] = None,
     ):
         """Field Network Type Validation Decorator
 
         Args:
-            field_name (str): Field name that need to be validate.
-            field_type (Literal[ &#39;AnyUrl&#39;, &#39;AnyHttpUrl&#39;, &#39;HttpUrl&#39;, &#39;AnyWebsocketUrl&#39;, &#39;WebsocketUrl&#39;, &#39;FileUrl&#39;, &#39;FtpUrl&#39;, &#39;PostgresDsn&#39;, &#39;CockroachDsn&#39;, &#39;AmqpDsn&#39;, &#39;RedisDsn&#39;, &#39;MongoDsn&#39;, &#39;KafkaDsn&#39;, &#39;NatsDsn&#39;, &#39;MySQLDsn&#39;, &#39;MariaDBDsn&#39;, &#39;ClickHouseDsn&#39;, &#39;EmailStr&#39;, &#39;NameEmail&#39;, &#39;IPvAnyAddress&#39;, ]): Field type that need to be validate.
+            field_name (Optional[str], optional): Field name that need to be validate. Defaults to None, which takes the name of the annotated field.
+            field_type (Literal[ &#39;AnyUrl&#39;, &#39;AnyHttpUrl&#39;, &#39;HttpUrl&#39;, &#39;AnyWebsocketUrl&#39;, &#39;WebsocketUrl&#39;, &#39;FileUrl&#39;, &#39;FtpUrl&#39;, &#39;PostgresDsn&#39;, &#39;CockroachDsn&#39;, &#39;AmqpDsn&#39;, &#39;RedisDsn&#39;, &#39;MongoDsn&#39;, &#39;KafkaDsn&#39;, &#39;NatsDsn&#39;, &#39;MySQLDsn&#39;, &#39;MariaDBDsn&#39;, &#39;ClickHouseDsn&#39;, &#39;EmailStr&#39;, &#39;NameEmail&#39;, &#39;IPvAnyAddress&#39;, ], optional): Field type that need to be validate, it cannot be empty.
             message (Optional[str], optional): Prompt message for validation failure. Defaults to None.
+            cache (Optional[bool], optional): Whether to cache the verdicts of field values in the verdict cache. Defaults to None, which follows the global verdict cache setting.
+            allowed_networks (Optional[Sequence[str]], optional): IPv4 and IPv6 networks in CIDR notation that an IPvAnyAddress field value must belong to. Defaults to None, which allows every address.
+            denied_networks (Optional[Sequence[str]], optional): IPv4 and IPv6 networks in CIDR notation that an IPvAnyAddress field value must not belong to, they take precedence over allowed_networks. Defaults to None.
+
+        Raises:
+            ValueError: The field_type is not a supported network type. || The allowed_networks and denied_networks can only be used with the IPvAnyAddress field_type. || A network is not a valid IPv4 or IPv6 network.
         """
+        if (allowed_networks is not None or denied_networks is not None) and field_type != 'IPvAnyAddress':
+            raise ValueError(
+                'The allowed_networks and denied_networks can only be used with the IPvAnyAddress field_type.'
+            )
         self.field_name = field_name
+        field_label = field_name if field_name is not None else 'value'
         self.field_type = field_type
         self.message = message
+        self.cache = cache
+        self.allowed_networks = None if allowed_networks is None else tuple(allowed_networks)
+        self.denied_networks = None if denied_networks is None else tuple(denied_networks)
+        self._allowed_index = None if allowed_networks is None else NetworkIndex(self.allowed_networks)
+        self._denied_index = None if denied_networks is None else NetworkIndex(self.denied_networks)
+        self._validate_python = get_type_adapter(field_type).validate_python
+        self._message = message if message else f'{field_label} is not the correct {field_type} type.'
+        self._denied_message = message if message else f'{field_label} is in a denied network.'
+        self._not_allowed_message = message if message else f'{field_label} is not in an allowed network.'
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_validate_python']
+        return state
 
-    def __call__(self, func):
-        is_async = iscoroutinefunction(func)
-        if is_async:
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._validate_python = get_type_adapter(self.field_type).validate_python
 
-            @wraps(func)
-            async def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if field_value:
-                        try:
-                            if self.field_type == 'AnyUrl':
-                                NetworkAnnotationModel(any_url=field_value)
-                            elif self.field_type == 'AnyHttpUrl':
-                                NetworkAnnotationModel(any_http_url=field_value)
-                            elif self.field_type == 'HttpUrl':
-                                NetworkAnnotationModel(http_url=field_value)
-                            elif self.field_type == 'AnyWebsocketUrl':
-                                NetworkAnnotationModel(any_websocket_url=field_value)
-                            elif self.field_type == 'WebsocketUrl':
-                                NetworkAnnotationModel(websocket_url=field_value)
-                            elif self.field_type == 'FileUrl':
-                                NetworkAnnotationModel(file_url=field_value)
-                            elif self.field_type == 'FtpUrl':
-                                NetworkAnnotationModel(ftp_url=field_value)
-                            elif self.field_type == 'PostgresDsn':
-                                NetworkAnnotationModel(postgres_dsn=field_value)
-                            elif self.field_type == 'CockroachDsn':
-                                NetworkAnnotationModel(cockroach_dsn=field_value)
-                            elif self.field_type == 'AmqpDsn':
-                                NetworkAnnotationModel(amqp_dsn=field_value)
-                            elif self.field_type == 'RedisDsn':
-                                NetworkAnnotationModel(redis_dsn=field_value)
-                            elif self.field_type == 'MongoDsn':
-                                NetworkAnnotationModel(mongo_dsn=field_value)
-                            elif self.field_type == 'KafkaDsn':
-                                NetworkAnnotationModel(kafka_dsn=field_value)
-                            elif self.field_type == 'NatsDsn':
-                                NetworkAnnotationModel(nats_dsn=field_value)
-                            elif self.field_type == 'MySQLDsn':
-                                NetworkAnnotationModel(mysql_dsn=field_value)
-                            elif self.field_type == 'MariaDBDsn':
-                                NetworkAnnotationModel(mariadb_dsn=field_value)
-                            elif self.field_type == 'ClickHouseDsn':
-                                NetworkAnnotationModel(clickhouse_dsn=field_value)
-                            elif self.field_type == 'EmailStr':
-                                NetworkAnnotationModel(email_str=field_value)
-                            elif self.field_type == 'NameEmail':
-                                NetworkAnnotationModel(name_email=field_value)
-                            elif self.field_type == 'IPvAnyAddress':
-                                NetworkAnnotationModel(ipv_any_address=field_value)
-                        except (
-                            ValidationError,
-                            ValueError,
-                        ):
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} is not the correct {self.field_type} type.',
-                            )
-                return await func(*args, **kwargs)
+    def _cache_config(self) -> Hashable:
+        # The indexes hash by identity, so long network lists are not hashed again on every lookup
+        return (self.__class__.__name__, self.field_type, self._allowed_index, self._denied_index)
 
-            return wrapper
+    def _failure(self, field_value: Any) -> Optional[str]:
+        """Validate a field value and get the prompt message of the rule it fails
 
-        else:
+        Args:
+            field_value (Any): Field value that need to be validate.
+
+        Returns:
+            Optional[str]: Prompt message for validation failure, None if the field value is valid.
+        """
+        try:
+            value = self._validate_python(field_value)
+        except (
+            ValidationError,
+            ValueError,
+        ):
+            return self._message
+        if self._denied_index is not None and value in self._denied_index:
+            return self._denied_message
+        if self._allowed_index is not None and value not in self._allowed_index:
+            return self._not_allowed_message
+        return None
 
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if field_value:
-                        try:
-                            if self.field_type == 'AnyUrl':
-                                NetworkAnnotationModel(any_url=field_value)
-                            elif self.field_type == 'AnyHttpUrl':
-                                NetworkAnnotationModel(any_http_url=field_value)
-                            elif self.field_type == 'HttpUrl':
-                                NetworkAnnotationModel(http_url=field_value)
-                            elif self.field_type == 'AnyWebsocketUrl':
-                                NetworkAnnotationModel(any_websocket_url=field_value)
-                            elif self.field_type == 'WebsocketUrl':
-                                NetworkAnnotationModel(websocket_url=field_value)
-                            elif self.field_type == 'FileUrl':
-                                NetworkAnnotationModel(file_url=field_value)
-                            elif self.field_type == 'FtpUrl':
-                                NetworkAnnotationModel(ftp_url=field_value)
-                            elif self.field_type == 'PostgresDsn':
-                                NetworkAnnotationModel(postgres_dsn=field_value)
-                            elif self.field_type == 'CockroachDsn':
-                                NetworkAnnotationModel(cockroach_dsn=field_value)
-                            elif self.field_type == 'AmqpDsn':
-                                NetworkAnnotationModel(amqp_dsn=field_value)
-                            elif self.field_type == 'RedisDsn':
-                                NetworkAnnotationModel(redis_dsn=field_value)
-                            elif self.field_type == 'MongoDsn':
-                                NetworkAnnotationModel(mongo_dsn=field_value)
-                            elif self.field_type == 'KafkaDsn':
-                                NetworkAnnotationModel(kafka_dsn=field_value)
-                            elif self.field_type == 'NatsDsn':
-                                NetworkAnnotationModel(nats_dsn=field_value)
-                            elif self.field_type == 'MySQLDsn':
-                                NetworkAnnotationModel(mysql_dsn=field_value)
-                            elif self.field_type == 'MariaDBDsn':
-                                NetworkAnnotationModel(mariadb_dsn=field_value)
-                            elif self.field_type == 'ClickHouseDsn':
-                                NetworkAnnotationModel(clickhouse_dsn=field_value)
-                            elif self.field_type == 'EmailStr':
-                                NetworkAnnotationModel(email_str=field_value)
-                            elif self.field_type == 'NameEmail':
-                                NetworkAnnotationModel(name_email=field_value)
-                            elif self.field_type == 'IPvAnyAddress':
-                                NetworkAnnotationModel(ipv_any_address=field_value)
-                        except (
-                            ValidationError,
-                            ValueError,
-                        ):
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} is not the correct {self.field_type} type.',
-                            )
-                return func(*args, **kwargs)
+    def _is_valid(self, field_value: Any) -> bool:
+        return self._failure(field_value) is None
 
-            return wrapper
+    def _check(self, field_value: Any) -> Optional[str]:
+        if field_value and not self._verdict(field_value, self._is_valid):
+            if self._allowed_index is None and self._denied_index is None:
+                return self._message
+            # The verdict cache only keeps whether the value is valid, the failed rule is found again
+            return self._failure(field_value)
+        return None
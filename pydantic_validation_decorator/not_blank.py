@@ -1,76 +1,53 @@
-from asyncio import iscoroutinefunction
-from functools import wraps
-from pydantic import BaseModel
-from typing import Optional
-from .exceptions import FieldValidationError
+from typing import Any, List, Optional, Sequence, get_origin
+from pydantic_core import core_schema
+from .base import MISSING, BaseFieldValidator
 
 
-class NotBlank:
+class NotBlank(BaseFieldValidator):
     """
     Field NotBlank Validation Decorator
     """
 
     def __init__(
         self,
-        field_name: str,
+        field_name: Optional[str] = None,
         message: Optional[str] = None,
     ):
         """Field NotBlank Validation Decorator
 
         Args:
-            field_name (str): Field name that need to be validate.
+            field_name (Optional[str], optional): Field name that need to be validate. Defaults to None, which takes the name of the annotated field.
             message (Optional[str], optional): Prompt message for validation failure. Defaults to None.
         """
         self.field_name = field_name
+        field_label = field_name if field_name is not None else 'value'
         self.message = message
-
-    def __call__(self, func):
-        is_async = iscoroutinefunction(func)
-        if is_async:
-
-            @wraps(func)
-            async def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if (
-                        field_value is None
-                        or field_value == ''
-                        or field_value == []
-                        or field_value == ()
-                        or field_value == {}
-                    ):
-                        raise FieldValidationError(
-                            model_name=validate_model.__class__.__name__,
-                            field_name=self.field_name,
-                            field_value=field_value,
-                            validator=self.__class__.__name__,
-                            message=self.message if self.message else f'{self.field_name} cannot be empty.',
-                        )
-                return await func(*args, **kwargs)
-
-            return wrapper
-        else:
-
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if (
-                        field_value is None
-                        or field_value == ''
-                        or field_value == []
-                        or field_value == ()
-                        or field_value == {}
-                    ):
-                        raise FieldValidationError(
-                            model_name=validate_model.__class__.__name__,
-                            field_name=self.field_name,
-                            field_value=field_value,
-                            validator=self.__class__.__name__,
-                            message=self.message if self.message else f'{self.field_name} cannot be empty.',
-                        )
-                return func(*args, **kwargs)
-
-            return wrapper
+        self._message = message if message else f'{field_label} cannot be empty.'
+
+    def _check(self, field_value: Any) -> Optional[str]:
+        if field_value is None or field_value == '' or field_value == [] or field_value == () or field_value == {}:
+            return self._message
+        return None
+
+    def _check_many(self, field_values: Sequence[Any]) -> List[Optional[str]]:
+        message = self._message
+        return [
+            message
+            if field_value is not MISSING
+            and (
+                field_value is None or field_value == '' or field_value == [] or field_value == () or field_value == {}
+            )
+            else None
+            for field_value in field_values
+        ]
+
+    def _native_schema(self, field_type: Any, nullable: bool) -> Optional[core_schema.CoreSchema]:
+        # None is always blank, so the schema never accepts it even if the field is Optional
+        field_type = get_origin(field_type) or field_type
+        if field_type is str:
+            return core_schema.str_schema(min_length=1, strict=True)
+        if field_type is list:
+            return core_schema.list_schema(min_length=1, strict=True)
+        if field_type is dict:
+            return core_schema.dict_schema(min_length=1, strict=True)
+        return None
@@ -1,69 +1,244 @@
 import re
-from asyncio import iscoroutinefunction
-from functools import wraps
-from typing import Optional
-from pydantic import BaseModel
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Literal, Optional, Sequence, Tuple
+from pydantic_core import core_schema
+from .base import BaseFieldValidator
+from .cache import verdict_cache
 from .exceptions import FieldValidationError
 
 
-class Pattern:
+_COMPILED_PATTERNS: Dict[Tuple[str, int], re.Pattern] = {}
+_COMPILED_PATTERNS_LOCK = Lock()
+# Regular expression flags that can be written as a scoped inline flag group
+_INLINE_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's', re.ASCII: 'a'}
+# Backreferences and conditionals refer to groups by number or name, which fusing regular expressions would change
+_GROUP_REFERENCE_PATTERN = re.compile(r'\\[1-9]|\\g<|\(\?P=|\(\?\(')
+
+
+def get_compiled_pattern(regexp: str, flags: int = 0) -> re.Pattern:
+    """Get the compiled regular expression, identical patterns are compiled once and shared by the whole process
+
+    Args:
+        regexp (str): Regular expression.
+        flags (int, optional): Regular expression flags. Defaults to 0.
+
+    Returns:
+        re.Pattern: Compiled regular expression.
+    """
+    key = (regexp, flags)
+    compiled_pattern = _COMPILED_PATTERNS.get(key)
+    if compiled_pattern is None:
+        with _COMPILED_PATTERNS_LOCK:
+            compiled_pattern = _COMPILED_PATTERNS.get(key)
+            if compiled_pattern is None:
+                compiled_pattern = re.compile(regexp, flags)
+                _COMPILED_PATTERNS[key] = compiled_pattern
+    return compiled_pattern
+
+
+class Pattern(BaseFieldValidator):
     """
     Field Pattern Validation Decorator
     """
 
     def __init__(
         self,
-        field_name: str,
-        regexp: str,
+        field_name: Optional[str] = None,
+        regexp: Optional[str] = None,
         message: Optional[str] = None,
+        cache: Optional[bool] = None,
+        flags: int = 0,
+        match_mode: Literal['match', 'fullmatch', 'search'] = 'match',
     ):
         """Field Pattern Validation Decorator
 
         Args:
-            field_name (str): Field name that need to be validate.
-            regexp (str): Regular expression.
+            field_name (Optional[str], optional): Field name that need to be validate. Defaults to None, which takes the name of the annotated field.
+            regexp (Optional[str], optional): Regular expression, it cannot be empty.
             message (Optional[str], optional): Prompt message for validation failure. Defaults to None.
+            cache (Optional[bool], optional): Whether to cache the verdicts of field values in the verdict cache. Defaults to None, which follows the global verdict cache setting.
+            flags (int, optional): Regular expression flags, such as re.IGNORECASE. Defaults to 0.
+            match_mode (Literal[&#39;match&#39;, &#39;fullmatch&#39;, &#39;search&#39;], optional): How the regular expression is applied to the field value, 'match' matches at the beginning of the value, 'fullmatch' matches the whole value and 'search' matches anywhere in the value. Defaults to 'match'.
+
+        Raises:
+            ValueError: The regexp is empty. || The match_mode is not one of 'match', 'fullmatch' and 'search'.
         """
+        if regexp is None:
+            raise ValueError('The regexp cannot be empty.')
+        if match_mode not in ('match', 'fullmatch', 'search'):
+            raise ValueError('The match_mode must be one of match, fullmatch and search.')
         self.field_name = field_name
+        field_label = field_name if field_name is not None else 'value'
         self.regexp = regexp
         self.message = message
+        self.cache = cache
+        self.flags = flags
+        self.match_mode = match_mode
+        self._matcher = getattr(get_compiled_pattern(regexp, flags), match_mode)
+        self._message = message if message else f'The format of {field_label} is incorrect.'
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_matcher']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._matcher = getattr(get_compiled_pattern(self.regexp, self.flags), self.match_mode)
+
+    def _cache_config(self) -> Hashable:
+        return (self.__class__.__name__, self.regexp, self.flags, self.match_mode)
+
+    def _is_valid(self, field_value: str) -> bool:
+        return self._matcher(field_value) is not None
+
+    def _check(self, field_value: Any) -> Optional[str]:
+        if isinstance(field_value, str) and not self._verdict(field_value, self._is_valid):
+            return self._message
+        return None
+
+    def _check_many(self, field_values: Sequence[Any]) -> List[Optional[str]]:
+        if self.cache or (self.cache is None and verdict_cache.enabled):
+            return super()._check_many(field_values)
+        matcher = self._matcher
+        message = self._message
+        return [
+            message if isinstance(field_value, str) and matcher(field_value) is None else None
+            for field_value in field_values
+        ]
+
+    def _scoped_regexp(self) -> Optional[str]:
+        """Get the regular expression with its flags written as a scoped inline flag group
+
+        Returns:
+            Optional[str]: The scoped regular expression, None if a flag cannot be written inline.
+        """
+        inline_flags = ''
+        flags = self.flags & ~re.UNICODE
+        for flag, letter in _INLINE_FLAGS.items():
+            if flags & flag:
+                inline_flags += letter
+                flags &= ~flag
+        if flags:
+            return None
+        return f'(?{inline_flags}:{self.regexp})' if inline_flags else f'(?:{self.regexp})'
+
+    def _fusable(self) -> bool:
+        """Check whether the rule can be fused with other Pattern rules into one regular expression
+
+        Returns:
+            bool: Whether the rule can be fused.
+        """
+        if not (
+            self.field_name is not None
+            and self.match_mode in ('match', 'fullmatch')
+            and self.cache is not True
+            and not _GROUP_REFERENCE_PATTERN.search(self.regexp)
+            and not get_compiled_pattern(self.regexp, self.flags).groupindex
+            and self._scoped_regexp() is not None
+        ):
+            return False
+        try:
+            get_compiled_pattern(self._scoped_regexp())
+        except re.error:
+            # A global inline flag group such as (?i) is only allowed at the start of the whole regular expression
+            return False
+        return True
+
+    def _fuse(self, validator: BaseFieldValidator) -> Optional[BaseFieldValidator]:
+        if isinstance(validator, Pattern) and validator.field_name == self.field_name and self._fusable():
+            if validator._fusable():
+                return FusedPattern((self, validator))
+        return None
+
+    def _native_schema(self, field_type: Any, nullable: bool) -> Optional[core_schema.CoreSchema]:
+        if field_type is not str:
+            return None
+        # pydantic-core searches the pattern, so the match modes are written as anchors and the flags as a scoped
+        # inline flag group, the pattern is then run by the re module of Python like the rule itself
+        regexp = self._scoped_regexp()
+        if regexp is None:
+            return None
+        if self.match_mode == 'match':
+            regexp = rf'\A{regexp}'
+        elif self.match_mode == 'fullmatch':
+            regexp = rf'\A{regexp}\Z'
+        try:
+            re.compile(regexp)
+        except re.error:
+            return None
+        schema = core_schema.str_schema(pattern=regexp, regex_engine='python-re', strict=True)
+        return core_schema.nullable_schema(schema) if nullable else schema
+
+
+class FusedPattern(BaseFieldValidator):
+    """
+    Fused Field Pattern Validator
+    """
+
+    def __init__(self, patterns: Tuple[Pattern, ...]):
+        """Pattern rules of one field fused into a single regular expression, so that a value is scanned once
+
+        Each rule becomes an optional lookahead holding a named group at the start of the value, the group is None
+        after the match exactly when the rule fails, so the first failing rule and its message are the same as when
+        the rules run one after another.
+
+        Args:
+            patterns (Tuple[Pattern, ...]): Pattern rules of the same field in the order they run, all fusable.
+        """
+        self.field_name = patterns[0].field_name
+        self.message = None
+        self.patterns = patterns
+        # Rules that follow the global verdict cache setting run one after another while the cache is enabled
+        self._follows_cache = any(pattern.cache is None for pattern in patterns)
+        self._group_names = tuple(f'rule_{index}' for index in range(len(patterns)))
+        self._compile()
+
+    def _compile(self):
+        lookaheads = []
+        for group_name, pattern in zip(self._group_names, self.patterns):
+            regexp = pattern._scoped_regexp()
+            if pattern.match_mode == 'fullmatch':
+                regexp = rf'{regexp}\Z'
+            lookaheads.append(f'(?:(?=(?P<{group_name}>{regexp}))?)')
+        try:
+            self._match = get_compiled_pattern(''.join(lookaheads)).match
+        except re.error:
+            # The rules run one after another when the combined regular expression cannot be compiled
+            self._match = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_match']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile()
+
+    def _fuse(self, validator: BaseFieldValidator) -> Optional[BaseFieldValidator]:
+        if isinstance(validator, Pattern) and validator.field_name == self.field_name and validator._fusable():
+            return FusedPattern(self.patterns + (validator,))
+        return None
+
+    def _check(self, field_value: Any) -> Optional[str]:
+        if isinstance(field_value, str):
+            if self._match is None or (self._follows_cache and verdict_cache.enabled):
+                for pattern in self.patterns:
+                    message = pattern._check(field_value)
+                    if message is not None:
+                        return message
+                return None
+            groups = self._match(field_value).group(*self._group_names)
+            if None in groups:
+                return self.patterns[groups.index(None)]._message
+        return None
 
-    def __call__(self, func):
-        is_async = iscoroutinefunction(func)
-        if is_async:
-
-            @wraps(func)
-            async def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if isinstance(field_value, str) and not re.match(self.regexp, field_value):
-                        raise FieldValidationError(
-                            model_name=validate_model.__class__.__name__,
-                            field_name=self.field_name,
-                            field_value=field_value,
-                            validator=self.__class__.__name__,
-                            message=self.message if self.message else f'The format of {self.field_name} is incorrect.',
-                        )
-                return await func(*args, **kwargs)
-
-            return wrapper
-
-        else:
-
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if isinstance(field_value, str) and not re.match(self.regexp, field_value):
-                        raise FieldValidationError(
-                            model_name=validate_model.__class__.__name__,
-                            field_name=self.field_name,
-                            field_value=field_value,
-                            validator=self.__class__.__name__,
-                            message=self.message if self.message else f'The format of {self.field_name} is incorrect.',
-                        )
-                return func(*args, **kwargs)
-
-            return wrapper
+    def _error(self, model_name: Optional[str], field_value: Any, message: str) -> FieldValidationError:
+        return FieldValidationError(
+            model_name=model_name,
+            field_name=self.field_name,
+            field_value=field_value,
+            validator=Pattern.__name__,
+            message=message,
+        )
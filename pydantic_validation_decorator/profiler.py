@@ -0,0 +1,140 @@
+import asyncio
+import importlib
+import json
+from asyncio import iscoroutinefunction
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional, Type
+from pydantic import BaseModel, ValidationError
+from .exceptions import FieldValidationError
+from .instrumentation import ValidationStats, add_hook, remove_hook
+
+
+def load_model_class(path: str) -> Type[BaseModel]:
+    """Import a pydantic model class from a path such as package.module:Model
+
+    Args:
+        path (str): Module path and class name separated by a colon.
+
+    Raises:
+        ValueError: The path is not in module:Model form or does not name a pydantic model class.
+
+    Returns:
+        Type[BaseModel]: The pydantic model class.
+    """
+    module_name, _, class_name = path.partition(':')
+    if not module_name or not class_name:
+        raise ValueError(f'The model path {path} must be in module:Model form.')
+    model_class = importlib.import_module(module_name)
+    for name in class_name.split('.'):
+        model_class = getattr(model_class, name)
+    if not (isinstance(model_class, type) and issubclass(model_class, BaseModel)):
+        raise ValueError(f'The model path {path} does not name a pydantic model class.')
+    return model_class
+
+
+def profile_corpus(
+    model_class: Type[BaseModel],
+    corpus_path: str,
+    validate_function: str = 'validate_fields',
+    top: int = 10,
+) -> Dict[str, Any]:
+    """Build a model from each payload of a JSONL corpus, run its validation function and collect the timings
+
+    Args:
+        model_class (Type[BaseModel]): The pydantic model class.
+        corpus_path (str): Path of a file with one JSON payload per line, blank lines are skipped.
+        validate_function (str, optional): The name of the validation function defined in the pydantic model. Defaults to 'validate_fields'.
+        top (int, optional): Number of slowest payloads to report. Defaults to 10.
+
+    Returns:
+        Dict[str, Any]: The number of payloads, passed, failed and invalid payloads, the statistics of every rule and the slowest payloads.
+    """
+    stats = ValidationStats()
+    payloads: List[Dict[str, Any]] = []
+    counts = {'payloads': 0, 'passed': 0, 'failed': 0, 'invalid': 0}
+    loop = None
+    add_hook(stats)
+    try:
+        with open(corpus_path, encoding='utf-8') as corpus:
+            for line_number, line in enumerate(corpus, 1):
+                if not line.strip():
+                    continue
+                counts['payloads'] += 1
+                outcome = 'passed'
+                message = None
+                start = perf_counter_ns()
+                try:
+                    validate_model = model_class.model_validate(json.loads(line))
+                    function = getattr(validate_model, validate_function)
+                    if iscoroutinefunction(function):
+                        if loop is None:
+                            loop = asyncio.new_event_loop()
+                        loop.run_until_complete(function())
+                    else:
+                        function()
+                except FieldValidationError as e:
+                    outcome = 'failed'
+                    message = e.message
+                except (ValidationError, ValueError) as e:
+                    outcome = 'invalid'
+                    message = str(e).splitlines()[0]
+                duration_ns = perf_counter_ns() - start
+                counts[outcome] += 1
+                payloads.append(
+                    {
+                        'line': line_number,
+                        'duration_ns': duration_ns,
+                        'outcome': outcome,
+                        'message': message,
+                        'length': len(line),
+                    }
+                )
+    finally:
+        remove_hook(stats)
+        if loop is not None:
+            loop.close()
+    rules = [entry for entry in stats.snapshot() if entry['kind'] == 'rule']
+    rules.sort(key=lambda entry: entry['total_ns'], reverse=True)
+    payloads.sort(key=lambda payload: payload['duration_ns'], reverse=True)
+    return {**counts, 'rules': rules, 'slowest_payloads': payloads[:top]}
+
+
+def format_report(report: Dict[str, Any], corpus_path: Optional[str] = None) -> str:
+    """Format the result of profile_corpus as text tables
+
+    Args:
+        report (Dict[str, Any]): The result of profile_corpus.
+        corpus_path (Optional[str], optional): Path of the corpus, used to show a preview of the slowest payloads. Defaults to None.
+
+    Returns:
+        str: The report.
+    """
+    names = [f'{entry["model_name"]}.{entry["field_name"]}' for entry in report['rules']]
+    width = max([len(name) for name in names] + [5])
+    lines = [
+        f'{report["payloads"]} payloads: {report["passed"]} passed, {report["failed"]} failed validation, '
+        f'{report["invalid"]} invalid',
+        '',
+        f'{"field":<{width}} {"validator":<12} {"calls":>8} {"fail %":>7} {"total ms":>10} {"mean us":>9} {"max us":>9}',
+    ]
+    for name, entry in zip(names, report['rules']):
+        calls = entry['calls']
+        lines.append(
+            f'{name:<{width}} {entry["validator"]:<12} {calls:>8} {entry["failures"] / calls * 100:>7.1f} '
+            f'{entry["total_ns"] / 1e6:>10.3f} {entry["total_ns"] / calls / 1e3:>9.1f} {entry["max_ns"] / 1e3:>9.1f}'
+        )
+    previews = {}
+    if corpus_path is not None and report['slowest_payloads']:
+        wanted = {payload['line'] for payload in report['slowest_payloads']}
+        with open(corpus_path, encoding='utf-8') as corpus:
+            for line_number, line in enumerate(corpus, 1):
+                if line_number in wanted:
+                    line = line.strip()
+                    previews[line_number] = line if len(line) <= 60 else line[:57] + '...'
+    lines.extend(['', f'{"line":>8} {"ms":>10} {"outcome":<8} {"length":>8}  payload'])
+    for payload in report['slowest_payloads']:
+        lines.append(
+            f'{payload["line"]:>8} {payload["duration_ns"] / 1e6:>10.3f} {payload["outcome"]:<8} '
+            f'{payload["length"]:>8}  {previews.get(payload["line"], "")}'
+        )
+    return '\n'.join(lines)
@@ -1,18 +1,55 @@
-from asyncio import iscoroutinefunction
-from functools import wraps
-from typing import Optional, Union
-from pydantic import BaseModel
-from .exceptions import FieldValidationError
+from itertools import chain, islice
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+from pydantic_core import core_schema
+from .base import MISSING, BaseFieldValidator
 
 
-class Size:
+# NumPy is only used to check columns of numbers in batch validation, it is imported on first use so that importing
+# the package does not pay for it. MISSING until the import is attempted, None if NumPy is unavailable.
+_numpy: Any = MISSING
+
+
+def _import_numpy() -> Any:
+    """Import NumPy on first use
+
+    Returns:
+        Any: The numpy module, None if NumPy is unavailable.
+    """
+    global _numpy
+    if _numpy is MISSING:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def _is_exact_float(bound: Union[int, float]) -> bool:
+    """Check whether a bound is represented exactly as a float
+
+    Args:
+        bound (Union[int, float]): The bound.
+
+    Returns:
+        bool: Whether converting the bound to float keeps its value.
+    """
+    try:
+        return float(bound) == bound
+    except OverflowError:
+        return False
+
+
+class Size(BaseFieldValidator):
     """
     Field Size Validation Decorator
     """
 
+    replaces_iterators = True
+
     def __init__(
         self,
-        field_name: str,
+        field_name: Optional[str] = None,
         gt: Optional[Union[float, int]] = None,
         ge: Optional[Union[float, int]] = None,
         lt: Optional[Union[float, int]] = None,
@@ -24,16 +61,17 @@ class Size:
         """Field Size Validation Decorator
 
         Args:
-            field_name (str): Field name that need to be validate.
+            field_name (Optional[str], optional): Field name that need to be validate. Defaults to None, which takes the name of the annotated field.
             gt (Optional[Union[float, int]], optional): The numerical field value must be greater than gt. Defaults to None.
             ge (Optional[Union[float, int]], optional): The numerical field value must be greater than or equal to ge. Defaults to None.
             lt (Optional[Union[float, int]], optional): The numerical field value must be less than lt. Defaults to None.
             le (Optional[Union[float, int]], optional): The numerical field value must be less than or equal to le. Defaults to None.
-            min_length (Optional[int], optional): The length of a string field cannot be less than min_length. Defaults to 0.
-            max_length (Optional[int], optional): The length of a string field cannot be greater than max_length. Defaults to None.
+            min_length (Optional[int], optional): The length of a sized field, such as a string, bytes or a collection, cannot be less than min_length. Iterators are counted up to the bound instead of consumed in full. Defaults to 0.
+            max_length (Optional[int], optional): The length of a sized field, such as a string, bytes or a collection, cannot be greater than max_length. Iterators are counted up to max_length + 1 items instead of consumed in full. Defaults to None.
             message (Optional[str], optional): Prompt message for validation failure. Defaults to None.
         """
         self.field_name = field_name
+        field_label = field_name if field_name is not None else 'value'
         self.gt = gt
         self.ge = ge
         self.lt = lt
@@ -41,151 +79,125 @@ class Size:
         self.min_length = min_length if min_length >= 0 else 0
         self.max_length = max_length
         self.message = message
+        self._gt_message = message if message else f'{field_label} must be greater than {gt}.'
+        self._ge_message = message if message else f'{field_label} must be greater than or equal to {ge}.'
+        self._lt_message = message if message else f'{field_label} must be less than {lt}.'
+        self._le_message = message if message else f'{field_label} must be less than or equal to {le}.'
+        self._min_length_message = (
+            message if message else f'The length of {field_label} cannot be less than {self.min_length}.'
+        )
+        self._max_length_message = (
+            message if message else f'The length of {field_label} cannot be greater than {max_length}.'
+        )
 
-    def __call__(self, func):
-        is_async = iscoroutinefunction(func)
-        if is_async:
-
-            @wraps(func)
-            async def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if isinstance(field_value, (int, float)):
-                        if self.gt is not None and field_value <= self.gt:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} must be greater than {self.gt}.',
-                            )
-                        elif self.ge is not None and field_value < self.ge:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} must be greater than or equal to {self.ge}.',
-                            )
-                        elif self.lt is not None and field_value >= self.lt:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} must be less than {self.lt}.',
-                            )
-                        elif self.le is not None and field_value > self.le:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} must be less than or equal to {self.le}.',
-                            )
-                    elif isinstance(field_value, str):
-                        if len(field_value) < self.min_length:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'The length of {self.field_name} cannot be less than {self.min_length}.',
-                            )
-                        elif self.max_length is not None and len(field_value) > self.max_length:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'The length of {self.field_name} cannot be greater than {self.max_length}.',
-                            )
-                return await func(*args, **kwargs)
-
-            return wrapper
+    def _check(self, field_value: Any) -> Optional[str]:
+        if isinstance(field_value, (int, float)):
+            if self.gt is not None and field_value <= self.gt:
+                return self._gt_message
+            elif self.ge is not None and field_value < self.ge:
+                return self._ge_message
+            elif self.lt is not None and field_value >= self.lt:
+                return self._lt_message
+            elif self.le is not None and field_value > self.le:
+                return self._le_message
+        elif isinstance(field_value, str) or hasattr(field_value, '__len__'):
+            if len(field_value) < self.min_length:
+                return self._min_length_message
+            elif self.max_length is not None and len(field_value) > self.max_length:
+                return self._max_length_message
+        return None
 
-        else:
+    def _check_replace(self, field_value: Iterator) -> Tuple[Optional[str], Iterator]:
+        # The items are counted up to the length bounds only, and the returned iterator yields the counted items
+        # followed by the rest of the field value
+        limit = self.min_length if self.max_length is None else max(self.max_length + 1, self.min_length)
+        if limit == 0:
+            return None, field_value
+        head = list(islice(field_value, limit))
+        replacement = chain(head, field_value)
+        if len(head) < self.min_length:
+            return self._min_length_message, replacement
+        elif self.max_length is not None and len(head) > self.max_length:
+            return self._max_length_message, replacement
+        return None, replacement
+
+    def _check_many(self, field_values: Sequence[Any]) -> List[Optional[str]]:
+        field_types = set(map(type, field_values))
+        if field_types <= {int, float}:
+            messages = self._check_many_numbers(field_values)
+            if messages is not None:
+                return messages
+        elif field_types == {str}:
+            min_length = self.min_length
+            max_length = self.max_length if self.max_length is not None else float('inf')
+            min_length_message = self._min_length_message
+            max_length_message = self._max_length_message
+            return [
+                min_length_message if length < min_length else max_length_message if length > max_length else None
+                for length in map(len, field_values)
+            ]
+        return super()._check_many(field_values)
+
+    def _check_many_numbers(self, field_values: Sequence[Union[int, float]]) -> Optional[List[Optional[str]]]:
+        """Check a column of numbers against the bounds with NumPy
 
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if isinstance(field_value, (int, float)):
-                        if self.gt is not None and field_value <= self.gt:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} must be greater than {self.gt}.',
-                            )
-                        elif self.ge is not None and field_value < self.ge:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} must be greater than or equal to {self.ge}.',
-                            )
-                        elif self.lt is not None and field_value >= self.lt:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} must be less than {self.lt}.',
-                            )
-                        elif self.le is not None and field_value > self.le:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} must be less than or equal to {self.le}.',
-                            )
-                    elif isinstance(field_value, str):
-                        if len(field_value) < self.min_length:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'The length of {self.field_name} cannot be less than {self.min_length}.',
-                            )
-                        elif self.max_length is not None and len(field_value) > self.max_length:
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'The length of {self.field_name} cannot be greater than {self.max_length}.',
-                            )
-                return func(*args, **kwargs)
-
-            return wrapper
+        Args:
+            field_values (Sequence[Union[int, float]]): Numerical field values that need to be validate.
+
+        Returns:
+            Optional[List[Optional[str]]]: Prompt message for validation failure of each field value, None if NumPy is unavailable or cannot compare the values exactly.
+        """
+        if not field_values:
+            return None
+        # The values are compared with the bounds as float64, so only bounds that a float represents exactly are used
+        if not all(_is_exact_float(bound) for bound in (self.gt, self.ge, self.lt, self.le) if bound is not None):
+            return None
+        numpy = _import_numpy()
+        if numpy is None:
+            return None
+        bounds = [
+            (self.gt, numpy.less_equal, self._gt_message),
+            (self.ge, numpy.less, self._ge_message),
+            (self.lt, numpy.greater_equal, self._lt_message),
+            (self.le, numpy.greater, self._le_message),
+        ]
+        try:
+            array = numpy.asarray(field_values)
+            if array.dtype.kind not in ('i', 'f') or array.max() > 2**53 or array.min() < -(2**53):
+                return None
+            invalids = [(compare(array, bound), message) for bound, compare, message in bounds if bound is not None]
+        except (OverflowError, TypeError):
+            return None
+        messages: List[Optional[str]] = [None] * len(field_values)
+        for invalid, message in reversed(invalids):
+            for position in numpy.flatnonzero(invalid).tolist():
+                messages[position] = message
+        return messages
+
+    def _native_schema(self, field_type: Any, nullable: bool) -> Optional[core_schema.CoreSchema]:
+        bounds = {'gt': self.gt, 'ge': self.ge, 'lt': self.lt, 'le': self.le}
+        bounds = {name: bound for name, bound in bounds.items() if bound is not None}
+        if any(isinstance(bound, bool) or not isinstance(bound, (int, float)) for bound in bounds.values()):
+            return None
+        if field_type is str:
+            schema = core_schema.str_schema(min_length=self.min_length, max_length=self.max_length, strict=True)
+        elif field_type is int:
+            # Integers are compared exactly, so only integral bounds can be lowered
+            if any(isinstance(bound, float) and not bound.is_integer() for bound in bounds.values()):
+                return None
+            schema = core_schema.int_schema(**{name: int(bound) for name, bound in bounds.items()}, strict=True)
+        elif field_type is float:
+            # The bounds are converted to float, so only bounds that a float represents exactly can be lowered
+            if not all(_is_exact_float(bound) for bound in bounds.values()):
+                return None
+            # The float schema also accepts integers and converts them to float, which loses precision beyond 2**53,
+            # so only values that are already floats are checked natively
+            schema = core_schema.chain_schema(
+                [
+                    core_schema.is_instance_schema(float),
+                    core_schema.float_schema(**bounds, allow_inf_nan=True, strict=True),
+                ]
+            )
+        else:
+            return None
+        return core_schema.nullable_schema(schema) if nullable else schema
@@ -1,28 +1,39 @@
+from typing import Any, Iterable, List, Union
+
+
+def _is_numpy_array(value: Any) -> bool:
+    """Check whether a value is a NumPy array without importing NumPy
+
+    Args:
+        value (Any): Value to be checked.
+
+    Returns:
+        bool: Whether the value is a NumPy array.
+    """
+    return type(value).__module__ == 'numpy' and hasattr(value, 'dtype')
+
+
 class StringUtils:
     """
     String Utils Class
     """
 
     @classmethod
-    def is_blank(cls, string: str) -> bool:
+    def is_blank(cls, string: str, unicode_whitespace: bool = False) -> bool:
         """Validate if the string is '' or all spaces
 
         Args:
             string (str): String to be validated
+            unicode_whitespace (bool, optional): Whether any unicode whitespace counts as blank instead of only spaces. Defaults to False.
 
         Returns:
             bool: Validation results
         """
         if string is None:
             return False
-        str_len = len(string)
-        if str_len == 0:
-            return True
-        else:
-            for i in range(str_len):
-                if string[i] != ' ':
-                    return False
-            return True
+        if unicode_whitespace:
+            return len(string) == 0 or string.isspace()
+        return string.count(' ') == len(string)
 
     @classmethod
     def is_empty(cls, string: str) -> bool:
@@ -35,3 +46,48 @@ class StringUtils:
             bool: Validation results
         """
         return string is None or len(string) == 0
+
+    @classmethod
+    def is_blank_many(
+        cls, strings: Union[Iterable[str], Any], unicode_whitespace: bool = False
+    ) -> Union[List[bool], Any]:
+        """Validate if each string is '' or all spaces
+
+        Args:
+            strings (Union[Iterable[str], Any]): Strings to be validated, a list or a NumPy string array
+            unicode_whitespace (bool, optional): Whether any unicode whitespace counts as blank instead of only spaces. Defaults to False.
+
+        Returns:
+            Union[List[bool], Any]: Validation results, a boolean NumPy array of the same shape when strings is a NumPy array
+        """
+        if _is_numpy_array(strings):
+            import numpy as np
+
+            if strings.dtype.kind in ('U', 'S'):
+                if unicode_whitespace:
+                    return (np.char.str_len(strings) == 0) | np.char.isspace(strings)
+                return np.char.str_len(np.char.strip(strings, ' ' if strings.dtype.kind == 'U' else b' ')) == 0
+            return np.array(cls.is_blank_many(strings.ravel().tolist(), unicode_whitespace), dtype=bool).reshape(
+                strings.shape
+            )
+        if unicode_whitespace:
+            return [string is not None and (len(string) == 0 or string.isspace()) for string in strings]
+        return [string is not None and string.count(' ') == len(string) for string in strings]
+
+    @classmethod
+    def is_empty_many(cls, strings: Union[Iterable[str], Any]) -> Union[List[bool], Any]:
+        """Validate if each string is '' or None
+
+        Args:
+            strings (Union[Iterable[str], Any]): Strings to be validated, a list or a NumPy string array
+
+        Returns:
+            Union[List[bool], Any]: Validation results, a boolean NumPy array of the same shape when strings is a NumPy array
+        """
+        if _is_numpy_array(strings):
+            import numpy as np
+
+            if strings.dtype.kind in ('U', 'S'):
+                return np.char.str_len(strings) == 0
+            return np.array(cls.is_empty_many(strings.ravel().tolist()), dtype=bool).reshape(strings.shape)
+        return [string is None or len(string) == 0 for string in strings]
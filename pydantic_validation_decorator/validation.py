@@ -1,8 +1,132 @@
+import asyncio
+import inspect
+import sys
+import weakref
 from asyncio import iscoroutinefunction
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
 from functools import wraps
+from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
+from operator import methodcaller
+from time import perf_counter_ns
 from pydantic import BaseModel
-from typing import Literal, Optional
-from .exceptions import FunctionTypeError
+from pydantic_core import MultiHostUrl, Url
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Sequence, Tuple, Type, Union, get_type_hints
+from .compiler import _IMMUTABLE_TYPES, compile_validators, get_adaptive_checker, get_incremental_checker
+from .exceptions import FieldValidationError, FieldValidationErrors, FunctionTypeError
+from .instrumentation import ValidationEvent, emit, hooks
+
+
+# A validation plan lists, for each validation function of a model class, its name, a callable that runs it on a
+# model instance and whether it is asynchronous.
+ValidationPlan = Tuple[Tuple[str, Callable[[BaseModel], Any], bool], ...]
+# The models validated in the current validation scope, keyed by the id of the model instance and the validation
+# functions, with the instance and the fingerprint of its values when it passed. None outside of any scope.
+_validated_models: ContextVar[Optional[Dict[Tuple[int, Tuple[str, ...], bool], Tuple[BaseModel, Any]]]] = ContextVar(
+    'validated_models', default=None
+)
+
+
+# Whether the values of a type cannot change and are compared by value, decided once per type by `_is_value_type`
+_VALUE_TYPES: Dict[type, bool] = {}
+
+
+# Every ValidateFields decorator, so that warmup can resolve their validation plans ahead of the first call
+_VALIDATE_FIELDS: 'weakref.WeakSet[ValidateFields]' = weakref.WeakSet()
+
+
+@contextmanager
+def validation_scope() -> Iterator[None]:
+    """Delimit a scope, such as the handling of a request, in which a model instance that passed a ValidateFields
+    function is not validated again by nested ValidateFields functions with the same validation functions, as long as
+    its values are unchanged
+
+    The scope follows the context of the code, so asyncio tasks created inside the scope share it, while other threads
+    do not see it unless they run in a copy of the context. A scope opened inside another scope starts empty.
+
+    Yields:
+        None
+    """
+    token = _validated_models.set({})
+    try:
+        yield
+    finally:
+        _validated_models.reset(token)
+
+
+def _is_value_type(value_type: type) -> bool:
+    """Check whether the values of a type, such as enum members, IP addresses and pydantic URLs, cannot change
+
+    Args:
+        value_type (type): Type of a value.
+
+    Returns:
+        bool: Whether the values of the type cannot change and are compared by value.
+    """
+    is_value_type = _VALUE_TYPES.get(value_type)
+    if is_value_type is None:
+        base_types = (
+            Enum,
+            IPv4Address,
+            IPv6Address,
+            IPv4Network,
+            IPv6Network,
+            IPv4Interface,
+            IPv6Interface,
+            Url,
+            MultiHostUrl,
+        )
+        # The pydantic URL types are only looked up once a URL exists, so pydantic.networks is not imported for it
+        networks = sys.modules.get('pydantic.networks')
+        if networks is not None:
+            base_types += tuple(
+                getattr(networks, name) for name in ('_BaseUrl', '_BaseMultiHostUrl') if hasattr(networks, name)
+            )
+        is_value_type = _VALUE_TYPES[value_type] = issubclass(value_type, base_types)
+    return is_value_type
+
+
+def _fingerprint(value: Any) -> Any:
+    """Get a fingerprint of a value that is equal to a later fingerprint of the same value only if it did not change
+
+    Args:
+        value (Any): Value, such as a pydantic model.
+
+    Returns:
+        Any: The fingerprint, values of types that can change in ways the fingerprint cannot see get a fingerprint that is never equal to another one.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    if isinstance(value, BaseModel):
+        extra = value.__pydantic_extra__
+        return (
+            value_type,
+            tuple(map(_fingerprint, value.__dict__.values())),
+            None if not extra else _fingerprint(extra),
+        )
+    if value_type is list or value_type is tuple or value_type is set or value_type is frozenset:
+        return (value_type, tuple(map(_fingerprint, value)))
+    if value_type is dict:
+        return (dict, tuple(map(_fingerprint, value.keys())), tuple(map(_fingerprint, value.values())))
+    if _is_value_type(value_type):
+        return (value_type, value)
+    return object()
+
+
+async def _call_validate_function(call: Callable[[BaseModel], Any], is_async: bool, validate_model: BaseModel):
+    """Call a synchronous or asynchronous validation function
+
+    Args:
+        call (Callable[[BaseModel], Any]): Callable that runs the validation function on a model instance.
+        is_async (bool): Whether the validation function is asynchronous.
+        validate_model (BaseModel): The pydantic model that needs to be validated.
+    """
+    if is_async:
+        await call(validate_model)
+    else:
+        call(validate_model)
 
 
 class ValidateFields:
@@ -15,72 +139,399 @@ class ValidateFields:
         mode: Literal['args', 'kwargs'] = 'kwargs',
         validate_model: Optional[str] = None,
         validate_model_index: Optional[int] = None,
-        validate_function: str = 'validate_fields',
+        validate_function: Union[str, Sequence[str]] = 'validate_fields',
+        compiled: bool = False,
+        native: bool = False,
+        adaptive: bool = False,
+        deterministic: bool = True,
+        incremental: bool = False,
+        concurrency: Optional[int] = None,
+        error_mode: Literal['first', 'all'] = 'first',
     ):
         """_summary_
 
         Args:
-            mode (Literal[&#39;args&#39;, &#39;kwargs&#39;]): How to obtain the model that needs to be validated.
+            mode (Literal[&#39;args&#39;, &#39;kwargs&#39;]): How to obtain the model that needs to be validated. The parameter is also looked up the other way when the signature of the decorated function allows it.
             validate_model (str, optional): The name of the pydantic model that needs to be validated in the function.
             validate_model_index (int, optional): The index of the pydantic model that needs to be validated in the function.
-            validate_function (str, optional): The name of the validation function defined in the pydantic model. Defaults to 'validate_fields'.
+            validate_function (Union[str, Sequence[str]], optional): The name of the validation function defined in the pydantic model, or a sequence of names. Several validation functions run concurrently when the decorated function is asynchronous and one after another otherwise. Defaults to 'validate_fields'.
+            compiled (bool, optional): Whether to run the validation decorators of the pydantic model through a checker compiled once per model class instead of calling the validation function. The body of the validation function is not run, so it must carry the validation decorators to check, such as a getter decorated with them, otherwise a ValueError is raised when the plan of a model class is resolved. Defaults to False.
+            native (bool, optional): Like compiled, but the validation decorators that allow it are lowered to pydantic-core constraints checked in a single native call, a failure is confirmed by the validation decorators themselves so the errors are the same as in compiled mode. Defaults to False.
+            adaptive (bool, optional): Like compiled, but the validators are reordered at runtime by their measured cost and failure rate, so that cheap validators that fail often run first. Defaults to False.
+            deterministic (bool, optional): Whether adaptive mode reports the same first error as the definition order. Defaults to True.
+            incremental (bool, optional): Like compiled, but the field values that passed each validation decorator are remembered for each model instance, and validating the same instance again only checks the fields whose value changed. Values of immutable types such as str and int are compared by identity, other values are always checked again. Defaults to False.
+            concurrency (Optional[int], optional): Maximum number of validation functions running at the same time. Defaults to None, which runs them all at once.
+            error_mode (Literal[&#39;first&#39;, &#39;all&#39;], optional): How validation failures are reported, 'first' raises the first FieldValidationError and cancels the validation functions still running, 'all' waits for all the validation functions and raises a FieldValidationErrors with every error. Defaults to 'first'.
 
         Raises:
-            ValueError: The validate_model_index cannot be empty in args mode. || The validate_model cannot be empty in kwargs mode.
+            ValueError: The validate_model_index cannot be empty in args mode. || The validate_model cannot be empty in kwargs mode. || The error_mode must be one of first and all.
         """
         if mode == 'args' and validate_model_index is None:
             raise ValueError('The validate_model_index cannot be empty in args mode.')
         elif mode == 'kwargs' and validate_model is None:
             raise ValueError('The validate_model cannot be empty in kwargs mode.')
+        if error_mode not in ('first', 'all'):
+            raise ValueError('The error_mode must be one of first and all.')
         self.mode = mode
         self.validate_model = validate_model
         self.validate_model_index = validate_model_index
         self.validate_function = validate_function
+        self.compiled = compiled
+        self.native = native
+        self.adaptive = adaptive
+        self.deterministic = deterministic
+        self.incremental = incremental
+        self.concurrency = concurrency
+        self.error_mode = error_mode
+        self._validate_functions = (
+            (validate_function,) if isinstance(validate_function, str) else tuple(validate_function)
+        )
+        self._plans: Dict[Type[BaseModel], ValidationPlan] = {}
+        # The plans checked once by `_check_plan` for synchronous functions, so that calls do not check them again
+        self._sync_plans: Dict[Type[BaseModel], ValidationPlan] = {}
+        # The compiled modes check the validation decorators of the validation functions, the default mode calls them
+        self._checks_decorators = compiled or native or adaptive or incremental
+        _VALIDATE_FIELDS.add(self)
+
+    def _get_plan(self, model_class: Type[BaseModel]) -> ValidationPlan:
+        """Get the validation plan of a pydantic model class, the plan is resolved once and cached per class
+
+        Args:
+            model_class (Type[BaseModel]): The pydantic model class.
+
+        Returns:
+            ValidationPlan: The validation plan of the pydantic model class.
+        """
+        plan = self._plans.get(model_class)
+        if plan is None:
+            if self.adaptive:
+                plan = tuple(
+                    (name, get_adaptive_checker(model_class, name, self.deterministic), False)
+                    for name in self._validate_functions
+                )
+            elif self.incremental:
+                plan = tuple(
+                    (name, get_incremental_checker(model_class, name), False) for name in self._validate_functions
+                )
+            elif self.compiled or self.native:
+                plan = tuple(
+                    (name, compile_validators(model_class, name, self.native), False)
+                    for name in self._validate_functions
+                )
+            else:
+                plan = tuple(
+                    (name, methodcaller(name), iscoroutinefunction(getattr(model_class, name)))
+                    for name in self._validate_functions
+                    if callable(getattr(model_class, name, None))
+                )
+            self._plans[model_class] = plan
+        return plan
+
+    def _check_plan(self, func: Callable, plan: ValidationPlan):
+        """Check that a synchronous function does not use asynchronous validation functions
+
+        Args:
+            func (Callable): The decorated function.
+            plan (ValidationPlan): The validation plan of a pydantic model class.
+
+        Raises:
+            FunctionTypeError: A validation function is asynchronous.
+        """
+        for name, _, is_async in plan:
+            if is_async:
+                raise FunctionTypeError(
+                    error=f'The current function {func.__name__}() is a synchronous function. The function {name}() is an asynchronous function and cannot be used in synchronous functions.',
+                    category=RuntimeWarning,
+                )
+
+    def _build_model_getter(self, func: Callable) -> Callable[[tuple, dict], Any]:
+        """Resolve from the signature of the decorated function where the pydantic model is passed
+
+        Args:
+            func (Callable): The decorated function.
+
+        Returns:
+            Callable[[tuple, dict], Any]: Function that gets the model from the positional and keyword arguments.
+        """
+        try:
+            parameters = list(inspect.signature(func).parameters.values())
+        except (TypeError, ValueError):
+            parameters = []
+        positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        keyword_kinds = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        if self.mode == 'args':
+            index = self.validate_model_index
+            name = None
+            if 0 <= index < len(parameters) and all(
+                parameter.kind in positional_kinds for parameter in parameters[: index + 1]
+            ):
+                if parameters[index].kind in keyword_kinds:
+                    name = parameters[index].name
+            if name is None:
+                return lambda args, kwargs: args[index]
+
+            def get_model(args, kwargs):
+                if len(args) > index:
+                    return args[index]
+                return kwargs.get(name)
+
+            return get_model
+        name = self.validate_model
+        index = None
+        for position, parameter in enumerate(parameters):
+            if parameter.kind not in positional_kinds:
+                break
+            if parameter.name == name:
+                if parameter.kind in keyword_kinds:
+                    index = position
+                break
+        if index is None:
+            return lambda args, kwargs: kwargs.get(name)
+
+        def get_model(args, kwargs):
+            if name in kwargs:
+                return kwargs[name]
+            if len(args) > index:
+                return args[index]
+            return None
+
+        return get_model
+
+    def _get_annotated_model_class(self, func: Callable) -> Optional[Type[BaseModel]]:
+        """Get the pydantic model class from the annotation of the model parameter of the decorated function
+
+        Args:
+            func (Callable): The decorated function.
+
+        Returns:
+            Optional[Type[BaseModel]]: The annotated pydantic model class, None if it is not annotated.
+        """
+        try:
+            parameters = list(inspect.signature(func).parameters)
+            type_hints = get_type_hints(func)
+        except Exception:
+            return None
+        if self.mode == 'args':
+            if not 0 <= self.validate_model_index < len(parameters):
+                return None
+            name = parameters[self.validate_model_index]
+        else:
+            name = self.validate_model
+        model_class = type_hints.get(name)
+        if isinstance(model_class, type) and issubclass(model_class, BaseModel):
+            return model_class
+        return None
+
+    def _validate(self, validate_model: BaseModel, func: Callable):
+        """Run the validation functions of a pydantic model one after another
+
+        Args:
+            validate_model (BaseModel): The pydantic model that needs to be validated.
+            func (Callable): The decorated function.
+
+        Raises:
+            FunctionTypeError: A validation function is asynchronous.
+            FieldValidationError: The first field validation error in 'first' error mode.
+            FieldValidationErrors: All the field validation errors in 'all' error mode.
+        """
+        plan = self._sync_plans.get(validate_model.__class__)
+        if plan is None:
+            plan = self._get_plan(validate_model.__class__)
+            self._check_plan(func, plan)
+            self._sync_plans[validate_model.__class__] = plan
+        if self.error_mode == 'first':
+            for _, call, _ in plan:
+                call(validate_model)
+            return
+        errors = []
+        for _, call, _ in plan:
+            try:
+                call(validate_model)
+            except FieldValidationError as e:
+                errors.append(e)
+        if errors:
+            raise FieldValidationErrors(errors)
+
+    async def _validate_async(self, validate_model: BaseModel):
+        """Run the validation functions of a pydantic model concurrently
+
+        Args:
+            validate_model (BaseModel): The pydantic model that needs to be validated.
+
+        Raises:
+            FieldValidationError: The first field validation error in 'first' error mode.
+            FieldValidationErrors: All the field validation errors in 'all' error mode.
+        """
+        plan = self._plans.get(validate_model.__class__)
+        if plan is None:
+            plan = self._get_plan(validate_model.__class__)
+        if len(plan) == 1 and self.error_mode == 'first':
+            _, call, is_async = plan[0]
+            if is_async:
+                await call(validate_model)
+            else:
+                call(validate_model)
+            return
+        semaphore = asyncio.Semaphore(self.concurrency) if self.concurrency else None
+
+        async def run(call: Callable[[BaseModel], Any], is_async: bool):
+            if semaphore is None:
+                return await _call_validate_function(call, is_async, validate_model)
+            async with semaphore:
+                return await _call_validate_function(call, is_async, validate_model)
+
+        tasks = [asyncio.ensure_future(run(call, is_async)) for _, call, is_async in plan]
+        if self.error_mode == 'all':
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            errors: List[FieldValidationError] = []
+            for result in results:
+                if isinstance(result, FieldValidationError):
+                    errors.append(result)
+                elif isinstance(result, BaseException):
+                    raise result
+            if errors:
+                raise FieldValidationErrors(errors)
+        else:
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+    def _scope_fingerprint(self, scope: Dict, validate_model: BaseModel) -> Any:
+        """Get the fingerprint of a model instance, unless it already passed the same validation functions unchanged
+        in a validation scope
+
+        Args:
+            scope (Dict): The models validated in the current validation scope.
+            validate_model (BaseModel): The pydantic model that needs to be validated.
+
+        Returns:
+            Any: The fingerprint to record with `_mark_validated` once the instance passed, None if the validation can be skipped.
+        """
+        fingerprint = _fingerprint(validate_model)
+        validated = scope.get((id(validate_model), self._validate_functions, self._checks_decorators))
+        if validated is not None and validated[0] is validate_model and validated[1] == fingerprint:
+            return None
+        return fingerprint
+
+    def _mark_validated(self, scope: Dict, validate_model: BaseModel, fingerprint: Any):
+        """Record in a validation scope that a model instance passed the validation functions
+
+        Args:
+            scope (Dict): The models validated in the current validation scope.
+            validate_model (BaseModel): The pydantic model that passed validation.
+            fingerprint (Any): The fingerprint of the instance returned by `_scope_fingerprint` before its validation.
+        """
+        scope[(id(validate_model), self._validate_functions, self._checks_decorators)] = (validate_model, fingerprint)
+
+    def _validate_instrumented(self, validate_model: BaseModel, func: Callable):
+        """Run `_validate` and emit a 'validate_fields' event with its duration and outcome
+
+        Args:
+            validate_model (BaseModel): The pydantic model that needs to be validated.
+            func (Callable): The decorated function.
+        """
+        start = perf_counter_ns()
+        passed = False
+        try:
+            self._validate(validate_model, func)
+            passed = True
+        finally:
+            emit(
+                ValidationEvent(
+                    'validate_fields',
+                    validate_model.__class__.__name__,
+                    None,
+                    func.__qualname__,
+                    passed,
+                    perf_counter_ns() - start,
+                )
+            )
+
+    async def _validate_async_instrumented(self, validate_model: BaseModel, func: Callable):
+        """Run `_validate_async` and emit a 'validate_fields' event with its duration and outcome
+
+        Args:
+            validate_model (BaseModel): The pydantic model that needs to be validated.
+            func (Callable): The decorated function.
+        """
+        start = perf_counter_ns()
+        passed = False
+        try:
+            await self._validate_async(validate_model)
+            passed = True
+        finally:
+            emit(
+                ValidationEvent(
+                    'validate_fields',
+                    validate_model.__class__.__name__,
+                    None,
+                    func.__qualname__,
+                    passed,
+                    perf_counter_ns() - start,
+                )
+            )
 
     def __call__(self, func):
         is_async = iscoroutinefunction(func)
+        get_model = self._build_model_getter(func)
+        model_class = self._get_annotated_model_class(func)
+        if model_class is not None:
+            # Resolve the plan of the annotated model class at import time, so that a synchronous function using
+            # asynchronous validation functions is reported once here instead of on every call.
+            plan = self._get_plan(model_class)
+            if not is_async:
+                self._check_plan(func, plan)
+                self._sync_plans[model_class] = plan
         if is_async:
+            validate_async = self._validate_async
 
             @wraps(func)
             async def wrapper(*args, **kwargs):
-                if self.mode == 'args':
-                    validate_model = args[self.validate_model_index]
-                else:
-                    validate_model = kwargs.get(self.validate_model)
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.validate_function):
-                    validate_function = getattr(
-                        validate_model,
-                        self.validate_function,
-                    )
-                    if callable(validate_function):
-                        if iscoroutinefunction(validate_function):
-                            await validate_function()
-                        else:
-                            validate_function()
+                validate_model = get_model(args, kwargs)
+                if isinstance(validate_model, BaseModel):
+                    scope = _validated_models.get()
+                    fingerprint = None if scope is None else self._scope_fingerprint(scope, validate_model)
+                    if scope is None or fingerprint is not None:
+                        try:
+                            if hooks:
+                                await self._validate_async_instrumented(validate_model, func)
+                            else:
+                                await validate_async(validate_model)
+                        except FieldValidationError as e:
+                            if FieldValidationError.keep_traceback:
+                                raise
+                            raise e._strip_traceback()
+                        if scope is not None:
+                            self._mark_validated(scope, validate_model, fingerprint)
                 return await func(*args, **kwargs)
 
             return wrapper
 
         else:
+            validate = self._validate
 
             @wraps(func)
             def wrapper(*args, **kwargs):
-                if self.mode == 'args':
-                    validate_model = args[self.validate_model_index]
-                else:
-                    validate_model = kwargs.get(self.validate_model)
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.validate_function):
-                    validate_function = getattr(
-                        validate_model,
-                        self.validate_function,
-                    )
-                    if callable(validate_function):
-                        if iscoroutinefunction(validate_function):
-                            raise FunctionTypeError(
-                                error=f'The current function {func.__name__}() is a synchronous function. The function {self.validate_function}() is an asynchronous function and cannot be used in synchronous functions.',
-                                category=RuntimeWarning,
-                            )
-                        validate_function()
+                validate_model = get_model(args, kwargs)
+                if isinstance(validate_model, BaseModel):
+                    scope = _validated_models.get()
+                    fingerprint = None if scope is None else self._scope_fingerprint(scope, validate_model)
+                    if scope is None or fingerprint is not None:
+                        try:
+                            if hooks:
+                                self._validate_instrumented(validate_model, func)
+                            else:
+                                validate(validate_model, func)
+                        except FieldValidationError as e:
+                            if FieldValidationError.keep_traceback:
+                                raise
+                            raise e._strip_traceback()
+                        if scope is not None:
+                            self._mark_validated(scope, validate_model, fingerprint)
                 return func(*args, **kwargs)
 
             return wrapper
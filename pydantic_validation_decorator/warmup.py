@@ -0,0 +1,35 @@
+from typing import Sequence, Type
+from pydantic import BaseModel
+from .compiler import get_field_validators
+from .validation import _VALIDATE_FIELDS
+
+
+def warmup(models: Sequence[Type[BaseModel]] = (), batch: bool = False):
+    """Build ahead of the first validation what is otherwise built on first use, so that the first request served
+    does not pay for it
+
+    For each pydantic model class, the validation plans of every ValidateFields decorator whose validation functions
+    the model defines are resolved, which compiles the checkers of the compiled modes, and the validators declared in
+    the model build their lazily computed state, such as the sweep plans of nested models. Regular expressions and
+    network type adapters are already compiled when the validation decorators are created.
+
+    Args:
+        models (Sequence[Type[BaseModel]], optional): The pydantic model classes that will be validated. Defaults to ().
+        batch (bool, optional): Whether to also import validate_many and the NumPy module used to check columns of numbers. Defaults to False.
+    """
+    validate_fields_decorators = list(_VALIDATE_FIELDS)
+    for model_class in models:
+        for validator in get_field_validators(model_class):
+            validator._warmup(model_class)
+        for validate_fields in validate_fields_decorators:
+            # The compiled modes only apply to validation functions that carry validation decorators
+            attribute = '__field_validators__' if validate_fields._checks_decorators else '__call__'
+            if all(
+                hasattr(getattr(model_class, name, None), attribute) for name in validate_fields._validate_functions
+            ):
+                validate_fields._get_plan(model_class)
+    if batch:
+        from .batch import validate_many  # noqa: F401
+        from .size import _import_numpy
+
+        _import_numpy()
@@ -1,77 +1,456 @@
+import copy
 import re
-from asyncio import iscoroutinefunction
-from functools import wraps
-from typing import Optional
+from collections import abc
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Type, Union, get_args, get_origin
+from uuid import UUID
 from pydantic import BaseModel
+from typing_extensions import Annotated
+from .base import BaseFieldValidator
+from .compiler import _UNION_TYPES
 from .exceptions import FieldValidationError
 from .utils import StringUtils
 
 
-class Xss:
+def contains_html_tag(string: str) -> bool:
+    """Detect html tags in a single linear pass, gives the same verdicts as searching Xss.HTML_PATTERN
+
+    Every match of HTML_PATTERN starts with '<' and contains a later '>', and `<[^>]*>` matches as soon as any '<'
+    is followed by a '>', so the string contains a tag if and only if a '>' occurs after its first '<'.
+
+    Args:
+        string (str): String to be scanned.
+
+    Returns:
+        bool: Whether the string contains html tags.
+    """
+    index = string.find('<')
+    return index != -1 and string.find('>', index + 1) != -1
+
+
+def contains_html_tag_bytes(data: Union[bytes, bytearray]) -> bool:
+    """Bytes counterpart of contains_html_tag, the data must use an ASCII compatible encoding such as UTF-8
+
+    Args:
+        data (Union[bytes, bytearray]): Bytes to be scanned.
+
+    Returns:
+        bool: Whether the bytes contain html tags.
+    """
+    index = data.find(b'<')
+    return index != -1 and data.find(b'>', index + 1) != -1
+
+
+def chunks_contain_html_tag(chunks: Iterable[Union[str, bytes]]) -> bool:
+    """Detect html tags across consecutive chunks of a text, stopping at the first chunk that completes a tag
+
+    A tag is found as soon as a '>' follows the first '<', so only whether a '<' has been seen is carried from one
+    chunk to the next and tags split across chunk boundaries are detected without keeping any previous chunk.
+
+    Args:
+        chunks (Iterable[Union[str, bytes]]): Chunks of str or of bytes in an ASCII compatible encoding.
+
+    Returns:
+        bool: Whether the text contains html tags.
+    """
+    seen_open = False
+    for chunk in chunks:
+        open_char, close_char = ('<', '>') if isinstance(chunk, str) else (b'<', b'>')
+        if seen_open:
+            if close_char in chunk:
+                return True
+            continue
+        index = chunk.find(open_char)
+        if index != -1:
+            seen_open = True
+            if chunk.find(close_char, index + 1) != -1:
+                return True
+    return False
+
+
+def read_chunks(stream: Any, chunk_size: int) -> Iterable[Union[str, bytes]]:
+    """Read a stream in chunks of at most chunk_size characters or bytes until it is exhausted
+
+    Args:
+        stream (Any): Readable stream, any object with a read(size) method.
+        chunk_size (int): Size of each read.
+
+    Yields:
+        Union[str, bytes]: The chunks.
+    """
+    read = stream.read
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class Xss(BaseFieldValidator):
     """
     Field Xss Validation Decorator
     """
 
-    HTML_PATTERN = '<(\S*?)[^>]*>.*?|<.*? />'
+    HTML_PATTERN = r'<(\S*?)[^>]*>.*?|<.*? />'
+    _COMPILED_HTML_PATTERN = re.compile(HTML_PATTERN)
 
     def __init__(
         self,
-        field_name: str,
+        field_name: Optional[str] = None,
         message: Optional[str] = None,
+        cache: Optional[bool] = None,
+        engine: Literal['scanner', 'regex'] = 'scanner',
+        streaming: bool = False,
+        chunk_size: int = 65536,
     ):
         """Field Xss Validation Decorator
 
         Args:
-            field_name (str): Field name that need to be validate.
+            field_name (Optional[str], optional): Field name that need to be validate. Defaults to None, which takes the name of the annotated field.
+            message (Optional[str], optional): Prompt message for validation failure. Defaults to None.
+            cache (Optional[bool], optional): Whether to cache the verdicts of field values in the verdict cache. Defaults to None, which follows the global verdict cache setting.
+            engine (Literal[&#39;scanner&#39;, &#39;regex&#39;], optional): How html tags are detected, 'scanner' uses the linear-time scanner and 'regex' searches HTML_PATTERN, which can backtrack heavily on long inputs. Defaults to 'scanner'.
+            streaming (bool, optional): Whether the field value can also be bytes or a readable stream, bytes are scanned in place and streams are read in chunks of chunk_size until the first html tag, so memory stays bounded whatever the size of the value. Streams must be seekable, they are rewound to where the scan started so the value can still be read in full, a non-seekable stream raises ValueError when it is checked instead of being drained. Requires the 'scanner' engine. Defaults to False.
+            chunk_size (int, optional): Number of characters or bytes read from a stream at a time in streaming mode. Defaults to 65536.
+
+        Raises:
+            ValueError: The engine is not one of 'scanner' and 'regex', streaming is used with the 'regex' engine or the chunk size is not positive.
+        """
+        if engine not in ('scanner', 'regex'):
+            raise ValueError('The engine must be one of scanner and regex.')
+        if streaming and engine != 'scanner':
+            raise ValueError('The streaming mode requires the scanner engine.')
+        if chunk_size <= 0:
+            raise ValueError('The chunk size must be positive.')
+        self.field_name = field_name
+        field_label = field_name if field_name is not None else 'value'
+        self.message = message
+        self.cache = cache
+        self.engine = engine
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self._contains_html_tag = contains_html_tag if engine == 'scanner' else self._COMPILED_HTML_PATTERN.search
+        self._message = message if message else f'{field_label} cannot contain script characters.'
+
+    def _is_valid(self, field_value: str) -> bool:
+        return not self._contains_html_tag(field_value)
+
+    def _is_valid_bytes(self, field_value: Union[bytes, bytearray]) -> bool:
+        return not contains_html_tag_bytes(field_value)
+
+    def _is_valid_stream(self, stream: Any) -> bool:
+        # The stream is rewound to where the scan started, so the caller can still read the whole value, a stream that
+        # cannot be rewound would be left drained
+        if getattr(stream, 'seekable', None) is None or not stream.seekable():
+            raise ValueError('The streaming mode requires a seekable stream, the scan would drain it.')
+        position = stream.tell()
+        try:
+            return not chunks_contain_html_tag(read_chunks(stream, self.chunk_size))
+        finally:
+            stream.seek(position)
+
+    def _check(self, field_value: Any) -> Optional[str]:
+        if self.streaming and not isinstance(field_value, str):
+            if isinstance(field_value, (bytes, bytearray)):
+                return None if self._verdict(field_value, self._is_valid_bytes) else self._message
+            if hasattr(field_value, 'read'):
+                return None if self._is_valid_stream(field_value) else self._message
+        if (
+            not StringUtils.is_blank(field_value)
+            and field_value is not None
+            and not self._verdict(field_value, self._is_valid)
+        ):
+            return self._message
+        return None
+
+
+# A node of a sweep plan takes a value and returns None when it contains no html tag, otherwise the path from the
+# value to the first string with an html tag, such as '[2].title', and that string.
+SweepNode = Callable[[Any], Optional[Tuple[str, str]]]
+
+_SEQUENCE_ORIGINS = (list, tuple, set, frozenset, abc.Sequence, abc.MutableSequence, abc.Set, abc.MutableSet)
+_MAPPING_ORIGINS = (dict, abc.Mapping, abc.MutableMapping)
+# Annotations whose values never contain strings, their subtrees are skipped without looking at the values
+_ATOMIC_TYPES = (bool, int, float, complex, Decimal, bytes, bytearray, date, datetime, time, timedelta, UUID, Enum)
+_SWEEP_NODES: Dict[Tuple[Callable[[str], Any], Any], Optional[SweepNode]] = {}
+_MODEL_SWEEP_PLANS: Dict[Tuple[Callable[[str], Any], Type[BaseModel]], Tuple[Tuple[str, SweepNode], ...]] = {}
+
+
+def _text_node(detector: Callable[[str], Any]) -> SweepNode:
+    def scan_text(value: Any) -> Optional[Tuple[str, str]]:
+        if isinstance(value, str) and detector(value):
+            return '', value
+        return None
+
+    return scan_text
+
+
+def _items_node(item_node: SweepNode) -> SweepNode:
+    def scan_items(value: Any) -> Optional[Tuple[str, str]]:
+        if isinstance(value, (list, tuple, set, frozenset)):
+            for index, item in enumerate(value):
+                found = item_node(item)
+                if found is not None:
+                    return f'[{index}]{found[0]}', found[1]
+        return None
+
+    return scan_items
+
+
+def _mapping_node(key_node: Optional[SweepNode], value_node: Optional[SweepNode]) -> SweepNode:
+    def scan_mapping(value: Any) -> Optional[Tuple[str, str]]:
+        if isinstance(value, dict):
+            for key, item in value.items():
+                found = None
+                if key_node is not None:
+                    found = key_node(key)
+                if found is None and value_node is not None:
+                    found = value_node(item)
+                if found is not None:
+                    return f'[{key!r}]{found[0]}', found[1]
+        return None
+
+    return scan_mapping
+
+
+def _model_node(detector: Callable[[str], Any]) -> SweepNode:
+    # The plan is looked up by the class of the value, so subclasses and self-referencing models are handled
+    plans: Dict[Type[BaseModel], Tuple[Tuple[str, SweepNode], ...]] = {}
+
+    def scan_model(value: Any) -> Optional[Tuple[str, str]]:
+        if isinstance(value, BaseModel):
+            values = value.__dict__
+            plan = plans.get(value.__class__)
+            if plan is None:
+                plan = plans[value.__class__] = get_model_sweep_plan(detector, value.__class__)
+            for field_name, field_node in plan:
+                field_value = values.get(field_name)
+                if field_value is not None:
+                    found = field_node(field_value)
+                    if found is not None:
+                        return f'.{field_name}{found[0]}', found[1]
+        return None
+
+    return scan_model
+
+
+def _any_node(detector: Callable[[str], Any]) -> SweepNode:
+    scan_text = _text_node(detector)
+    scan_model = _model_node(detector)
+
+    def scan_any(value: Any) -> Optional[Tuple[str, str]]:
+        if isinstance(value, str):
+            return scan_text(value)
+        if isinstance(value, BaseModel):
+            return scan_model(value)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return scan_items(value)
+        if isinstance(value, dict):
+            return scan_mapping(value)
+        return None
+
+    scan_items = _items_node(scan_any)
+    scan_mapping = _mapping_node(scan_any, scan_any)
+    return scan_any
+
+
+def get_sweep_node(detector: Callable[[str], Any], annotation: Any) -> Optional[SweepNode]:
+    """Get the node that sweeps the values of an annotation, the node is built once and cached per annotation
+
+    Args:
+        detector (Callable[[str], Any]): Function that detects html tags in a string.
+        annotation (Any): The annotation of a field, Any for values of unknown type.
+
+    Returns:
+        Optional[SweepNode]: The node, None when the values of the annotation never contain strings.
+    """
+    try:
+        return _SWEEP_NODES[(detector, annotation)]
+    except KeyError:
+        pass
+    except TypeError:
+        return _build_sweep_node(detector, annotation)
+    node = _SWEEP_NODES[(detector, annotation)] = _build_sweep_node(detector, annotation)
+    return node
+
+
+def _build_sweep_node(detector: Callable[[str], Any], annotation: Any) -> Optional[SweepNode]:
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Annotated:
+        return get_sweep_node(detector, args[0])
+    if origin is Literal or annotation is type(None):
+        return None
+    if origin in _UNION_TYPES:
+        nodes = [get_sweep_node(detector, arg) for arg in args if arg is not type(None)]
+        nodes = [node for node in nodes if node is not None]
+        if not nodes:
+            return None
+        return nodes[0] if len(nodes) == 1 else get_sweep_node(detector, Any)
+    if origin in _SEQUENCE_ORIGINS:
+        if origin is tuple and args and (len(args) != 2 or args[1] is not Ellipsis):
+            # Tuples of fixed length may hold a different type at each position
+            if all(get_sweep_node(detector, arg) is None for arg in args):
+                return None
+            return get_sweep_node(detector, Any)
+        item_node = get_sweep_node(detector, args[0] if args else Any)
+        return None if item_node is None else _items_node(item_node)
+    if origin in _MAPPING_ORIGINS:
+        key_node = get_sweep_node(detector, args[0] if args else Any)
+        value_node = get_sweep_node(detector, args[1] if len(args) > 1 else Any)
+        return None if key_node is None and value_node is None else _mapping_node(key_node, value_node)
+    if isinstance(annotation, type) and origin is None:
+        if issubclass(annotation, str):
+            return _text_node(detector)
+        if issubclass(annotation, BaseModel):
+            return _model_node(detector)
+        if issubclass(annotation, _ATOMIC_TYPES):
+            return None
+        if annotation in (list, tuple, set, frozenset):
+            return _items_node(get_sweep_node(detector, Any))
+        if annotation is dict:
+            return _mapping_node(get_sweep_node(detector, Any), get_sweep_node(detector, Any))
+    return _any_node(detector)
+
+
+def get_model_sweep_plan(
+    detector: Callable[[str], Any], model_class: Type[BaseModel]
+) -> Tuple[Tuple[str, SweepNode], ...]:
+    """Get the fields of a pydantic model class that may contain strings, with the node that sweeps each of them
+
+    Args:
+        detector (Callable[[str], Any]): Function that detects html tags in a string.
+        model_class (Type[BaseModel]): The pydantic model class.
+
+    Returns:
+        Tuple[Tuple[str, SweepNode], ...]: Field names and nodes, in the order of the fields.
+    """
+    plan = _MODEL_SWEEP_PLANS.get((detector, model_class))
+    if plan is None:
+        plan = tuple(
+            (field_name, node)
+            for field_name, field_info in model_class.model_fields.items()
+            for node in (get_sweep_node(detector, field_info.annotation),)
+            if node is not None
+        )
+        _MODEL_SWEEP_PLANS[(detector, model_class)] = plan
+    return plan
+
+
+def _nested_model_classes(annotation: Any) -> List[Type[BaseModel]]:
+    """Get the pydantic model classes that appear in an annotation, such as Item in Optional[List[Item]]
+
+    Args:
+        annotation (Any): The annotation of a field.
+
+    Returns:
+        List[Type[BaseModel]]: The pydantic model classes.
+    """
+    if isinstance(annotation, type) and get_origin(annotation) is None and issubclass(annotation, BaseModel):
+        return [annotation]
+    return [model_class for arg in get_args(annotation) for model_class in _nested_model_classes(arg)]
+
+
+class XssSweep(BaseFieldValidator):
+    """
+    Model Xss Sweep Validation Decorator
+    """
+
+    # Html tag detectors shared by all sweeps, so that sweep plans are built once per engine
+    _DETECTORS: Dict[str, Callable[[str], Any]] = {
+        'scanner': contains_html_tag,
+        'regex': Xss._COMPILED_HTML_PATTERN.search,
+    }
+    expands_fields = True
+
+    def __init__(
+        self,
+        field_name: Optional[str] = None,
+        message: Optional[str] = None,
+        engine: Literal['scanner', 'regex'] = 'scanner',
+    ):
+        """Model Xss Sweep Validation Decorator, checks every string of a model, its nested models, lists and dicts
+
+        The traversal plan of each model class is computed once from model_fields, and fields whose annotation can
+        not hold strings, such as int or List[int], are skipped without reading their values.
+
+        Args:
+            field_name (Optional[str], optional): Field name whose value needs to be swept. Defaults to None, which sweeps every field of the model.
             message (Optional[str], optional): Prompt message for validation failure. Defaults to None.
+            engine (Literal[&#39;scanner&#39;, &#39;regex&#39;], optional): How html tags are detected, see Xss. Defaults to 'scanner'.
+
+        Raises:
+            ValueError: The engine is not one of 'scanner' and 'regex'.
         """
+        if engine not in self._DETECTORS:
+            raise ValueError('The engine must be one of scanner and regex.')
         self.field_name = field_name
         self.message = message
+        self.engine = engine
+        self._annotation = Any
+        self._node = get_sweep_node(self._DETECTORS[engine], Any)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Plan nodes are closures, they are rebuilt from the annotation after unpickling
+        state = self.__dict__.copy()
+        state.pop('_node', None)
+        state.pop('_bound_validators', None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._node = get_sweep_node(self._DETECTORS[self.engine], self._annotation)
+
+    def _expand(self, model_class: Type[BaseModel]) -> Tuple[BaseFieldValidator, ...]:
+        model_fields = model_class.model_fields
+        field_names = model_fields if self.field_name is None else (self.field_name,)
+        validators = []
+        for field_name in field_names:
+            field_info = model_fields.get(field_name)
+            annotation = field_info.annotation if field_info is not None else Any
+            node = get_sweep_node(self._DETECTORS[self.engine], annotation)
+            if node is not None:
+                validator = copy.copy(self)
+                validator.__dict__.pop('_bound_validators', None)
+                validator.field_name = field_name
+                validator._annotation = annotation
+                validator._node = node
+                validators.append(validator)
+        return tuple(validators)
+
+    def _warmup(self, model_class: Type[BaseModel]):
+        # Sweep plans of nested models are otherwise built the first time a value of their class is swept
+        detector = self._DETECTORS[self.engine]
+        pending = [model_class]
+        seen = set()
+        while pending:
+            klass = pending.pop()
+            if klass in seen:
+                continue
+            seen.add(klass)
+            get_model_sweep_plan(detector, klass)
+            for field_info in klass.model_fields.values():
+                pending.extend(_nested_model_classes(field_info.annotation))
+
+    def _path(self, found_path: str) -> str:
+        if self.field_name is not None:
+            return f'{self.field_name}{found_path}'
+        return found_path[1:] if found_path.startswith('.') else f'value{found_path}'
+
+    def _check(self, field_value: Any) -> Optional[str]:
+        found = self._node(field_value)
+        if found is None:
+            return None
+        return self.message if self.message else f'{self._path(found[0])} cannot contain script characters.'
 
-    def __call__(self, func):
-        is_async = iscoroutinefunction(func)
-        if is_async:
-
-            @wraps(func)
-            async def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if not StringUtils.is_blank(field_value) and field_value is not None:
-                        pattern = re.compile(self.HTML_PATTERN)
-                        if pattern.search(field_value):
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} cannot contain script characters.',
-                            )
-                return await func(*args, **kwargs)
-
-            return wrapper
-
-        else:
-
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                validate_model = args[0]
-                if isinstance(validate_model, BaseModel) and hasattr(validate_model, self.field_name):
-                    field_value = getattr(validate_model, self.field_name)
-                    if not StringUtils.is_blank(field_value) and field_value is not None:
-                        pattern = re.compile(self.HTML_PATTERN)
-                        if pattern.search(field_value):
-                            raise FieldValidationError(
-                                model_name=validate_model.__class__.__name__,
-                                field_name=self.field_name,
-                                field_value=field_value,
-                                validator=self.__class__.__name__,
-                                message=self.message
-                                if self.message
-                                else f'{self.field_name} cannot contain script characters.',
-                            )
-                return func(*args, **kwargs)
-
-            return wrapper
+    def _error(self, model_name: Optional[str], field_value: Any, message: str) -> FieldValidationError:
+        found = self._node(field_value)
+        return FieldValidationError(
+            model_name=model_name,
+            field_name=self._path(found[0]) if found is not None else self.field_name,
+            field_value=found[1] if found is not None else field_value,
+            validator=self.__class__.__name__,
+            message=message,
+        )
@@ -0,0 +1,64 @@
+import asyncio
+from pydantic_validation_decorator import (
+    ValidateFields,
+    Network,
+    NotBlank,
+    Size,
+    Xss,
+    FieldValidationError,
+)
+from pydantic import BaseModel
+from typing import Optional
+
+
+class AdaptiveTestModel(BaseModel):
+    callback_url: Optional[str] = None
+    remark: Optional[str] = None
+    order_no: Optional[str] = None
+
+    # The adaptive mode reorders the validation decorators of the validation function
+    @Network(field_name='callback_url', field_type='HttpUrl')
+    @Xss(field_name='remark')
+    @NotBlank(field_name='order_no', message='order_no cannot be blank')
+    @Size(field_name='order_no', max_length=16)
+    def validate_fields(self):
+        pass
+
+
+@ValidateFields(validate_model='adaptive_test', adaptive=True)
+def adaptive_validate_fields(adaptive_test: AdaptiveTestModel):
+    return adaptive_test.model_dump()
+
+
+def main():
+    rejected = 0
+    for _ in range(1000):
+        try:
+            adaptive_validate_fields(adaptive_test=AdaptiveTestModel(callback_url='https://example.com/callback'))
+        except FieldValidationError:
+            rejected += 1
+    print({'rejected': rejected})
+    try:
+        adaptive_validate_fields(adaptive_test=AdaptiveTestModel(callback_url='example', remark='<script>'))
+    except FieldValidationError as e:
+        print(e.__dict__)
+
+
+@ValidateFields(mode='args', validate_model_index=0, adaptive=True, deterministic=False)
+async def async_adaptive_validate_fields(
+    adaptive_test: AdaptiveTestModel,
+):
+    return adaptive_test.model_dump()
+
+
+async def async_main():
+    adaptive_test = AdaptiveTestModel(callback_url='https://example.com/callback', order_no='SO202405010001')
+    try:
+        print(await async_adaptive_validate_fields(adaptive_test))
+    except FieldValidationError as e:
+        print(e.__dict__)
+
+
+if __name__ == '__main__':
+    main()
+    asyncio.run(async_main())
@@ -0,0 +1,55 @@
+from pydantic_validation_decorator import Network, NotBlank, Pattern, Size, Xss, FieldValidationError, validate_many
+from pydantic import BaseModel, TypeAdapter
+from typing import Optional
+from typing_extensions import Annotated
+
+
+class AnnotatedTestModel(BaseModel):
+    user_name: Annotated[str, NotBlank(), Size(max_length=8)]
+    nick_name: Annotated[Optional[str], Xss()] = None
+    email: Annotated[Optional[str], Network(field_type='EmailStr', message='wrong email')] = None
+    phone: Annotated[Optional[str], Pattern(regexp=r'^1[3-9]\d{9}$')] = None
+
+
+def main():
+    print(AnnotatedTestModel(user_name='insist', nick_name='insistence', email='a@example.com', phone='13800000000'))
+    for data in (
+        {'user_name': ''},
+        {'user_name': 'insistence'},
+        {'user_name': 'insist', 'nick_name': '<script>alert(1)</script>'},
+        {'user_name': 'insist', 'email': 'not an email'},
+        {'user_name': 'insist', 'phone': '123'},
+    ):
+        try:
+            AnnotatedTestModel(**data)
+        except FieldValidationError as e:
+            print(e.model_name, e.field_name, e.field_value, e.validator, e.message)
+
+    # Rules can be used on their own
+    print(Size(field_name='age', ge=0).check(18))
+    try:
+        Size(field_name='age', ge=0).check(-1)
+    except FieldValidationError as e:
+        print(e.model_name, e.field_name, e.field_value, e.validator, e.message)
+    try:
+        TypeAdapter(Annotated[str, Pattern(regexp=r'^\d+$')]).validate_python('abc')
+    except FieldValidationError as e:
+        print(e.model_name, e.field_name, e.field_value, e.validator, e.message)
+
+    # Without an annotated field the field name cannot be taken from pydantic
+    try:
+
+        @NotBlank()
+        def get_user_name(self):
+            return self.user_name
+
+    except ValueError as e:
+        print(e)
+    try:
+        validate_many([AnnotatedTestModel(user_name='insist')], rules=[Size(gt=0)])
+    except ValueError as e:
+        print(e)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import warnings
+from pydantic_validation_decorator import ValidateFields, NotBlank, FieldValidationError
+from pydantic_validation_decorator.exceptions import FunctionTypeError
+from pydantic import BaseModel
+from typing import Optional
+
+
+class BoundTestModel(BaseModel):
+    user_name: Optional[str] = None
+
+    @NotBlank(field_name='user_name', message='user_name cannot be blank')
+    def get_user_name(self):
+        return self.user_name
+
+    def validate_fields(self):
+        self.get_user_name()
+
+
+class AsyncBoundTestModel(BaseModel):
+    user_name: Optional[str] = None
+
+    async def validate_fields(self):
+        pass
+
+
+@ValidateFields(validate_model='bound_test')
+def bound_validate_kwargs(bound_test: BoundTestModel):
+    return bound_test.model_dump()
+
+
+@ValidateFields(mode='args', validate_model_index=1)
+def bound_validate_args(prefix: str, bound_test: BoundTestModel):
+    return prefix, bound_test.model_dump()
+
+
+checks = {'count': 0}
+
+
+class CountingValidateFields(ValidateFields):
+    def _check_plan(self, func, plan):
+        checks['count'] += 1
+        super()._check_plan(func, plan)
+
+
+@CountingValidateFields(validate_model='bound_test')
+def counted_validate_annotated(bound_test: BoundTestModel):
+    return bound_test.model_dump()
+
+
+@CountingValidateFields(validate_model='bound_test')
+def counted_validate_unannotated(bound_test):
+    return bound_test.model_dump()
+
+
+def main():
+    # The model is found whether it is passed by keyword or by position
+    for call in (
+        lambda model: bound_validate_kwargs(bound_test=model),
+        lambda model: bound_validate_kwargs(model),
+        lambda model: bound_validate_args('user', model),
+        lambda model: bound_validate_args('user', bound_test=model),
+    ):
+        print(call(BoundTestModel(user_name='insistence')))
+        try:
+            call(BoundTestModel(user_name=''))
+        except FieldValidationError as e:
+            print(e.message)
+
+    # A synchronous function annotated with a model using an asynchronous validation function fails when decorated
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        try:
+
+            @ValidateFields(validate_model='bound_test')
+            def bound_validate_mismatch(bound_test: AsyncBoundTestModel):
+                return bound_test.model_dump()
+
+            print('mismatch not detected')
+        except FunctionTypeError:
+            print('mismatch detected at decoration time')
+
+    # The plan of an annotated model is checked when decorated, the plan of another model on its first call
+    print(checks['count'])
+    for _ in range(3):
+        counted_validate_annotated(bound_test=BoundTestModel(user_name='insistence'))
+        counted_validate_unannotated(bound_test=BoundTestModel(user_name='insistence'))
+    print(checks['count'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+import asyncio
+from pydantic_validation_decorator import (
+    ValidateFields,
+    NotBlank,
+    Pattern,
+    Size,
+    Xss,
+    FieldValidationError,
+    compile_validators,
+)
+from pydantic import BaseModel
+from pydantic_validation_decorator.compiler import get_field_validators
+from functools import wraps
+from typing import Optional
+
+
+class CompiledTestModel(BaseModel):
+    user_name: Optional[str] = None
+    nick_name: Optional[str] = None
+    age: Optional[int] = None
+
+    @NotBlank(field_name='user_name', message='user_name cannot be blank')
+    @Size(field_name='user_name', max_length=10, message='The length of the user_name cannot exceed 10 characters')
+    @Pattern(field_name='user_name', regexp='^[a-z][a-z0-9-]*$')
+    def get_user_name(self):
+        return self.user_name
+
+    @Xss(field_name='nick_name')
+    def get_nick_name(self):
+        return self.nick_name
+
+    @Size(field_name='age', gt=0, le=150)
+    def get_age(self):
+        return self.age
+
+    def validate_fields(self):
+        self.get_user_name()
+        self.get_nick_name()
+        self.get_age()
+
+
+@ValidateFields(
+    validate_model='compiled_test', validate_function=('get_user_name', 'get_nick_name', 'get_age'), compiled=True
+)
+def compiled_validate_fields(compiled_test: CompiledTestModel):
+    return compiled_test.model_dump()
+
+
+@ValidateFields(validate_model='compiled_test', validate_function='get_age', compiled=True)
+def compiled_validate_age(compiled_test: CompiledTestModel):
+    return compiled_test.model_dump()
+
+
+@ValidateFields(
+    validate_model='compiled_test', validate_function=('get_user_name', 'get_nick_name', 'get_age'), native=True
+)
+def native_validate_fields(compiled_test: CompiledTestModel):
+    return compiled_test.model_dump()
+
+
+class FloatBoundTestModel(BaseModel):
+    score: Optional[float] = None
+
+    # The bound is not a float, so it is not lowered to the native float schema
+    @Size(field_name='score', ge=2**53 + 1)
+    def get_score(self):
+        return self.score
+
+
+class SharedRuleTestModel(BaseModel):
+    user_name: Optional[str] = None
+
+    # The rule shared by both getters is checked once when the rules of every method are collected
+    @NotBlank(field_name='user_name')
+    def get_user_name(self):
+        return self.user_name
+
+    @NotBlank(field_name='user_name')
+    @Size(field_name='user_name', max_length=10)
+    def get_display_name(self):
+        return self.user_name
+
+    def validate_fields(self):
+        self.get_user_name()
+
+
+calls = []
+
+
+def logged(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        calls.append(func.__name__)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class ForeignDecoratorTestModel(BaseModel):
+    user_name: Optional[str] = None
+
+    # A decorator between two validation decorators is kept, and both validation decorators still run
+    @Size(field_name='user_name', max_length=10)
+    @logged
+    @NotBlank(field_name='user_name')
+    def get_user_name(self):
+        return self.user_name
+
+
+def main():
+    for compiled_test in [
+        CompiledTestModel(user_name='insistence', nick_name='test', age=18),
+        CompiledTestModel(user_name='Insistence'),
+        CompiledTestModel(user_name='insistence', nick_name='<script>'),
+        CompiledTestModel(user_name='insistence', age=0),
+    ]:
+        for validate_fields in (compiled_validate_fields, native_validate_fields):
+            try:
+                print(validate_fields(compiled_test=compiled_test))
+            except FieldValidationError as e:
+                print(e.__dict__)
+    print(compiled_validate_age(compiled_test=CompiledTestModel(user_name='', age=18)))
+
+    for native in (False, True):
+        try:
+            compile_validators(FloatBoundTestModel, native=native)(FloatBoundTestModel(score=float(2**53)))
+            print('passed')
+        except FieldValidationError as e:
+            print(e.message)
+
+    print([validator.__class__.__name__ for validator in get_field_validators(SharedRuleTestModel)])
+    # The body of a plain validation function is not run by the compiled modes, so it cannot be compiled
+    try:
+        compile_validators(SharedRuleTestModel, 'validate_fields')
+    except ValueError as e:
+        print(e)
+
+    for user_name in ('insistence', 'insistence-test', ''):
+        try:
+            print(ForeignDecoratorTestModel(user_name=user_name).get_user_name())
+        except FieldValidationError as e:
+            print(e.message)
+    print(calls)
+
+
+@ValidateFields(mode='args', validate_model_index=0, validate_function='get_user_name', compiled=True)
+async def async_compiled_validate_fields(
+    compiled_test: CompiledTestModel,
+):
+    return compiled_test.model_dump()
+
+
+async def async_main():
+    compiled_test = CompiledTestModel(user_name='insistence-test')
+    try:
+        print(await async_compiled_validate_fields(compiled_test))
+    except FieldValidationError as e:
+        print(e.__dict__)
+
+
+if __name__ == '__main__':
+    main()
+    asyncio.run(async_main())
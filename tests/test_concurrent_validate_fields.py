@@ -0,0 +1,73 @@
+import asyncio
+import time
+from pydantic_validation_decorator import (
+    ValidateFields,
+    FieldValidationError,
+    FieldValidationErrors,
+)
+from pydantic import BaseModel
+from typing import Optional
+
+
+class ConcurrentTestModel(BaseModel):
+    customer_id: Optional[int] = None
+    product_id: Optional[int] = None
+    coupon_code: Optional[str] = None
+
+    async def check_customer(self):
+        await asyncio.sleep(0.1)
+        if self.customer_id is None or self.customer_id <= 0:
+            raise FieldValidationError(
+                model_name=self.__class__.__name__,
+                field_name='customer_id',
+                field_value=self.customer_id,
+                validator='check_customer',
+                message='customer does not exist',
+            )
+
+    async def check_product(self):
+        await asyncio.sleep(0.1)
+        if self.product_id is None or self.product_id <= 0:
+            raise FieldValidationError(
+                model_name=self.__class__.__name__,
+                field_name='product_id',
+                field_value=self.product_id,
+                validator='check_product',
+                message='product does not exist',
+            )
+
+    async def check_coupon(self):
+        await asyncio.sleep(0.1)
+
+
+@ValidateFields(validate_model='concurrent_test', validate_function=('check_customer', 'check_product', 'check_coupon'))
+async def concurrent_validate_first(concurrent_test: ConcurrentTestModel):
+    return concurrent_test.model_dump()
+
+
+@ValidateFields(
+    validate_model='concurrent_test',
+    validate_function=('check_customer', 'check_product', 'check_coupon'),
+    concurrency=2,
+    error_mode='all',
+)
+async def concurrent_validate_all(concurrent_test: ConcurrentTestModel):
+    return concurrent_test.model_dump()
+
+
+async def async_main():
+    start = time.perf_counter()
+    print(await concurrent_validate_first(concurrent_test=ConcurrentTestModel(customer_id=1, product_id=1)))
+    print({'concurrent': time.perf_counter() - start < 0.25})
+    try:
+        await concurrent_validate_first(concurrent_test=ConcurrentTestModel(customer_id=1))
+    except FieldValidationError as e:
+        print(e.__dict__)
+    try:
+        await concurrent_validate_all(concurrent_test=ConcurrentTestModel())
+    except FieldValidationErrors as e:
+        print([error.message for error in e.errors])
+
+
+if __name__ == '__main__':
+    asyncio.run(async_main())
@@ -0,0 +1,94 @@
+import traceback
+from pydantic_validation_decorator import (
+    ValidateFields,
+    NotBlank,
+    Size,
+    FieldValidationError,
+    FieldValidationErrors,
+)
+from pydantic import BaseModel
+from typing import Optional
+
+
+class ErrorTestModel(BaseModel):
+    user_name: Optional[str] = None
+    avatar: Optional[bytes] = None
+    nick_name: Optional[str] = None
+
+    @Size(field_name='user_name', max_length=4)
+    def get_user_name(self):
+        return self.user_name
+
+    @Size(field_name='avatar', max_length=4)
+    def get_avatar(self):
+        return self.avatar
+
+    @NotBlank(field_name='nick_name')
+    def get_nick_name(self):
+        return self.nick_name
+
+    def validate_fields(self):
+        try:
+            int(self.user_name or '')
+        except ValueError:
+            # The error is raised while another one is handled, so it has a context
+            self.get_user_name()
+        self.get_avatar()
+
+
+@ValidateFields(validate_model='error_test')
+def error_validate(error_test: ErrorTestModel):
+    return 'passed'
+
+
+@ValidateFields(validate_model='error_test', validate_function=('get_user_name', 'get_nick_name'), error_mode='all')
+def error_validate_all(error_test: ErrorTestModel):
+    return 'passed'
+
+
+def frame_names(error: BaseException):
+    return [frame.name for frame in traceback.extract_tb(error.__traceback__)]
+
+
+def main():
+    # Long str and bytes field values are stored truncated
+    FieldValidationError.max_field_value_length = 8
+    try:
+        for data in ({'user_name': 'insistence-insistence'}, {'avatar': b'0123456789abcdef'}):
+            try:
+                error_validate(error_test=ErrorTestModel(**data))
+            except FieldValidationError as e:
+                print(e.field_name, repr(e.field_value), e.message)
+    finally:
+        FieldValidationError.max_field_value_length = None
+    try:
+        error_validate(error_test=ErrorTestModel(user_name='insistence-insistence'))
+    except FieldValidationError as e:
+        print(e.field_name, repr(e.field_value))
+
+    for keep_traceback in (True, False):
+        FieldValidationError.keep_traceback = keep_traceback
+        try:
+            try:
+                error_validate(error_test=ErrorTestModel(user_name='insistence'))
+            except FieldValidationError as e:
+                print(
+                    keep_traceback,
+                    type(e.__context__).__name__,
+                    'validate_fields' in frame_names(e),
+                )
+            try:
+                error_validate_all(error_test=ErrorTestModel(user_name='insistence', nick_name=''))
+            except FieldValidationErrors as e:
+                print(
+                    keep_traceback,
+                    [error.field_name for error in e.errors],
+                    [error.__traceback__ is None for error in e.errors],
+                    [error.__context__ is None for error in e.errors],
+                )
+        finally:
+            FieldValidationError.keep_traceback = True
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+import re
+from pydantic_validation_decorator import (
+    ValidateFields,
+    Pattern,
+    FieldValidationError,
+    ValidationStats,
+    add_hook,
+    remove_hook,
+)
+from pydantic_validation_decorator.pattern import FusedPattern
+from pydantic import BaseModel
+from typing import Optional
+
+
+class FusedPatternTestModel(BaseModel):
+    code: Optional[str] = None
+    slug: Optional[str] = None
+    tag: Optional[str] = None
+
+    @Pattern(field_name='code', regexp='[A-Z]{3}', message='code must start with three capital letters')
+    @Pattern(field_name='code', regexp='[A-Z0-9-]+', match_mode='fullmatch', message='code has invalid characters')
+    @Pattern(field_name='code', regexp=r'\w{3}-\d{4}', message='code must look like ABC-1234')
+    def get_code(self):
+        return self.code
+
+    @Pattern(field_name='slug', regexp='[a-z-]+', flags=re.IGNORECASE, match_mode='fullmatch')
+    @Pattern(field_name='slug', regexp=r'(\w)\1', message='slug must start with a doubled letter')
+    def get_slug(self):
+        return self.slug
+
+    # A global inline flag group is only allowed at the start of a regular expression, so this rule is not fused
+    @Pattern(field_name='tag', regexp='(?i)tag-', message='tag must start with tag-')
+    @Pattern(field_name='tag', regexp='[a-z-]+', match_mode='fullmatch', message='tag must be lowercase')
+    def get_tag(self):
+        return self.tag
+
+    def validate_fields(self):
+        self.get_code()
+        self.get_slug()
+        self.get_tag()
+
+
+@ValidateFields(validate_model='fused_pattern_test')
+def fused_pattern_validate(fused_pattern_test: FusedPatternTestModel):
+    return 'passed'
+
+
+@ValidateFields(
+    validate_model='fused_pattern_test', validate_function=('get_code', 'get_slug', 'get_tag'), compiled=True
+)
+def compiled_fused_pattern_validate(fused_pattern_test: FusedPatternTestModel):
+    return 'passed'
+
+
+def main():
+    print([validator.__class__.__name__ for validator in FusedPatternTestModel.get_code.__field_validators__])
+    print(Pattern(field_name='tag', regexp='(?i)tag-')._fusable())
+    # The rules run one after another when the combined regular expression cannot be compiled
+    fused_pattern = FusedPattern(
+        (
+            Pattern(field_name='tag', regexp='(?i)tag-'),
+            Pattern(field_name='tag', regexp='[a-z-]+', match_mode='fullmatch'),
+        )
+    )
+    print([fused_pattern._check(value) for value in ('tag-a', 'TAG-', 'label')])
+    for data in (
+        {'code': 'ABC-1234', 'slug': 'AAbc'},
+        {'code': 'abc-1234'},
+        {'code': 'ABC_1234'},
+        {'code': 'ABC-12'},
+        {'slug': 'a_b'},
+        {'slug': 'abc'},
+        {'tag': 'tag-a'},
+        {'tag': 'TAG-'},
+        {'tag': 'label'},
+    ):
+        for function in (fused_pattern_validate, compiled_fused_pattern_validate):
+            try:
+                print(function(fused_pattern_test=FusedPatternTestModel(**data)))
+            except FieldValidationError as e:
+                print(e.field_name, e.validator, e.message)
+
+    # Hooks receive one event per Pattern rule, also when the rules are fused
+    stats = ValidationStats()
+    add_hook(stats)
+    try:
+        for function in (fused_pattern_validate, compiled_fused_pattern_validate):
+            try:
+                function(fused_pattern_test=FusedPatternTestModel(code='ABC-12'))
+            except FieldValidationError:
+                pass
+    finally:
+        remove_hook(stats)
+    for entry in sorted(stats.snapshot(), key=lambda entry: (entry['kind'], str(entry['field_name']))):
+        print(entry['kind'], entry['field_name'], entry['validator'], entry['calls'], entry['failures'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+import gc
+from pydantic_validation_decorator import ValidateFields, Network, Size, Xss, FieldValidationError
+from pydantic import BaseModel, ConfigDict
+from pydantic_validation_decorator.compiler import get_incremental_checker
+from typing import List, Optional
+
+
+checks = {'bio': 0, 'tags': 0}
+
+
+class CountingXss(Xss):
+    def _check(self, field_value):
+        checks[self.field_name] += 1
+        return super()._check(field_value)
+
+
+class CountingSize(Size):
+    def _check(self, field_value):
+        checks[self.field_name] += 1
+        return super()._check(field_value)
+
+
+class IncrementalTestModel(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    email: Optional[str] = None
+    bio: Optional[str] = None
+    tags: List[str] = []
+
+    @Network(field_name='email', field_type='EmailStr')
+    @CountingXss(field_name='bio')
+    @CountingSize(field_name='tags', max_length=2)
+    def validate_fields(self):
+        pass
+
+
+@ValidateFields(validate_model='incremental_test', incremental=True)
+def incremental_validate(incremental_test: IncrementalTestModel):
+    return 'passed'
+
+
+def main():
+    incremental_test = IncrementalTestModel(email='insistence@example.com', bio='insistence', tags=['a'])
+    print(incremental_validate(incremental_test=incremental_test), checks)
+    # Unchanged str fields are skipped, the list field is checked again
+    print(incremental_validate(incremental_test=incremental_test), checks)
+    incremental_test.bio = '<b>insistence</b>'
+    try:
+        incremental_validate(incremental_test=incremental_test)
+    except FieldValidationError as e:
+        print(e.field_name, e.message, checks)
+    incremental_test.bio = 'insistence'
+    print(incremental_validate(incremental_test=incremental_test), checks)
+    incremental_test.tags.extend(['b', 'c'])
+    try:
+        incremental_validate(incremental_test=incremental_test)
+    except FieldValidationError as e:
+        print(e.field_name, e.message, checks)
+
+    # Another instance with equal values is checked from scratch
+    other_test = IncrementalTestModel(email='insistence', bio='insistence')
+    try:
+        incremental_validate(incremental_test=other_test)
+    except FieldValidationError as e:
+        print(e.field_name, e.message)
+
+    checker = get_incremental_checker(IncrementalTestModel, 'validate_fields')
+    print(len(checker._passed_values))
+    del incremental_test, other_test
+    gc.collect()
+    print(len(checker._passed_values))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+import logging
+from pydantic_validation_decorator import (
+    ValidateFields,
+    NotBlank,
+    Pattern,
+    Size,
+    FieldValidationError,
+    ValidationStats,
+    add_hook,
+    remove_hook,
+)
+from pydantic import BaseModel
+from typing import Optional
+
+
+class InstrumentedTestModel(BaseModel):
+    user_name: Optional[str] = None
+    age: Optional[int] = None
+
+    @NotBlank(field_name='user_name')
+    @Pattern(field_name='user_name', regexp='^[a-z]+$')
+    def get_user_name(self):
+        return self.user_name
+
+    @Size(field_name='age', gt=0)
+    def get_age(self):
+        return self.age
+
+    def validate_fields(self):
+        self.get_user_name()
+        self.get_age()
+
+
+@ValidateFields(validate_model='instrumented_test')
+def instrumented_validate_fields(instrumented_test: InstrumentedTestModel):
+    return instrumented_test.model_dump()
+
+
+@ValidateFields(validate_model='instrumented_test', validate_function=('get_user_name', 'get_age'), compiled=True)
+def instrumented_validate_fields_compiled(instrumented_test: InstrumentedTestModel):
+    return instrumented_test.model_dump()
+
+
+class CountingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+def main():
+    handler = CountingHandler()
+    logging.getLogger('pydantic_validation_decorator').addHandler(handler)
+    # A zero threshold logs every rule evaluation as slow
+    stats = ValidationStats(slow_threshold_ms=0)
+    add_hook(stats)
+    try:
+        for validate_fields in (instrumented_validate_fields, instrumented_validate_fields_compiled):
+            for instrumented_test in (
+                InstrumentedTestModel(user_name='insistence', age=18),
+                InstrumentedTestModel(user_name='Insistence', age=18),
+            ):
+                try:
+                    validate_fields(instrumented_test=instrumented_test)
+                except FieldValidationError as e:
+                    print(e.message)
+    finally:
+        remove_hook(stats)
+        logging.getLogger('pydantic_validation_decorator').removeHandler(handler)
+    print('slow rules logged:', handler.count)
+    for entry in stats.snapshot():
+        print(
+            entry['kind'],
+            entry['model_name'],
+            entry['field_name'],
+            entry['validator'],
+            entry['calls'],
+            entry['failures'],
+            sum(entry['histogram'].values()),
+        )
+
+
+if __name__ == '__main__':
+    main()
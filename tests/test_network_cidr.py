@@ -0,0 +1,95 @@
+from pydantic_validation_decorator import ValidateFields, Network, FieldValidationError
+from pydantic import BaseModel
+from typing import Optional
+
+
+class NetworkCidrTestModel(BaseModel):
+    address: Optional[str] = None
+    internal_address: Optional[str] = None
+
+    @Network(
+        field_name='address',
+        field_type='IPvAnyAddress',
+        denied_networks=['10.0.0.0/8', '127.0.0.0/8', '169.254.0.0/16', '::1/128', 'fc00::/7'],
+    )
+    def get_address(self):
+        return self.address
+
+    @Network(
+        field_name='internal_address',
+        field_type='IPvAnyAddress',
+        allowed_networks=['10.0.0.0/8', '192.168.0.0/16', 'fd00::/8'],
+        denied_networks=['10.0.66.0/24'],
+    )
+    def get_internal_address(self):
+        return self.internal_address
+
+    def validate_fields(self):
+        self.get_address()
+        self.get_internal_address()
+
+
+@ValidateFields(validate_model='network_cidr_test')
+def network_cidr_validate(network_cidr_test: NetworkCidrTestModel):
+    return 'passed'
+
+
+class MessageTestModel(BaseModel):
+    address: Optional[str] = None
+
+    @Network(
+        field_name='address', field_type='IPvAnyAddress', message='Address rejected.', denied_networks=['0.0.0.0/8']
+    )
+    def get_address(self):
+        return self.address
+
+    def validate_fields(self):
+        self.get_address()
+
+
+@ValidateFields(validate_model='message_test')
+def message_validate(message_test: MessageTestModel):
+    return 'passed'
+
+
+def main():
+    for values in (
+        {'address': '8.8.8.8'},
+        {'address': '10.1.2.3'},
+        {'address': '169.254.169.254'},
+        # An IPv4-mapped IPv6 address is checked against the IPv4 networks
+        {'address': '::ffff:169.254.169.254'},
+        {'address': '::1'},
+        {'address': 'fd12::1'},
+        {'address': '2001:db8::1'},
+        {'address': 'not an address'},
+        {'internal_address': '10.0.0.1'},
+        {'internal_address': '192.168.1.1'},
+        {'internal_address': 'fd00::abcd'},
+        {'internal_address': '8.8.8.8'},
+        # The denied networks win over the allowed networks
+        {'internal_address': '10.0.66.7'},
+    ):
+        try:
+            print(values, network_cidr_validate(network_cidr_test=NetworkCidrTestModel(**values)))
+        except FieldValidationError as e:
+            print(values, e.message)
+
+    for address in ('1.1.1.1', '0.0.0.1', 'bad'):
+        try:
+            print(address, message_validate(message_test=MessageTestModel(address=address)))
+        except FieldValidationError as e:
+            print(address, e.message)
+
+    try:
+        Network(field_name='email', field_type='EmailStr', allowed_networks=['10.0.0.0/8'])
+    except ValueError as e:
+        print(e)
+    try:
+        Network(field_name='address', field_type='IPvAnyAddress', denied_networks=['10.0.0.0/33'])
+    except ValueError as e:
+        print(type(e).__name__)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+import json
+import os
+import tempfile
+from pydantic_validation_decorator.profiler import load_model_class, profile_corpus
+
+
+def main():
+    model_class = load_model_class('tests.test_instrumentation:InstrumentedTestModel')
+    payloads = [
+        {'user_name': 'insistence', 'age': 18},
+        {'user_name': 'Insistence', 'age': 18},
+        {'user_name': 'insistence', 'age': 0},
+        {'user_name': 'insistence', 'age': 'eighteen'},
+    ]
+    with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as corpus:
+        corpus.write('\n'.join(json.dumps(payload) for payload in payloads) + '\n\n')
+    try:
+        report = profile_corpus(model_class, corpus.name, top=2)
+    finally:
+        os.remove(corpus.name)
+    print(report['payloads'], report['passed'], report['failed'], report['invalid'])
+    for entry in sorted(report['rules'], key=lambda entry: (entry['field_name'], entry['validator'])):
+        print(entry['field_name'], entry['validator'], entry['calls'], entry['failures'])
+    print(len(report['slowest_payloads']))
+
+
+if __name__ == '__main__':
+    main()
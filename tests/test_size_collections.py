@@ -0,0 +1,68 @@
+from pydantic_validation_decorator import ValidateFields, Size, FieldValidationError
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Dict, List, Optional
+
+
+class SizeCollectionsTestModel(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    tags: Optional[List[str]] = None
+    attributes: Optional[Dict[str, str]] = None
+    rows: Any = None
+
+    @Size(field_name='tags', max_length=3)
+    def get_tags(self):
+        return self.tags
+
+    @Size(field_name='attributes', min_length=1)
+    def get_attributes(self):
+        return self.attributes
+
+    @Size(field_name='rows', min_length=1, max_length=5)
+    def get_rows(self):
+        return self.rows
+
+    def validate_fields(self):
+        self.get_tags()
+        self.get_attributes()
+        self.get_rows()
+
+
+@ValidateFields(validate_model='size_collections_test')
+def size_collections_validate(size_collections_test: SizeCollectionsTestModel):
+    return list(size_collections_test.rows)
+
+
+def generate_rows(count: int, produced: List[int]):
+    for row in range(count):
+        produced.append(row)
+        yield row
+
+
+def main():
+    for data in (
+        {'tags': ['a', 'b', 'c', 'd'], 'attributes': {'a': 'b'}, 'rows': []},
+        {'tags': ['a'], 'attributes': {}, 'rows': []},
+    ):
+        try:
+            size_collections_validate(size_collections_test=SizeCollectionsTestModel(**data))
+        except FieldValidationError as e:
+            print(e.field_name, e.message)
+
+    # Generators are counted up to the bounds and the counted rows are not lost
+    for count in (0, 3, 1000):
+        produced = []
+        try:
+            print(
+                size_collections_validate(
+                    size_collections_test=SizeCollectionsTestModel(
+                        attributes={'a': 'b'}, rows=generate_rows(count, produced)
+                    )
+                )
+            )
+        except FieldValidationError as e:
+            print(e.field_name, e.message, 'produced', len(produced))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+from pydantic_validation_decorator.utils import StringUtils
+
+
+STRINGS = ['', ' ', '   ', ' a ', '\t', ' 　 ', None, 'test123']
+
+
+def test_is_blank():
+    assert [StringUtils.is_blank(string) for string in STRINGS] == [True, True, True, False, False, False, False, False]
+    assert [StringUtils.is_blank(string, unicode_whitespace=True) for string in STRINGS] == [
+        True,
+        True,
+        True,
+        False,
+        True,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_is_blank_many():
+    assert StringUtils.is_blank_many(STRINGS) == [StringUtils.is_blank(string) for string in STRINGS]
+    assert StringUtils.is_blank_many(STRINGS, unicode_whitespace=True) == [
+        StringUtils.is_blank(string, unicode_whitespace=True) for string in STRINGS
+    ]
+
+
+def test_is_empty_many():
+    assert StringUtils.is_empty_many(STRINGS) == [StringUtils.is_empty(string) for string in STRINGS]
+
+
+def test_numpy_string_arrays():
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    strings = [string for string in STRINGS if string is not None]
+    array = np.array(strings)
+    assert StringUtils.is_blank_many(array).tolist() == StringUtils.is_blank_many(strings)
+    assert StringUtils.is_blank_many(array, unicode_whitespace=True).tolist() == StringUtils.is_blank_many(
+        strings, unicode_whitespace=True
+    )
+    assert StringUtils.is_empty_many(array).tolist() == StringUtils.is_empty_many(strings)
+    assert StringUtils.is_blank_many(np.array(STRINGS, dtype=object)).tolist() == StringUtils.is_blank_many(STRINGS)
+
+
+def main():
+    test_is_blank()
+    test_is_blank_many()
+    test_is_empty_many()
+    test_numpy_string_arrays()
+    print(dict(zip(map(repr, STRINGS), StringUtils.is_blank_many(STRINGS))))
+
+
+if __name__ == '__main__':
+    main()
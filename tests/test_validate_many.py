@@ -0,0 +1,59 @@
+from pydantic_validation_decorator import (
+    NotBlank,
+    Pattern,
+    Size,
+    validate_many,
+    validate_many_parallel,
+)
+from pydantic import BaseModel
+from typing import Optional
+
+
+class ValidateManyTestModel(BaseModel):
+    sku: Optional[str] = None
+    quantity: Optional[int] = None
+    price: Optional[float] = None
+
+    @NotBlank(field_name='sku', message='sku cannot be blank')
+    @Pattern(field_name='sku', regexp='[A-Z]{3}-[0-9]{4}', match_mode='fullmatch')
+    def get_sku(self):
+        return self.sku
+
+    @Size(field_name='quantity', gt=0, le=1000)
+    def get_quantity(self):
+        return self.quantity
+
+    @Size(field_name='price', ge=0)
+    def get_price(self):
+        return self.price
+
+    def validate_fields(self):
+        self.get_sku()
+        self.get_quantity()
+        self.get_price()
+
+
+def main():
+    rows = [
+        {'sku': 'ABC-0001', 'quantity': 1, 'price': 9.9},
+        {'sku': '', 'quantity': 1, 'price': 9.9},
+        {'sku': 'abc-0001', 'quantity': 0, 'price': -1.0},
+        {'sku': 'ABC-0002', 'quantity': 1001, 'price': 0.0},
+    ]
+    models = [ValidateManyTestModel(**row) for row in rows]
+    for errors in validate_many(models):
+        print([e.__dict__ for e in errors])
+    for errors in validate_many(models, all_errors=True):
+        print([e.validator for e in errors])
+    for errors in validate_many(models, rules=[Size(field_name='price', gt=5)]):
+        print([e.message for e in errors])
+    # A bound that a float cannot represent exactly is compared in Python, like the decorator does
+    large_models = [ValidateManyTestModel(sku='ABC-0003', quantity=1, price=price) for price in (float(2**53), 1.0)]
+    for errors in validate_many(large_models, rules=[Size(field_name='price', ge=2**53 + 1)]):
+        print([e.message for e in errors])
+    for errors in validate_many_parallel(rows, model_class=ValidateManyTestModel, chunk_size=2, max_workers=2):
+        print([e.__dict__ for e in errors])
+
+
+if __name__ == '__main__':
+    main()
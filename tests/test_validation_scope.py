@@ -0,0 +1,125 @@
+import asyncio
+from enum import Enum
+from ipaddress import IPv4Address
+from pydantic_validation_decorator import ValidateFields, NotBlank, FieldValidationError, validation_scope
+from pydantic import AnyUrl, BaseModel
+from typing import List, Optional
+
+
+checks = {'count': 0}
+
+
+class CountingNotBlank(NotBlank):
+    def _check(self, field_value):
+        checks['count'] += 1
+        return super()._check(field_value)
+
+
+class ValidationScopeTestModel(BaseModel):
+    user_name: Optional[str] = None
+    tags: List[str] = []
+
+    @CountingNotBlank(field_name='user_name')
+    def get_user_name(self):
+        return self.user_name
+
+    def validate_fields(self):
+        self.get_user_name()
+
+
+class Role(str, Enum):
+    ADMIN = 'admin'
+    USER = 'user'
+
+
+class ValueFieldsTestModel(BaseModel):
+    user_name: Optional[str] = None
+    # Enum members, URLs and IP addresses cannot change, so they are compared by value
+    role: Role = Role.USER
+    home_page: Optional[AnyUrl] = None
+    address: Optional[IPv4Address] = None
+
+    @CountingNotBlank(field_name='user_name')
+    def get_user_name(self):
+        return self.user_name
+
+    def validate_fields(self):
+        self.get_user_name()
+
+
+@ValidateFields(validate_model='value_fields_test')
+def value_fields_validate(value_fields_test: ValueFieldsTestModel):
+    return checks['count']
+
+
+@ValidateFields(validate_model='scope_test')
+def dao(scope_test: ValidationScopeTestModel):
+    return checks['count']
+
+
+@ValidateFields(validate_model='scope_test')
+def service(scope_test: ValidationScopeTestModel):
+    return dao(scope_test=scope_test)
+
+
+@ValidateFields(validate_model='scope_test')
+def controller(scope_test: ValidationScopeTestModel):
+    return service(scope_test=scope_test)
+
+
+@ValidateFields(validate_model='scope_test')
+async def async_dao(scope_test: ValidationScopeTestModel):
+    return checks['count']
+
+
+@ValidateFields(validate_model='scope_test')
+async def async_controller(scope_test: ValidationScopeTestModel):
+    return await asyncio.gather(
+        asyncio.ensure_future(async_dao(scope_test=scope_test)),
+        asyncio.ensure_future(async_dao(scope_test=scope_test)),
+    )
+
+
+def main():
+    scope_test = ValidationScopeTestModel(user_name='insistence')
+    # Without a scope every layer validates the model
+    print(controller(scope_test=scope_test))
+    with validation_scope():
+        checks['count'] = 0
+        print(controller(scope_test=scope_test))
+        print(controller(scope_test=scope_test))
+        # A changed instance is validated again, also when a list changes in place
+        scope_test.user_name = ''
+        try:
+            controller(scope_test=scope_test)
+        except FieldValidationError as e:
+            print(e.field_name, e.message, checks['count'])
+        scope_test.user_name = 'insistence'
+        print(controller(scope_test=scope_test))
+        scope_test.tags.append('insistence')
+        print(controller(scope_test=scope_test))
+        # Another instance with the same values is validated on its own
+        print(controller(scope_test=ValidationScopeTestModel(user_name='insistence')))
+    print(controller(scope_test=scope_test))
+
+    value_fields_test = ValueFieldsTestModel(
+        user_name='insistence', role=Role.ADMIN, home_page='https://example.com', address='10.0.0.1'
+    )
+    with validation_scope():
+        checks['count'] = 0
+        print(value_fields_validate(value_fields_test=value_fields_test))
+        print(value_fields_validate(value_fields_test=value_fields_test))
+        value_fields_test.role = Role.USER
+        print(value_fields_validate(value_fields_test=value_fields_test))
+
+
+async def async_main():
+    scope_test = ValidationScopeTestModel(user_name='insistence')
+    checks['count'] = 0
+    with validation_scope():
+        print(await async_controller(scope_test=scope_test))
+
+
+if __name__ == '__main__':
+    main()
+    asyncio.run(async_main())
@@ -0,0 +1,59 @@
+from pydantic_validation_decorator import (
+    ValidateFields,
+    Network,
+    Pattern,
+    FieldValidationError,
+    VerdictCache,
+    verdict_cache,
+)
+from pydantic import BaseModel
+from typing import Optional
+
+
+class VerdictCacheTestModel(BaseModel):
+    callback_url: Optional[str] = None
+    dict_type: Optional[str] = None
+
+    @Network(field_name='callback_url', field_type='HttpUrl', cache=True)
+    def get_callback_url(self):
+        return self.callback_url
+
+    @Pattern(field_name='dict_type', regexp='^[a-z][a-z0-9_]*$')
+    def get_dict_type(self):
+        return self.dict_type
+
+    def validate_fields(self):
+        self.get_callback_url()
+        self.get_dict_type()
+
+
+@ValidateFields(validate_model='verdict_cache_test')
+def verdict_cache_validate_fields(verdict_cache_test: VerdictCacheTestModel):
+    return verdict_cache_test.model_dump()
+
+
+def main():
+    for callback_url in ['https://example.com/callback', 'https://example.com/callback', 'example']:
+        try:
+            print(verdict_cache_validate_fields(verdict_cache_test=VerdictCacheTestModel(callback_url=callback_url)))
+        except FieldValidationError as e:
+            print(e.__dict__)
+    print(verdict_cache.stats())
+    verdict_cache.configure(enabled=True)
+    for dict_type in ['sys_user_sex', 'sys_user_sex', 'Sys_user_sex']:
+        try:
+            print(verdict_cache_validate_fields(verdict_cache_test=VerdictCacheTestModel(dict_type=dict_type)))
+        except FieldValidationError as e:
+            print(e.__dict__)
+    print(verdict_cache.stats())
+    verdict_cache.configure(enabled=False)
+    verdict_cache.clear()
+
+    small_cache = VerdictCache(max_size=2, max_key_length=8)
+    for value in ['a', 'b', 'a', 'c', 'b', 'a' * 9]:
+        small_cache.verdict(('Test',), value, lambda v: len(v) < 5)
+    print(small_cache.stats())
+
+
+if __name__ == '__main__':
+    main()
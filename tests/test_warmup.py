@@ -0,0 +1,45 @@
+import sys
+import pydantic_validation_decorator
+from pydantic_validation_decorator import ValidateFields, NotBlank, XssSweep, warmup
+from pydantic_validation_decorator.xss import XssSweep as XssSweepClass, _MODEL_SWEEP_PLANS
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class WarmupItemModel(BaseModel):
+    title: Optional[str] = None
+
+
+class WarmupTestModel(BaseModel):
+    user_name: Optional[str] = None
+    items: List[WarmupItemModel] = []
+
+    @NotBlank(field_name='user_name')
+    @XssSweep()
+    def get_user(self):
+        return self.user_name
+
+    def validate_fields(self):
+        self.get_user()
+
+
+validate_warmup = ValidateFields(validate_model='warmup_test', validate_function='get_user', compiled=True)
+
+
+@validate_warmup
+def warmup_validate(warmup_test):
+    return 'passed'
+
+
+def main():
+    print('network' in pydantic_validation_decorator.__dict__)
+    detector = XssSweepClass._DETECTORS['scanner']
+    print(WarmupTestModel in validate_warmup._plans, (detector, WarmupItemModel) in _MODEL_SWEEP_PLANS)
+    warmup([WarmupTestModel], batch=True)
+    print(WarmupTestModel in validate_warmup._plans, (detector, WarmupItemModel) in _MODEL_SWEEP_PLANS)
+    print('numpy' in sys.modules)
+    print(warmup_validate(warmup_test=WarmupTestModel(user_name='insistence', items=[{'title': 'a'}])))
+
+
+if __name__ == '__main__':
+    main()
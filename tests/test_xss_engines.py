@@ -0,0 +1,63 @@
+import random
+from pydantic_validation_decorator.xss import Xss, contains_html_tag
+
+
+XSS_CORPUS = [
+    '',
+    ' ',
+    'test123',
+    'test123<>',
+    '<',
+    '>',
+    '><',
+    '<<',
+    '>>',
+    'a < b',
+    'a > b',
+    'a < b > c',
+    '1 << 2',
+    '<script>alert(1)</script>',
+    '<img src=x onerror=alert(1)>',
+    '<a href="javascript:alert(1)">',
+    '<br/>',
+    '<br />',
+    '< />',
+    '<\n>',
+    '<\n />',
+    'line one <\nline two >',
+    '<\t\r\n>',
+    '<div',
+    'div>',
+    '<<<<<<<<<<',
+    '<　>',
+    '　<　/　>',
+]
+
+
+def test_xss_engines_agree_on_corpus():
+    for value in XSS_CORPUS:
+        assert contains_html_tag(value) == bool(Xss._COMPILED_HTML_PATTERN.search(value)), value
+
+
+def test_xss_engines_agree_on_random_strings():
+    generator = random.Random(20240501)
+    alphabet = '<>/ =\'"\n\t\r　ax'
+    for _ in range(20000):
+        value = ''.join(generator.choice(alphabet) for _ in range(generator.randint(0, 12)))
+        assert contains_html_tag(value) == bool(Xss._COMPILED_HTML_PATTERN.search(value)), value
+
+
+def test_xss_scanner_on_long_untagged_input():
+    assert not contains_html_tag('<' * 100000)
+    assert contains_html_tag('<' * 100000 + '>')
+
+
+def main():
+    test_xss_engines_agree_on_corpus()
+    test_xss_engines_agree_on_random_strings()
+    test_xss_scanner_on_long_untagged_input()
+    print({'corpus': len(XSS_CORPUS), 'engines': 'agree'})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+import io
+from pydantic_validation_decorator import ValidateFields, Xss, FieldValidationError
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Optional
+
+
+class XssStreamingTestModel(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    content: Optional[Any] = None
+
+    @Xss(field_name='content', streaming=True, chunk_size=4)
+    def get_content(self):
+        return self.content
+
+    def validate_fields(self):
+        self.get_content()
+
+
+@ValidateFields(validate_model='xss_streaming_test')
+def xss_streaming_validate(xss_streaming_test: XssStreamingTestModel):
+    return 'passed'
+
+
+class CountingStream(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+class NonSeekableStream(io.BytesIO):
+    def seekable(self):
+        return False
+
+
+def main():
+    for content in (
+        'plain text',
+        'a <b> tag',
+        b'plain bytes',
+        b'ab<c' + b'd>',
+        bytearray(b'<b>'),
+        io.StringIO('no tags here at all'),
+        # The tag is split across the boundary of two chunks
+        io.StringIO('abc<' + 'def>'),
+        io.BytesIO('text < 1 then >'.encode('utf-8')),
+        io.BytesIO('é only < sign'.encode('utf-8')),
+    ):
+        try:
+            print(
+                type(content).__name__,
+                xss_streaming_validate(xss_streaming_test=XssStreamingTestModel(content=content)),
+            )
+        except FieldValidationError as e:
+            print(type(content).__name__, e.message)
+
+    # The scan stops at the first tag and rewinds the stream
+    stream = CountingStream(b'<b>' + b'x' * 100000)
+    try:
+        xss_streaming_validate(xss_streaming_test=XssStreamingTestModel(content=stream))
+    except FieldValidationError as e:
+        print(e.message, 'reads', stream.reads, 'position', stream.tell())
+
+    # A stream that cannot be rewound is rejected instead of being drained
+    stream = NonSeekableStream(b'plain body')
+    try:
+        xss_streaming_validate(xss_streaming_test=XssStreamingTestModel(content=stream))
+    except ValueError as e:
+        print(e, stream.read())
+
+    try:
+        Xss(field_name='content', streaming=True, engine='regex')
+    except ValueError as e:
+        print(e)
+
+
+if __name__ == '__main__':
+    main()
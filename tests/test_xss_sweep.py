@@ -0,0 +1,91 @@
+import pickle
+from pydantic_validation_decorator import (
+    ValidateFields,
+    Xss,
+    XssSweep,
+    FieldValidationError,
+    validate_many,
+)
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+
+class XssSweepItemModel(BaseModel):
+    title: Optional[str] = None
+    quantity: int = 0
+    labels: List[str] = []
+
+
+class XssSweepTestModel(BaseModel):
+    name: Optional[str] = None
+    age: Optional[int] = None
+    scores: List[int] = []
+    items: List[XssSweepItemModel] = []
+    attributes: Dict[str, str] = {}
+    extra: Any = None
+    parent: Optional['XssSweepTestModel'] = None
+
+    @XssSweep()
+    def sweep(self):
+        return self
+
+    @XssSweep(field_name='items', message='items cannot contain script characters')
+    def get_items(self):
+        return self.items
+
+    def validate_fields(self):
+        self.sweep()
+
+
+@ValidateFields(validate_model='xss_sweep_test')
+def xss_sweep_validate(xss_sweep_test: XssSweepTestModel):
+    return 'passed'
+
+
+@ValidateFields(validate_model='xss_sweep_test', validate_function='sweep', compiled=True)
+def compiled_xss_sweep_validate(xss_sweep_test: XssSweepTestModel):
+    return 'passed'
+
+
+def main():
+    print(
+        [
+            validator.field_name
+            for validator in XssSweepTestModel.sweep.__field_validators__[0]._expand(XssSweepTestModel)
+        ]
+    )
+    for data in (
+        {'name': 'insistence', 'items': [{'title': 'a'}], 'attributes': {'a': 'b'}},
+        {'name': '<b>insistence</b>'},
+        {'items': [{'title': 'a'}, {'title': 'b'}, {'title': '<script>'}]},
+        {'items': [{'title': 'a', 'labels': ['x', 'y<>']}]},
+        {'attributes': {'a': 'b', 'c': '<i>'}},
+        {'attributes': {'<i>': 'b'}},
+        {'extra': {'nested': [1, 'ok', {'deep': '<a href>'}]}},
+        {'parent': {'parent': {'name': '<p>'}}},
+    ):
+        for function in (xss_sweep_validate, compiled_xss_sweep_validate):
+            try:
+                print(function(xss_sweep_test=XssSweepTestModel(**data)))
+            except FieldValidationError as e:
+                print(e.field_name, repr(e.field_value), e.message)
+
+    try:
+        XssSweepTestModel(items=[{'title': '<b>'}]).get_items()
+    except FieldValidationError as e:
+        print(e.field_name, repr(e.field_value), e.message)
+
+    errors = validate_many(
+        [XssSweepTestModel(name='a'), XssSweepTestModel(items=[{'title': '<b>'}])], rules=[XssSweep(), Xss('name')]
+    )
+    print([[error.field_name for error in model_errors] for model_errors in errors])
+
+    sweep = pickle.loads(pickle.dumps(XssSweep()))
+    try:
+        sweep.check([{'title': 'a'}, {'title': '<b>'}])
+    except FieldValidationError as e:
+        print(e.field_name, repr(e.field_value), e.message)
+
+
+if __name__ == '__main__':
+    main()